@@ -3,11 +3,14 @@ name = "labelbox"
 __version__ = "6.0.0"
 
 from labelbox.client import Client
+from labelbox.async_client import AsyncClient
+from lbox.request_client import TransportSettings
 from labelbox.schema.annotation_import import (
     LabelImport,
     MALPredictionImport,
     MEAPredictionImport,
     MEAToMALPredictionImport,
+    ShardedAnnotationImport,
 )
 from labelbox.schema.asset_attachment import AssetAttachment
 from labelbox.schema.batch import Batch
@@ -24,6 +27,7 @@ from labelbox.schema.dataset import Dataset
 from labelbox.schema.enums import AnnotationImportState
 from labelbox.schema.export_task import (
     BufferedJsonConverterOutput,
+    ExportCheckpoint,
     ExportTask,
     BufferedJsonConverterOutput,
     StreamType,
@@ -94,3 +98,5 @@ from labelbox.schema.task import Task
 from labelbox.schema.task_queue import TaskQueue
 from labelbox.schema.user import User
 from labelbox.schema.webhook import Webhook
+from labelbox.upload_cache import UploadCache
+from labelbox.global_key_cache import GlobalKeyCache
@@ -6,15 +6,22 @@ from urllib.parse import urlparse
 
 import requests
 from lbox.exceptions import LabelboxError
+from lbox.request_client import TransportSettings
 from requests import Response, Session
 
 logger = logging.getLogger(__name__)
 
 
 class AdvClient:
-    def __init__(self, endpoint: str, api_key: str):
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        transport_settings: Optional[TransportSettings] = None,
+    ):
         self.endpoint = endpoint
         self.api_key = api_key
+        self.transport_settings = transport_settings or TransportSettings()
         self.session = self._create_session()
 
     def create_embedding(self, name: str, dims: int) -> Dict[str, Any]:
@@ -40,7 +47,7 @@ class AdvClient:
         return data.get("count", 0)
 
     def _create_session(self) -> Session:
-        session = requests.session()
+        session = self.transport_settings.create_session()
         session.headers.update(
             {
                 "Authorization": f"Bearer {self.api_key}",
@@ -121,7 +128,12 @@ class AdvClient:
         return self.session.put(url, headers=headers, data=buffer)
 
     @classmethod
-    def factory(cls, api_endpoint: str, api_key: str) -> "AdvClient":
+    def factory(
+        cls,
+        api_endpoint: str,
+        api_key: str,
+        transport_settings: Optional[TransportSettings] = None,
+    ) -> "AdvClient":
         parsed_url = urlparse(api_endpoint)
         endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}/adv"
-        return AdvClient(endpoint, api_key)
+        return AdvClient(endpoint, api_key, transport_settings)
@@ -0,0 +1,321 @@
+# type: ignore
+import asyncio
+import logging
+import mimetypes
+import os
+import time
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Optional
+
+import requests
+from google.api_core import retry_async
+from lbox.async_request_client import AsyncRequestClient
+from lbox.exceptions import InternalServerError
+from lbox.request_client import TransportSettings
+
+from labelbox import polling
+from labelbox.client import Client
+from labelbox.multipart import MultipartFileStream, ProgressCallback
+from labelbox.pagination import AsyncPaginatedCollection, PaginatedCollection
+from labelbox.schema.task import INITIAL_CHECK_INTERVAL, Task
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient:
+    """An asyncio Labelbox client.
+
+    Executes queries, uploads data, iterates over paginated collections and
+    waits for tasks without blocking the event loop, so that a single thread
+    can drive many concurrent requests. All requests share one pool of
+    connections whose size is `TransportSettings.pool_maxsize`.
+
+    Objects returned by the client are bound to the synchronous `Client`
+    available as `AsyncClient.client`, which is also used to build the
+    collections to iterate over.
+
+    Requires `httpx`, install it with `pip install "labelbox[async]"`.
+
+    >>> async with AsyncClient("<APIKEY>") as client:
+    >>>     async for project in client.paginate(client.client.get_projects()):
+    >>>         print(project.name)
+    """
+
+    def __init__(
+        self,
+        api_key=None,
+        endpoint="https://api.labelbox.com/graphql",
+        enable_experimental=False,
+        app_url="https://app.labelbox.com",
+        rest_endpoint="https://api.labelbox.com/api/v1",
+        enable_sdk_method_header=True,
+        transport_settings: Optional[TransportSettings] = None,
+        client: Optional[Client] = None,
+    ):
+        """Creates and initializes a Labelbox AsyncClient.
+
+        Args:
+            api_key (str): API key. If None, the key is obtained from the "LABELBOX_API_KEY" environment variable.
+            endpoint (str): URL of the Labelbox server to connect to.
+            enable_experimental (bool): Indicates whether or not to use experimental features
+            app_url (str) : host url for all links to the web app
+            enable_sdk_method_header (bool): Indicates whether or not to attribute each request to the
+                calling SDK method.
+            transport_settings (TransportSettings): Connection pool size and retries of the client.
+                Raise `pool_maxsize` to allow more requests in flight at once.
+            client (Client): An existing client to share credentials and settings with. The other
+                arguments are ignored when it is given.
+        Raises:
+            AuthenticationError: If no `api_key`
+                is provided as an argument or via the environment
+                variable.
+            ImportError: If `httpx` is not installed.
+        """
+        if client is None:
+            client = Client(
+                api_key=api_key,
+                endpoint=endpoint,
+                enable_experimental=enable_experimental,
+                app_url=app_url,
+                rest_endpoint=rest_endpoint,
+                enable_sdk_method_header=enable_sdk_method_header,
+                transport_settings=transport_settings,
+            )
+        self.client = client
+        self._request_client = AsyncRequestClient(client._request_client)
+
+    async def aclose(self) -> None:
+        """Closes all the connections of the client."""
+        await self._request_client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def execute(
+        self,
+        query=None,
+        params=None,
+        data=None,
+        files=None,
+        timeout=60.0,
+        experimental=False,
+        error_log_key="message",
+        raise_return_resource_not_found=False,
+        error_handlers: Optional[
+            Dict[str, Callable[[requests.models.Response], None]]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """Executes a GraphQL query. See `Client.execute`.
+
+        Returns:
+            dict: The response from the server.
+        """
+        return await self._request_client.execute(
+            query,
+            params,
+            data=data,
+            files=files,
+            timeout=timeout,
+            experimental=experimental,
+            error_log_key=error_log_key,
+            raise_return_resource_not_found=raise_return_resource_not_found,
+            error_handlers=error_handlers,
+        )
+
+    async def upload_file(
+        self,
+        path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> str:
+        """Uploads given path to local file. See `Client.upload_file`.
+
+        The file is streamed from disk and, if the client has an
+        `upload_cache`, files already uploaded are not uploaded again.
+
+        Args:
+            path (str): path to local file to be uploaded.
+            progress_callback (callable): Called with the number of bytes
+                uploaded so far and the size of the file as the upload
+                progresses.
+        Returns:
+            str, the URL of uploaded data.
+        Raises:
+            LabelboxError: If upload failed.
+        """
+        upload_cache = self.client.upload_cache
+        if upload_cache is None:
+            return await self._upload_file(path, progress_callback)
+
+        # the cache hashes the file, which is done off the event loop
+        loop = asyncio.get_running_loop()
+
+        def upload() -> str:
+            return asyncio.run_coroutine_threadsafe(
+                self._upload_file(path, progress_callback), loop
+            ).result()
+
+        return await asyncio.to_thread(
+            upload_cache.get_or_upload,
+            self.client._cache_namespace(),
+            path,
+            upload,
+        )
+
+    async def _upload_file(
+        self, path: str, progress_callback: Optional[ProgressCallback]
+    ) -> str:
+        content_type, _ = mimetypes.guess_type(path)
+        filename = os.path.basename(path)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            return await self._upload_stream(
+                f, size, filename, content_type, progress_callback
+            )
+
+    @retry_async.AsyncRetry(
+        predicate=retry_async.if_exception_type(InternalServerError)
+    )
+    async def _upload_stream(
+        self,
+        stream: BinaryIO,
+        size: int,
+        filename: Optional[str],
+        content_type: Optional[str],
+        progress_callback: Optional[ProgressCallback],
+    ) -> str:
+        if not (filename and content_type):
+            # matches the encoding of upload_data
+            filename, content_type = None, None
+        body = MultipartFileStream(
+            fields=Client._upload_data_fields(size, False),
+            file_field="1",
+            file=stream,
+            size=size,
+            filename=filename,
+            content_type=content_type,
+            progress_callback=progress_callback,
+        )
+        headers = dict(self.client.headers)
+        headers["Content-Type"] = body.content_type
+        headers["Content-Length"] = str(len(body))
+        response = await self._request_client.send(
+            "POST",
+            self.client.endpoint,
+            headers=headers,
+            content=_iter_in_thread(body),
+            timeout=None,
+        )
+        return Client._parse_upload_response(response)
+
+    @retry_async.AsyncRetry(
+        predicate=retry_async.if_exception_type(InternalServerError)
+    )
+    async def upload_data(
+        self,
+        content: bytes,
+        filename: str = None,
+        content_type: str = None,
+        sign: bool = False,
+    ) -> str:
+        """Uploads the given data (bytes) to Labelbox. See `Client.upload_data`.
+
+        Args:
+            content: bytestring to upload
+            filename: name of the upload
+            content_type: content type of data uploaded
+            sign: whether or not to sign the url
+
+        Returns:
+            str, the URL of uploaded data.
+
+        Raises:
+            LabelboxError: If upload failed.
+        """
+        request_data, files = Client._upload_data_request(
+            content, filename, content_type, sign
+        )
+        headers = dict(self.client.headers)
+        headers.pop("Content-Type", None)
+        response = await self._request_client.send(
+            "POST",
+            self.client.endpoint,
+            headers=headers,
+            data=request_data,
+            files=files,
+            timeout=None,
+        )
+        return Client._parse_upload_response(response)
+
+    def paginate(
+        self, collection: PaginatedCollection
+    ) -> AsyncPaginatedCollection:
+        """Returns an async iterator over a collection returned by `client`.
+
+        >>> projects = async_client.paginate(async_client.client.get_projects())
+        >>> async for project in projects:
+        >>>     print(project.name)
+
+        Args:
+            collection (PaginatedCollection): The collection to iterate over.
+        """
+        return AsyncPaginatedCollection(self, collection)
+
+    async def refresh_task(self, task: Task) -> None:
+        """Refreshes Task data from the server. See `Task.refresh`."""
+        assert task._user is not None
+        tasks = await self.paginate(
+            task._user.created_tasks(where=Task.uid == task.uid)
+        ).get_many(2)
+        task._update_from_tasks(tasks)
+
+    async def wait_till_done(
+        self,
+        task: Task,
+        timeout_seconds: float = 300.0,
+        check_frequency: float = 2.0,
+    ) -> None:
+        """Waits until the task is completed. Periodically queries the server
+        to update the task attributes, with the backoff described in
+        `Task.wait_till_done`.
+
+        Args:
+            task (Task): The task to wait for.
+            timeout_seconds (float): Maximum time to wait, in seconds. Defaults to five minutes.
+            check_frequency (float): Maximum interval between queries to the server, in seconds. Defaults to two seconds and must be at least two seconds.
+        """
+        if check_frequency < 2.0:
+            raise ValueError(
+                "Expected check frequency to be two seconds or more"
+            )
+        deadline = time.monotonic() + timeout_seconds
+        intervals = polling.backoff_intervals(
+            initial_interval=INITIAL_CHECK_INTERVAL,
+            max_interval=check_frequency,
+        )
+        while time.monotonic() < deadline:
+            if task.status != "IN_PROGRESS":
+                # checking for errors may download the error file
+                if await asyncio.to_thread(task.has_errors):
+                    logger.warning(
+                        "There are errors present. Please look at `task.errors` for more details"
+                    )
+                return
+            interval = min(next(intervals), deadline - time.monotonic())
+            logger.debug(
+                "AsyncClient.wait_till_done sleeping for %.1f seconds",
+                interval,
+            )
+            await asyncio.sleep(interval)
+            await self.refresh_task(task)
+
+
+async def _iter_in_thread(body: MultipartFileStream) -> AsyncIterator[bytes]:
+    """Iterates over `body` with its file reads done off the event loop."""
+    chunks = iter(body)
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
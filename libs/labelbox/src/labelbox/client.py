@@ -1,16 +1,31 @@
 # type: ignore
+import hashlib
 import json
 import logging
 import mimetypes
 import os
 import random
+import shutil
+import tempfile
 import time
 import urllib.parse
 import warnings
 from collections import defaultdict
 from datetime import datetime, timezone
 from types import MappingProxyType
-from typing import Any, Callable, Dict, List, Optional, Set, Union, overload
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+    overload,
+)
 
 import requests
 import requests.exceptions
@@ -21,14 +36,17 @@ from lbox.exceptions import (
     ResourceNotFoundError,
     TimeoutError,
 )
-from lbox.request_client import RequestClient
+from lbox.request_client import RequestClient, TransportSettings
 
 from labelbox import __version__ as SDK_VERSION
-from labelbox import utils
+from labelbox import polling, utils
 from labelbox.adv_client import AdvClient
+from labelbox.multipart import MultipartFileStream, ProgressCallback
+from labelbox.upload_cache import UploadCache
 from labelbox.orm import query
 from labelbox.orm.db_object import DbObject
 from labelbox.orm.model import Entity, Field
+from labelbox.global_key_cache import GlobalKeyCache
 from labelbox.pagination import PaginatedCollection
 from labelbox.project_validation import _CoreProjectInput
 from labelbox.schema import role
@@ -87,6 +105,11 @@ from labelbox.schema.user import User
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of inputs sent to a single global keys job.
+GLOBAL_KEYS_CHUNK_SIZE = 10_000
+# Maximum number of global keys jobs running at once.
+GLOBAL_KEYS_JOB_CONCURRENCY = 4
+
 
 class Client:
     """A Labelbox client.
@@ -102,6 +125,10 @@ class Client:
         enable_experimental=False,
         app_url="https://app.labelbox.com",
         rest_endpoint="https://api.labelbox.com/api/v1",
+        enable_sdk_method_header=True,
+        transport_settings: Optional[TransportSettings] = None,
+        upload_cache: Optional[UploadCache] = None,
+        global_key_cache: Optional[GlobalKeyCache] = None,
     ):
         """Creates and initializes a Labelbox Client.
 
@@ -116,12 +143,22 @@ class Client:
             endpoint (str): URL of the Labelbox server to connect to.
             enable_experimental (bool): Indicates whether or not to use experimental features
             app_url (str) : host url for all links to the web app
+            enable_sdk_method_header (bool): Indicates whether or not to attribute each request to the
+                calling SDK method. Disable it to avoid the per-request call stack inspection.
+            transport_settings (TransportSettings): Connection pool size, per-host connection limit, retries
+                and keep-alive of every HTTP session used by the client.
+            upload_cache (UploadCache): If given, local files whose content was already uploaded are not
+                uploaded again by `upload_file` and the methods creating data rows from local files.
+            global_key_cache (GlobalKeyCache): If given, the data row ids of global keys are cached and
+                not resolved by the server again by `get_data_row_ids_for_global_keys`.
         Raises:
             AuthenticationError: If no `api_key`
                 is provided as an argument or via the environment
                 variable.
         """
         self._data_row_metadata_ontology = None
+        self.upload_cache = upload_cache
+        self.global_key_cache = global_key_cache
         self._request_client = RequestClient(
             sdk_version=SDK_VERSION,
             api_key=api_key,
@@ -129,8 +166,14 @@ class Client:
             enable_experimental=enable_experimental,
             app_url=app_url,
             rest_endpoint=rest_endpoint,
+            enable_sdk_method_header=enable_sdk_method_header,
+            transport_settings=transport_settings,
+        )
+        self._adv_client = AdvClient.factory(
+            rest_endpoint,
+            api_key,
+            self._request_client.transport_settings,
         )
-        self._adv_client = AdvClient.factory(rest_endpoint, api_key)
 
     @property
     def headers(self) -> MappingProxyType:
@@ -140,6 +183,11 @@ class Client:
     def connection(self) -> requests.Session:
         return self._request_client._connection
 
+    @property
+    def download_connection(self) -> requests.Session:
+        """A pooled session, without credentials, for downloading result files."""
+        return self._request_client.download_connection
+
     @property
     def endpoint(self) -> str:
         return self._request_client.endpoint
@@ -169,6 +217,7 @@ class Client:
         error_handlers: Optional[
             Dict[str, Callable[[requests.models.Response], None]]
         ] = None,
+        content_type: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Executes a GraphQL query.
 
@@ -179,6 +228,8 @@ class Client:
                 ResourceNotFoundError if the query returns None.
             error_handlers (dict): A dictionary mapping graphql error code to handler functions.
                 Allows a caller to handle specific errors reporting in a custom way or produce more user-friendly readable messages
+            content_type (str): Content type of `data`, when it is not a JSON
+                query.
 
         Returns:
             dict: The response from the server.
@@ -193,27 +244,144 @@ class Client:
             error_log_key=error_log_key,
             raise_return_resource_not_found=raise_return_resource_not_found,
             error_handlers=error_handlers,
+            content_type=content_type,
         )
 
-    def upload_file(self, path: str) -> str:
+    def upload_file(
+        self,
+        path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> str:
         """Uploads given path to local file.
 
-        Also includes best guess at the content type of the file.
+        Also includes best guess at the content type of the file. The file is
+        streamed from disk, see `upload_stream`. If the client has an
+        `upload_cache`, files already uploaded are not uploaded again.
 
         Args:
             path (str): path to local file to be uploaded.
+            progress_callback (callable): Called with the number of bytes
+                uploaded so far and the size of the file as the upload
+                progresses.
         Returns:
             str, the URL of uploaded data.
         Raises:
             LabelboxError: If upload failed.
         """
+        if self.upload_cache is not None:
+            return self.upload_cache.get_or_upload(
+                self._cache_namespace(),
+                path,
+                lambda: self._upload_file(path, progress_callback),
+            )
+        return self._upload_file(path, progress_callback)
+
+    def _cache_namespace(self) -> str:
+        # cached uploads and global keys are only reused by the same account
+        # on the same server
+        key = f"{self.endpoint} {self._request_client.api_key}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _upload_file(
+        self, path: str, progress_callback: Optional[ProgressCallback]
+    ) -> str:
         content_type, _ = mimetypes.guess_type(path)
         filename = os.path.basename(path)
         with open(path, "rb") as f:
-            return self.upload_data(
-                content=f.read(), filename=filename, content_type=content_type
+            return self.upload_stream(
+                f,
+                filename=filename,
+                content_type=content_type,
+                progress_callback=progress_callback,
             )
 
+    def upload_stream(
+        self,
+        stream: BinaryIO,
+        filename: str = None,
+        content_type: str = None,
+        sign: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> str:
+        """Uploads the content of a binary file object to Labelbox.
+
+        The content is read in blocks while it is being sent, so the memory
+        used does not depend on its size. Objects that cannot seek (e.g.
+        sockets or pipes) are first copied to a temporary file, in order to
+        know their size.
+
+        >>> with open("video.mp4", "rb") as f:
+        >>>     url = client.upload_stream(
+        >>>         f, "video.mp4", "video/mp4",
+        >>>         progress_callback=lambda sent, total: print(sent / total))
+
+        Args:
+            stream: binary file object, uploaded from its current position
+            filename: name of the upload
+            content_type: content type of data uploaded
+            sign: whether or not to sign the url
+            progress_callback: called with the number of bytes uploaded so
+                far and the total number of bytes as the upload progresses
+
+        Returns:
+            str, the URL of uploaded data.
+
+        Raises:
+            LabelboxError: If upload failed.
+        """
+        if not _is_seekable(stream):
+            with tempfile.TemporaryFile() as f:
+                shutil.copyfileobj(stream, f)
+                f.seek(0)
+                return self.upload_stream(
+                    f, filename, content_type, sign, progress_callback
+                )
+
+        start = stream.tell()
+        size = stream.seek(0, os.SEEK_END) - start
+        return self._upload_stream(
+            stream, start, size, filename, content_type, sign, progress_callback
+        )
+
+    @retry.Retry(predicate=retry.if_exception_type(InternalServerError))
+    def _upload_stream(
+        self,
+        stream: BinaryIO,
+        start: int,
+        size: int,
+        filename: Optional[str],
+        content_type: Optional[str],
+        sign: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> str:
+        # rewind, in case of a retry
+        stream.seek(start)
+        if not (filename and content_type):
+            # matches the encoding of upload_data
+            filename, content_type = None, None
+        body = MultipartFileStream(
+            fields=self._upload_data_fields(size, sign),
+            file_field="1",
+            file=stream,
+            size=size,
+            filename=filename,
+            content_type=content_type,
+            progress_callback=progress_callback,
+        )
+        headers = self.connection.headers.copy()
+        headers["Content-Type"] = body.content_type
+        request = requests.Request(
+            "POST",
+            self.endpoint,
+            headers=headers,
+            data=body,
+        )
+
+        prepped: requests.PreparedRequest = request.prepare()
+
+        response = self.connection.send(prepped)
+        return self._parse_upload_response(response)
+
     @retry.Retry(predicate=retry.if_exception_type(InternalServerError))
     def upload_data(
         self,
@@ -237,28 +405,9 @@ class Client:
             LabelboxError: If upload failed.
         """
 
-        request_data = {
-            "operations": json.dumps(
-                {
-                    "variables": {
-                        "file": None,
-                        "contentLength": len(content),
-                        "sign": sign,
-                    },
-                    "query": """mutation UploadFile($file: Upload!, $contentLength: Int!,
-                                            $sign: Boolean) {
-                            uploadFile(file: $file, contentLength: $contentLength,
-                                       sign: $sign) {url filename} } """,
-                }
-            ),
-            "map": (None, json.dumps({"1": ["variables.file"]})),
-        }
-
-        files = {
-            "1": (filename, content, content_type)
-            if (filename and content_type)
-            else content
-        }
+        request_data, files = self._upload_data_request(
+            content, filename, content_type, sign
+        )
         headers = self.connection.headers.copy()
         headers.pop("Content-Type", None)
         request = requests.Request(
@@ -272,7 +421,49 @@ class Client:
         prepped: requests.PreparedRequest = request.prepare()
 
         response = self.connection.send(prepped)
+        return self._parse_upload_response(response)
 
+    @staticmethod
+    def _upload_data_request(
+        content: bytes,
+        filename: Optional[str],
+        content_type: Optional[str],
+        sign: bool,
+    ):
+        """Returns the form fields and files of an `upload_data` request."""
+        request_data = Client._upload_data_fields(len(content), sign)
+        files = {
+            "1": (filename, content, content_type)
+            if (filename and content_type)
+            else content
+        }
+        return request_data, files
+
+    @staticmethod
+    def _upload_data_fields(content_length: int, sign: bool) -> Dict[str, str]:
+        """Returns the form fields of a request uploading `content_length`
+        bytes as form field "1"."""
+        return {
+            "operations": json.dumps(
+                {
+                    "variables": {
+                        "file": None,
+                        "contentLength": content_length,
+                        "sign": sign,
+                    },
+                    "query": """mutation UploadFile($file: Upload!, $contentLength: Int!,
+                                            $sign: Boolean) {
+                            uploadFile(file: $file, contentLength: $contentLength,
+                                       sign: $sign) {url filename} } """,
+                }
+            ),
+            "map": json.dumps({"1": ["variables.file"]}),
+        }
+
+    @staticmethod
+    def _parse_upload_response(response: requests.Response) -> str:
+        """Returns the URL of the uploaded data from an `upload_data`
+        response."""
         if response.status_code == 502:
             error_502 = "502 Bad Gateway"
             raise InternalServerError(error_502)
@@ -1457,12 +1648,19 @@ class Client:
         self,
         global_key_to_data_row_inputs: List[Dict[str, str]],
         timeout_seconds=60,
+        report_failed_jobs: bool = False,
     ) -> Dict[str, Union[str, List[Any]]]:
         """
         Assigns global keys to data rows.
 
+        Large inputs are split into chunks that are assigned by concurrent
+        jobs, see `iter_assign_global_keys_to_data_rows`.
+
         Args:
             A list of dicts containing data_row_id and global_key.
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors', keeping the results
+                of the other chunks, instead of raising the error.
         Returns:
             Dictionary containing 'status', 'results' and 'errors'.
 
@@ -1487,6 +1685,38 @@ class Client:
             >>> print(job_result['errors'])
             [{'data_row_id': 'cl7tpjzw30031ka6g4evqdfoy', 'global_key': 'gk"', 'error': 'Invalid global key'}]
         """
+        return self._merge_global_keys_job_results(
+            self.iter_assign_global_keys_to_data_rows(
+                global_key_to_data_row_inputs,
+                timeout_seconds,
+                report_failed_jobs,
+            )
+        )
+
+    def iter_assign_global_keys_to_data_rows(
+        self,
+        global_key_to_data_row_inputs: List[Dict[str, str]],
+        timeout_seconds=60,
+        report_failed_jobs: bool = False,
+    ) -> Iterator[Dict[str, Union[str, List[Any]]]]:
+        """
+        Assigns global keys to data rows in chunks, see
+        `assign_global_keys_to_data_rows`.
+
+        Chunks are assigned by concurrent jobs and the result of each chunk
+        is yielded, in input order, as soon as its job is complete.
+
+        Args:
+            A list of dicts containing data_row_id and global_key.
+            timeout_seconds: Maximum time to wait for the jobs of all the
+                chunks, from the start of the iteration.
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors' instead of raising
+                the error.
+        Returns:
+            An iterator of dictionaries containing the 'status', 'results'
+            and 'errors' of each chunk.
+        """
 
         def _format_successful_rows(
             rows: Dict[str, str], sanitized: bool
@@ -1529,13 +1759,6 @@ class Client:
             }
         }
         """
-        params = {
-            "globalKeyDataRowLinks": [
-                {utils.camel_case(key): value for key, value in input.items()}
-                for input in global_key_to_data_row_inputs
-            ]
-        }
-        assign_global_keys_to_data_rows_job = self.execute(query_str, params)
 
         # Query string for retrieving job status and result, if job is done
         result_query_str = """query assignGlobalKeysToDataRowsResultPyApi($jobId: ID!) {
@@ -1560,86 +1783,102 @@ class Client:
                     }
                 }}}
         """
-        result_params = {
-            "jobId": assign_global_keys_to_data_rows_job[
-                "assignGlobalKeysToDataRows"
-            ]["jobId"]
-        }
 
-        # Poll job status until finished, then retrieve results
-        sleep_time = 2
-        start_time = time.time()
-        while True:
-            res = self.execute(result_query_str, result_params)
-            if (
-                res["assignGlobalKeysToDataRowsResult"]["jobStatus"]
-                == "COMPLETE"
-            ):
-                results, errors = [], []
-                res = res["assignGlobalKeysToDataRowsResult"]["data"]
-                # Successful assignments
-                results.extend(
-                    _format_successful_rows(
-                        rows=res["sanitizedAssignments"], sanitized=True
-                    )
+        def assign_chunk(chunk, timeout_seconds):
+            if self.global_key_cache is not None:
+                self.global_key_cache.invalidate(
+                    self._cache_namespace(),
+                    global_keys=[input["global_key"] for input in chunk],
+                    data_row_ids=[input["data_row_id"] for input in chunk],
                 )
-                results.extend(
-                    _format_successful_rows(
-                        rows=res["unmodifiedAssignments"], sanitized=False
-                    )
+            params = {
+                "globalKeyDataRowLinks": [
+                    {
+                        utils.camel_case(key): value
+                        for key, value in input.items()
+                    }
+                    for input in chunk
+                ]
+            }
+            job = self.execute(query_str, params)
+            res = self._wait_for_global_keys_job(
+                result_query_str,
+                job["assignGlobalKeysToDataRows"]["jobId"],
+                "assignGlobalKeysToDataRowsResult",
+                "assign_global_keys_to_data_rows",
+                timeout_seconds,
+            )
+
+            results, errors = [], []
+            # Successful assignments
+            results.extend(
+                _format_successful_rows(
+                    rows=res["sanitizedAssignments"], sanitized=True
                 )
-                # Failed assignments
-                errors.extend(
-                    _format_failed_rows(
-                        rows=res["invalidGlobalKeyAssignments"],
-                        error_msg="Invalid assignment. Either DataRow does not exist, or globalKey is invalid",
-                    )
+            )
+            results.extend(
+                _format_successful_rows(
+                    rows=res["unmodifiedAssignments"], sanitized=False
                 )
-                errors.extend(
-                    _format_failed_rows(
-                        rows=res["accessDeniedAssignments"],
-                        error_msg="Access denied to Data Row",
-                    )
+            )
+            # Failed assignments
+            errors.extend(
+                _format_failed_rows(
+                    rows=res["invalidGlobalKeyAssignments"],
+                    error_msg="Invalid assignment. Either DataRow does not exist, or globalKey is invalid",
                 )
-
-                if not errors:
-                    status = CollectionJobStatus.SUCCESS.value
-                elif errors and results:
-                    status = CollectionJobStatus.PARTIAL_SUCCESS.value
-                else:
-                    status = CollectionJobStatus.FAILURE.value
-
-                if errors:
-                    logger.warning(
-                        "There are errors present. Please look at 'errors' in the returned dict for more details"
-                    )
-
-                return {
-                    "status": status,
-                    "results": results,
-                    "errors": errors,
-                }
-            elif (
-                res["assignGlobalKeysToDataRowsResult"]["jobStatus"] == "FAILED"
-            ):
-                raise LabelboxError(
-                    "Job assign_global_keys_to_data_rows failed."
+            )
+            errors.extend(
+                _format_failed_rows(
+                    rows=res["accessDeniedAssignments"],
+                    error_msg="Access denied to Data Row",
                 )
-            current_time = time.time()
-            if current_time - start_time > timeout_seconds:
-                raise TimeoutError(
-                    "Timed out waiting for assign_global_keys_to_data_rows job to complete."
+            )
+            if self.global_key_cache is not None:
+                self.global_key_cache.put(
+                    self._cache_namespace(),
+                    {r["global_key"]: r["data_row_id"] for r in results},
                 )
-            time.sleep(sleep_time)
+            return self._global_keys_job_result(results, errors)
+
+        def failed_chunk(chunk, error_msg):
+            return self._global_keys_job_result(
+                [],
+                [
+                    {
+                        "data_row_id": input["data_row_id"],
+                        "global_key": input["global_key"],
+                        "error": error_msg,
+                    }
+                    for input in chunk
+                ],
+            )
+
+        return self._run_global_keys_jobs(
+            assign_chunk,
+            failed_chunk,
+            global_key_to_data_row_inputs,
+            timeout_seconds,
+            report_failed_jobs,
+        )
 
     def get_data_row_ids_for_global_keys(
-        self, global_keys: List[str], timeout_seconds=60
+        self,
+        global_keys: List[str],
+        timeout_seconds=60,
+        report_failed_jobs: bool = False,
     ) -> Dict[str, Union[str, List[Any]]]:
         """
         Gets data row ids for a list of global keys.
 
+        Large inputs are split into chunks that are resolved by concurrent
+        jobs, see `iter_data_row_ids_for_global_keys`.
+
         Args:
             A list of global keys
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors', keeping the results
+                of the other chunks, instead of raising the error.
         Returns:
             Dictionary containing 'status', 'results' and 'errors'.
 
@@ -1662,6 +1901,36 @@ class Client:
             >>> print(job_result['errors'])
             [{'global_key': 'asdf', 'error': 'Data Row not found'}]
         """
+        return self._merge_global_keys_job_results(
+            self.iter_data_row_ids_for_global_keys(
+                global_keys, timeout_seconds, report_failed_jobs
+            )
+        )
+
+    def iter_data_row_ids_for_global_keys(
+        self,
+        global_keys: List[str],
+        timeout_seconds=60,
+        report_failed_jobs: bool = False,
+    ) -> Iterator[Dict[str, Union[str, List[Any]]]]:
+        """
+        Gets data row ids for a list of global keys in chunks, see
+        `get_data_row_ids_for_global_keys`.
+
+        Chunks are resolved by concurrent jobs and the result of each chunk
+        is yielded, in input order, as soon as its job is complete.
+
+        Args:
+            A list of global keys
+            timeout_seconds: Maximum time to wait for the jobs of all the
+                chunks, from the start of the iteration.
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors' instead of raising
+                the error.
+        Returns:
+            An iterator of dictionaries containing the 'status', 'results'
+            and 'errors' of each chunk.
+        """
 
         def _format_failed_rows(
             rows: List[str], error_msg: str
@@ -1672,8 +1941,6 @@ class Client:
         query_str = """query getDataRowsForGlobalKeysPyApi($globalKeys: [ID!]!) {
             dataRowsForGlobalKeys(where: {ids: $globalKeys}) { jobId}}
             """
-        params = {"globalKeys": global_keys}
-        data_rows_for_global_keys_job = self.execute(query_str, params)
 
         # Query string for retrieving job status and result, if job is done
         result_query_str = """query getDataRowsForGlobalKeysResultPyApi($jobId: ID!) {
@@ -1683,66 +1950,85 @@ class Client:
                 accessDeniedGlobalKeys
                 } jobStatus}}
             """
-        result_params = {
-            "jobId": data_rows_for_global_keys_job["dataRowsForGlobalKeys"][
-                "jobId"
-            ]
-        }
 
-        # Poll job status until finished, then retrieve results
-        sleep_time = 2
-        start_time = time.time()
-        while True:
-            res = self.execute(result_query_str, result_params)
-            if res["dataRowsForGlobalKeysResult"]["jobStatus"] == "COMPLETE":
-                data = res["dataRowsForGlobalKeysResult"]["data"]
-                results, errors = [], []
-                results.extend([row["id"] for row in data["fetchedDataRows"]])
-                errors.extend(
-                    _format_failed_rows(
-                        data["notFoundGlobalKeys"], "Data Row not found"
-                    )
+        def get_chunk(chunk, timeout_seconds):
+            cached = {}
+            missing = chunk
+            if self.global_key_cache is not None:
+                cached = self.global_key_cache.get_data_row_ids(
+                    self._cache_namespace(), chunk
                 )
-                errors.extend(
-                    _format_failed_rows(
-                        data["accessDeniedGlobalKeys"],
-                        "Access denied to Data Row",
+                # only resolve the global keys missing from the cache
+                missing = [key for key in chunk if key not in cached]
+                if not missing:
+                    return self._global_keys_job_result(
+                        [cached[key] for key in chunk], []
                     )
-                )
 
-                # Invalid results may contain empty string, so we must filter
-                # them prior to checking for PARTIAL_SUCCESS
-                filtered_results = list(filter(lambda r: r != "", results))
-                if not errors:
-                    status = CollectionJobStatus.SUCCESS.value
-                elif errors and len(filtered_results) > 0:
-                    status = CollectionJobStatus.PARTIAL_SUCCESS.value
-                else:
-                    status = CollectionJobStatus.FAILURE.value
-
-                if errors:
-                    logger.warning(
-                        "There are errors present. Please look at 'errors' in the returned dict for more details"
-                    )
+            job = self.execute(query_str, {"globalKeys": missing})
+            data = self._wait_for_global_keys_job(
+                result_query_str,
+                job["dataRowsForGlobalKeys"]["jobId"],
+                "dataRowsForGlobalKeysResult",
+                "dataRowsForGlobalKeys",
+                timeout_seconds,
+                timeout_job_name="get_data_rows_for_global_keys",
+            )
 
-                return {"status": status, "results": results, "errors": errors}
-            elif res["dataRowsForGlobalKeysResult"]["jobStatus"] == "FAILED":
-                raise LabelboxError("Job dataRowsForGlobalKeys failed.")
-            current_time = time.time()
-            if current_time - start_time > timeout_seconds:
-                raise TimeoutError(
-                    "Timed out waiting for get_data_rows_for_global_keys job to complete."
+            results, errors = [], []
+            results.extend([row["id"] for row in data["fetchedDataRows"]])
+            errors.extend(
+                _format_failed_rows(
+                    data["notFoundGlobalKeys"], "Data Row not found"
+                )
+            )
+            errors.extend(
+                _format_failed_rows(
+                    data["accessDeniedGlobalKeys"],
+                    "Access denied to Data Row",
                 )
-            time.sleep(sleep_time)
+            )
+            if self.global_key_cache is not None:
+                # fetched data rows are in the order of the global keys
+                fetched = {
+                    key: id for key, id in zip(missing, results) if id != ""
+                }
+                self.global_key_cache.put(self._cache_namespace(), fetched)
+                fetched.update(cached)
+                results = [fetched.get(key, "") for key in chunk]
+            return self._global_keys_job_result(results, errors)
+
+        def failed_chunk(chunk, error_msg):
+            # results are aligned with the global keys
+            return self._global_keys_job_result(
+                [""] * len(chunk), _format_failed_rows(chunk, error_msg)
+            )
+
+        return self._run_global_keys_jobs(
+            get_chunk,
+            failed_chunk,
+            global_keys,
+            timeout_seconds,
+            report_failed_jobs,
+        )
 
     def clear_global_keys(
-        self, global_keys: List[str], timeout_seconds=60
+        self,
+        global_keys: List[str],
+        timeout_seconds=60,
+        report_failed_jobs: bool = False,
     ) -> Dict[str, Union[str, List[Any]]]:
         """
         Clears global keys for the data rows tha correspond to the global keys provided.
 
+        Large inputs are split into chunks that are cleared by concurrent
+        jobs, see `iter_clear_global_keys`.
+
         Args:
             A list of global keys
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors', keeping the results
+                of the other chunks, instead of raising the error.
         Returns:
             Dictionary containing 'status', 'results' and 'errors'.
 
@@ -1762,6 +2048,35 @@ class Client:
             >>> print(job_result['errors'])
             [{'global_key': 'notfoundkey', 'error': 'Failed to find data row matching provided global key'}]
         """
+        return self._merge_global_keys_job_results(
+            self.iter_clear_global_keys(
+                global_keys, timeout_seconds, report_failed_jobs
+            )
+        )
+
+    def iter_clear_global_keys(
+        self,
+        global_keys: List[str],
+        timeout_seconds=60,
+        report_failed_jobs: bool = False,
+    ) -> Iterator[Dict[str, Union[str, List[Any]]]]:
+        """
+        Clears global keys in chunks, see `clear_global_keys`.
+
+        Chunks are cleared by concurrent jobs and the result of each chunk
+        is yielded, in input order, as soon as its job is complete.
+
+        Args:
+            A list of global keys
+            timeout_seconds: Maximum time to wait for the jobs of all the
+                chunks, from the start of the iteration.
+            report_failed_jobs: Whether to report the inputs of the chunks
+                whose job fails or times out in 'errors' instead of raising
+                the error.
+        Returns:
+            An iterator of dictionaries containing the 'status', 'results'
+            and 'errors' of each chunk.
+        """
 
         def _format_failed_rows(
             rows: List[str], error_msg: str
@@ -1772,8 +2087,6 @@ class Client:
         query_str = """mutation clearGlobalKeysPyApi($globalKeys: [ID!]!) {
             clearGlobalKeys(where: {ids: $globalKeys}) { jobId}}
             """
-        params = {"globalKeys": global_keys}
-        clear_global_keys_job = self.execute(query_str, params)
 
         # Query string for retrieving job status and result, if job is done
         result_query_str = """query clearGlobalKeysResultPyApi($jobId: ID!) {
@@ -1784,58 +2097,153 @@ class Client:
                 accessDeniedGlobalKeys
                 } jobStatus}}
             """
-        result_params = {
-            "jobId": clear_global_keys_job["clearGlobalKeys"]["jobId"]
-        }
-        # Poll job status until finished, then retrieve results
-        sleep_time = 2
-        start_time = time.time()
-        while True:
-            res = self.execute(result_query_str, result_params)
-            if res["clearGlobalKeysResult"]["jobStatus"] == "COMPLETE":
-                data = res["clearGlobalKeysResult"]["data"]
-                results, errors = [], []
-                results.extend(data["clearedGlobalKeys"])
-                errors.extend(
-                    _format_failed_rows(
-                        data["failedToClearGlobalKeys"],
-                        "Clearing global key failed",
-                    )
+
+        def clear_chunk(chunk, timeout_seconds):
+            if self.global_key_cache is not None:
+                self.global_key_cache.invalidate(
+                    self._cache_namespace(), global_keys=chunk
                 )
-                errors.extend(
-                    _format_failed_rows(
-                        data["notFoundGlobalKeys"],
-                        "Failed to find data row matching provided global key",
-                    )
+            job = self.execute(query_str, {"globalKeys": chunk})
+            data = self._wait_for_global_keys_job(
+                result_query_str,
+                job["clearGlobalKeys"]["jobId"],
+                "clearGlobalKeysResult",
+                "clearGlobalKeys",
+                timeout_seconds,
+                timeout_job_name="clear_global_keys",
+            )
+
+            results, errors = [], []
+            results.extend(data["clearedGlobalKeys"])
+            errors.extend(
+                _format_failed_rows(
+                    data["failedToClearGlobalKeys"],
+                    "Clearing global key failed",
                 )
-                errors.extend(
-                    _format_failed_rows(
-                        data["accessDeniedGlobalKeys"],
-                        "Denied access to modify data row matching provided global key",
-                    )
+            )
+            errors.extend(
+                _format_failed_rows(
+                    data["notFoundGlobalKeys"],
+                    "Failed to find data row matching provided global key",
+                )
+            )
+            errors.extend(
+                _format_failed_rows(
+                    data["accessDeniedGlobalKeys"],
+                    "Denied access to modify data row matching provided global key",
                 )
+            )
+            return self._global_keys_job_result(results, errors)
 
-                if not errors:
-                    status = CollectionJobStatus.SUCCESS.value
-                elif errors and len(results) > 0:
-                    status = CollectionJobStatus.PARTIAL_SUCCESS.value
-                else:
-                    status = CollectionJobStatus.FAILURE.value
+        def failed_chunk(chunk, error_msg):
+            return self._global_keys_job_result(
+                [], _format_failed_rows(chunk, error_msg)
+            )
 
-                if errors:
-                    logger.warning(
-                        "There are errors present. Please look at 'errors' in the returned dict for more details"
+        return self._run_global_keys_jobs(
+            clear_chunk,
+            failed_chunk,
+            global_keys,
+            timeout_seconds,
+            report_failed_jobs,
+        )
+
+    def _run_global_keys_jobs(
+        self,
+        run_job: Callable[[List, float], Dict[str, Any]],
+        failed_job: Callable[[List, str], Dict[str, Any]],
+        inputs: List,
+        timeout_seconds: float,
+        report_failed_jobs: bool,
+    ) -> Iterator[Dict[str, Union[str, List[Any]]]]:
+        """Runs a global keys job per chunk of inputs, at most
+        GLOBAL_KEYS_JOB_CONCURRENCY at once, and yields their results in the
+        order of the inputs.
+
+        All the jobs share one deadline, `timeout_seconds` from the start of
+        the iteration, and `run_job` is given the time left. The error of a
+        chunk whose job fails or times out, or that could not be started
+        before the deadline, is raised. If `report_failed_jobs`, the chunk is
+        reported with the result of `failed_job` instead, so that the other
+        chunks are not lost.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        chunks = (
+            inputs[i : i + GLOBAL_KEYS_CHUNK_SIZE]
+            for i in range(0, len(inputs), GLOBAL_KEYS_CHUNK_SIZE)
+        )
+
+        def run_chunk(chunk):
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "Timed out before the global keys job could start."
                     )
+                return run_job(chunk, remaining)
+            except LabelboxError as e:
+                if not report_failed_jobs:
+                    raise
+                logger.warning("Global keys job failed: %s", e)
+                return failed_job(chunk, str(e))
+
+        yield from utils._map_in_threads(
+            run_chunk, chunks, GLOBAL_KEYS_JOB_CONCURRENCY
+        )
 
-                return {"status": status, "results": results, "errors": errors}
-            elif res["clearGlobalKeysResult"]["jobStatus"] == "FAILED":
-                raise LabelboxError("Job clearGlobalKeys failed.")
-            current_time = time.time()
-            if current_time - start_time > timeout_seconds:
-                raise TimeoutError(
-                    "Timed out waiting for clear_global_keys job to complete."
-                )
-            time.sleep(sleep_time)
+    def _wait_for_global_keys_job(
+        self,
+        result_query_str: str,
+        job_id: str,
+        result_name: str,
+        job_name: str,
+        timeout_seconds: float,
+        timeout_job_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Polls a global keys job until it is complete and returns its data"""
+
+        def get_result():
+            res = self.execute(result_query_str, {"jobId": job_id})[result_name]
+            if res["jobStatus"] == "COMPLETE":
+                return res["data"]
+            elif res["jobStatus"] == "FAILED":
+                raise LabelboxError(f"Job {job_name} failed.")
+            return None
+
+        data = polling.poll(get_result, timeout_seconds)
+        if data is None:
+            raise TimeoutError(
+                f"Timed out waiting for {timeout_job_name or job_name} job to complete."
+            )
+        return data
+
+    @staticmethod
+    def _global_keys_job_result(
+        results: List[Any], errors: List[Dict[str, str]]
+    ) -> Dict[str, Union[str, List[Any]]]:
+        # Invalid results may contain empty string, so we must filter
+        # them prior to checking for PARTIAL_SUCCESS
+        if not errors:
+            status = CollectionJobStatus.SUCCESS.value
+        elif any(r != "" for r in results):
+            status = CollectionJobStatus.PARTIAL_SUCCESS.value
+        else:
+            status = CollectionJobStatus.FAILURE.value
+        return {"status": status, "results": results, "errors": errors}
+
+    def _merge_global_keys_job_results(
+        self, job_results: Iterable[Dict[str, Union[str, List[Any]]]]
+    ) -> Dict[str, Union[str, List[Any]]]:
+        results, errors = [], []
+        for job_result in job_results:
+            results.extend(job_result["results"])
+            errors.extend(job_result["errors"])
+
+        if errors:
+            logger.warning(
+                "There are errors present. Please look at 'errors' in the returned dict for more details"
+            )
+        return self._global_keys_job_result(results, errors)
 
     def get_catalog(self) -> Catalog:
         return Catalog(client=self)
@@ -2371,3 +2779,10 @@ class Client:
 
         task._user = user
         return task
+
+
+def _is_seekable(stream: BinaryIO) -> bool:
+    try:
+        return stream.seekable()
+    except AttributeError:
+        return False
@@ -428,7 +428,9 @@ class NDClassification:
             ClassificationAnnotation, VideoClassificationAnnotation
         ],
         data: GenericDataRowData,
+        extra: Optional[Dict[str, Any]] = None,
     ) -> Union[NDTextSubclass, NDChecklistSubclass, NDRadioSubclass]:
+        """`extra` replaces the extra of the annotation, which is not modified."""
         classify_obj = cls.lookup_classification(annotation)
         if classify_obj is None:
             raise TypeError(
@@ -439,7 +441,7 @@ class NDClassification:
             annotation.value,
             annotation.name,
             annotation.feature_schema_id,
-            annotation.extra,
+            annotation.extra if extra is None else extra,
             data,
             annotation.message_id,
             annotation.confidence,
@@ -1,24 +1,11 @@
-import copy
 import logging
 import uuid
 from collections import defaultdict, deque
-from typing import Any, Deque, Dict, Generator, Iterable, List, Set, Union
-
-from labelbox.data.annotation_types.annotation import ObjectAnnotation
-from labelbox.data.annotation_types.classification.classification import (
-    ClassificationAnnotation,
-)
-from labelbox.data.annotation_types.metrics.confusion_matrix import (
-    ConfusionMatrixMetric,
-)
-from labelbox.data.annotation_types.metrics.scalar import ScalarMetric
-from labelbox.data.annotation_types.video import VideoMaskAnnotation
+from typing import Any, Deque, Dict, Generator, Iterable, Set
 
 from ...annotation_types.collection import LabelCollection, LabelGenerator
 from ...annotation_types.relationship import RelationshipAnnotation
-from ...annotation_types.mmc import MessageEvaluationTaskAnnotation
 from .label import NDLabel
-import copy
 
 logger = logging.getLogger(__name__)
 
@@ -44,33 +31,24 @@ class NDJsonConverter:
         """
         used_uuids: Set[uuid.UUID] = set()
 
-        relationship_uuids: Dict[uuid.UUID, Deque[uuid.UUID]] = defaultdict(
-            deque
-        )
-
         # UUIDs are private properties used to enhance UX when defining relationships.
         # They are created for all annotations, but only utilized for relationships.
         # To avoid overwriting, UUIDs must be unique across labels.
         # Non-relationship annotation UUIDs are regenerated when they are reused.
-        # For relationship annotations, during first pass, we update the UUIDs of the source and target annotations.
-        # During the second pass, we update the UUIDs of the annotations referenced by the relationship annotations.
+        # For relationship annotations, during first pass, we pick new UUIDs for the source and target annotations.
+        # During the second pass, we assign them to the annotations referenced by the relationship annotations.
+        # The annotations are not modified, the UUIDs to serialize are kept in
+        # a map from the index of the annotations, see `NDLabel.from_common`.
+        # An annotation that appears twice in a label gets a UUID per index.
         for label in labels:
-            uuid_safe_annotations: List[
-                Union[
-                    ClassificationAnnotation,
-                    ObjectAnnotation,
-                    VideoMaskAnnotation,
-                    ScalarMetric,
-                    ConfusionMatrixMetric,
-                    RelationshipAnnotation,
-                    MessageEvaluationTaskAnnotation,
-                ]
-            ] = []
+            uuids: Dict[Any, str] = {}
+            relationship_uuids: Dict[uuid.UUID, Deque[uuid.UUID]] = defaultdict(
+                deque
+            )
             # First pass to get all RelationshipAnnotaitons
-            # and update the UUIDs of the source and target annotations
-            for annotation in label.annotations:
+            # and pick the UUIDs of the source and target annotations
+            for index, annotation in enumerate(label.annotations):
                 if isinstance(annotation, RelationshipAnnotation):
-                    annotation = copy.deepcopy(annotation)
                     new_source_uuid = uuid.uuid4()
                     new_target_uuid = uuid.uuid4()
                     relationship_uuids[annotation.value.source._uuid].append(
@@ -79,31 +57,28 @@ class NDJsonConverter:
                     relationship_uuids[annotation.value.target._uuid].append(
                         new_target_uuid
                     )
-                    annotation.value.source._uuid = new_source_uuid
-                    annotation.value.target._uuid = new_target_uuid
-                    if annotation._uuid in used_uuids:
-                        annotation._uuid = uuid.uuid4()
-                    used_uuids.add(annotation._uuid)
-                    uuid_safe_annotations.append(annotation)
-            # Second pass to update UUIDs for annotations referenced by RelationshipAnnotations
-            for annotation in label.annotations:
+                    uuids[(index, "source")] = str(new_source_uuid)
+                    uuids[(index, "target")] = str(new_target_uuid)
+                    annotation_uuid = annotation._uuid
+                    if annotation_uuid in used_uuids:
+                        annotation_uuid = uuid.uuid4()
+                    used_uuids.add(annotation_uuid)
+                    uuids[index] = str(annotation_uuid)
+            # Second pass to set UUIDs for annotations referenced by RelationshipAnnotations
+            for index, annotation in enumerate(label.annotations):
                 if not isinstance(
                     annotation, RelationshipAnnotation
                 ) and hasattr(annotation, "_uuid"):
-                    annotation = copy.deepcopy(annotation)
-                    next_uuids = relationship_uuids[annotation._uuid]
-                    if len(next_uuids) > 0:
-                        annotation._uuid = next_uuids.popleft()
+                    annotation_uuid = annotation._uuid
+                    next_uuids = relationship_uuids.get(annotation_uuid)
+                    if next_uuids:
+                        annotation_uuid = next_uuids.popleft()
 
-                    if annotation._uuid in used_uuids:
-                        annotation._uuid = uuid.uuid4()
-                    used_uuids.add(annotation._uuid)
-                    uuid_safe_annotations.append(annotation)
-                else:
-                    if not isinstance(annotation, RelationshipAnnotation):
-                        uuid_safe_annotations.append(annotation)
-            label.annotations = uuid_safe_annotations
-            for example in NDLabel.from_common([label]):
+                    if annotation_uuid in used_uuids:
+                        annotation_uuid = uuid.uuid4()
+                    used_uuids.add(annotation_uuid)
+                    uuids[index] = str(annotation_uuid)
+            for example in NDLabel.from_common([label], uuids):
                 annotation_uuid = getattr(example, "uuid", None)
                 res = example.model_dump(
                     exclude_none=True,
@@ -1,6 +1,6 @@
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
-from typing import Dict, Generator, List, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 from collections import defaultdict
 
 from ...annotation_types.annotation import (
@@ -124,11 +124,40 @@ class NDLabel(BaseModel):
 
     @classmethod
     def from_common(
-        cls, data: LabelCollection
+        cls, data: LabelCollection, uuids: Optional[Dict[Any, str]] = None
     ) -> Generator["NDLabel", None, None]:
+        """Converts labels to ndjson annotations.
+
+        Args:
+            data: The labels to convert.
+            uuids: Overrides the uuids of the annotations, which are not
+                modified. Maps the index of an annotation in
+                `label.annotations` to its uuid, and `(index, "source")` and
+                `(index, "target")` to the uuids of the annotations the
+                relationship at `index` connects.
+        """
         for label in data:
-            yield from cls._create_non_video_annotations(label)
-            yield from cls._create_video_annotations(label)
+            for ndjson_annotation, index in chain(
+                cls._create_non_video_annotations(label),
+                cls._create_video_annotations(label),
+            ):
+                if uuids is not None and index is not None:
+                    cls._set_uuids(ndjson_annotation, index, uuids)
+                yield ndjson_annotation
+
+    @staticmethod
+    def _set_uuids(ndjson_annotation, index: int, uuids: Dict[Any, str]):
+        annotation_uuid = uuids.get(index)
+        if annotation_uuid is not None:
+            ndjson_annotation.uuid = annotation_uuid
+        if isinstance(ndjson_annotation, NDRelationship):
+            relationship = ndjson_annotation.relationship
+            relationship.source = uuids.get(
+                (index, "source"), relationship.source
+            )
+            relationship.target = uuids.get(
+                (index, "target"), relationship.target
+            )
 
     def _generate_annotations(
         self, annotation_groups: Dict[str, _AnnotationGroup]
@@ -268,19 +297,26 @@ class NDLabel(BaseModel):
     @classmethod
     def _create_video_annotations(
         cls, label: Label
-    ) -> Generator[Union[NDChecklistSubclass, NDRadioSubclass], None, None]:
+    ) -> Generator[Tuple[AnnotationType, Optional[int]], None, None]:
+        """Yields the ndjson video annotations of a label, with the index in
+        `label.annotations` of the annotation they are created from, or None
+        for segments."""
         video_annotations = defaultdict(list)
-        for annot in label.annotations:
+        first_indices: Dict[Any, int] = {}
+        for index, annot in enumerate(label.annotations):
             if isinstance(
                 annot, (VideoClassificationAnnotation, VideoObjectAnnotation)
             ):
-                video_annotations[annot.feature_schema_id or annot.name].append(
-                    annot
-                )
+                group_key = annot.feature_schema_id or annot.name
+                video_annotations[group_key].append(annot)
+                first_indices.setdefault(group_key, index)
             elif isinstance(annot, VideoMaskAnnotation):
-                yield NDObject.from_common(annotation=annot, data=label.data)
+                yield (
+                    NDObject.from_common(annotation=annot, data=label.data),
+                    index,
+                )
 
-        for annotation_group in video_annotations.values():
+        for group_key, annotation_group in video_annotations.items():
             segment_frame_ranges = cls._get_segment_frame_ranges(
                 annotation_group
             )
@@ -289,8 +325,14 @@ class NDLabel(BaseModel):
                 frames_data = []
                 for frames in segment_frame_ranges:
                     frames_data.append({"start": frames[0], "end": frames[-1]})
-                annotation.extra.update({"frames": frames_data})
-                yield NDClassification.from_common(annotation, label.data)
+                yield (
+                    NDClassification.from_common(
+                        annotation,
+                        label.data,
+                        extra={**annotation.extra, "frames": frames_data},
+                    ),
+                    first_indices[group_key],
+                )
 
             elif isinstance(annotation_group[0], VideoObjectAnnotation):
                 segments = []
@@ -303,13 +345,17 @@ class NDLabel(BaseModel):
                         ):
                             segment.append(annotation)
                     segments.append(segment)
-                yield NDObject.from_common(segments, label.data)
+                yield NDObject.from_common(segments, label.data), None
 
     @classmethod
-    def _create_non_video_annotations(cls, label: Label):
+    def _create_non_video_annotations(
+        cls, label: Label
+    ) -> Generator[Tuple[AnnotationType, Optional[int]], None, None]:
+        """Yields the ndjson annotations of a label, with the index in
+        `label.annotations` of the annotation they are created from."""
         non_video_annotations = [
-            annot
-            for annot in label.annotations
+            (index, annot)
+            for index, annot in enumerate(label.annotations)
             if not isinstance(
                 annot,
                 (
@@ -319,20 +365,31 @@ class NDLabel(BaseModel):
                 ),
             )
         ]
-        for annotation in non_video_annotations:
+        for index, annotation in non_video_annotations:
             if isinstance(annotation, ClassificationAnnotation):
-                yield NDClassification.from_common(annotation, label.data)
+                ndjson_annotation = NDClassification.from_common(
+                    annotation, label.data
+                )
             elif isinstance(annotation, ObjectAnnotation):
-                yield NDObject.from_common(annotation, label.data)
+                ndjson_annotation = NDObject.from_common(annotation, label.data)
             elif isinstance(annotation, (ScalarMetric, ConfusionMatrixMetric)):
-                yield NDMetricAnnotation.from_common(annotation, label.data)
+                ndjson_annotation = NDMetricAnnotation.from_common(
+                    annotation, label.data
+                )
             elif isinstance(annotation, RelationshipAnnotation):
-                yield NDRelationship.from_common(annotation, label.data)
+                ndjson_annotation = NDRelationship.from_common(
+                    annotation, label.data
+                )
             elif isinstance(annotation, PromptClassificationAnnotation):
-                yield NDPromptClassification.from_common(annotation, label.data)
+                ndjson_annotation = NDPromptClassification.from_common(
+                    annotation, label.data
+                )
             elif isinstance(annotation, MessageEvaluationTaskAnnotation):
-                yield NDMessageTask.from_common(annotation, label.data)
+                ndjson_annotation = NDMessageTask.from_common(
+                    annotation, label.data
+                )
             else:
                 raise TypeError(
                     f"Unable to convert object to MAL format. `{type(getattr(annotation, 'value',annotation))}`"
                 )
+            yield ndjson_annotation, index
@@ -0,0 +1,200 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Version of the format of the cache file.
+_FILE_VERSION = 1
+
+
+class GlobalKeyCache:
+    """A client-side cache of the data row ids of global keys.
+
+    Global keys resolved by `Client.get_data_row_ids_for_global_keys`, and
+    so by `Client.get_data_row_by_global_key`, are cached and not resolved by
+    the server again. Entries are updated by the client's own
+    `assign_global_keys_to_data_rows` and `clear_global_keys`, changes made
+    by other clients or in the app are not seen by the cache.
+
+    The least recently used entries are evicted beyond `max_entries`. If a
+    `path` is given, the cache is loaded from that file when created and
+    saved to it by `save` and `close`.
+
+    >>> client = Client(global_key_cache=GlobalKeyCache("~/.labelbox/keys.json"))
+    >>> client.get_data_row_ids_for_global_keys(["key1", "key2"])
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1_000_000,
+    ):
+        """Creates a GlobalKeyCache.
+
+        Args:
+            path (str): Path of the file the cache is persisted to. The cache
+                is only kept in memory if None.
+            max_entries (int): Maximum number of global keys kept in the cache.
+        """
+        if max_entries <= 0:
+            raise ValueError("Expected max_entries to be positive")
+        self.path = os.path.expanduser(path) if path is not None else None
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (namespace, global key) -> data row id, least recently used first
+        self._data_row_ids: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # (namespace, data row id) -> global key
+        self._global_keys: Dict[Tuple[str, str], str] = {}
+
+        if self.path is not None and os.path.exists(self.path):
+            self._load()
+
+    def get_data_row_ids(
+        self, namespace: str, global_keys: Iterable[str]
+    ) -> Dict[str, str]:
+        """Returns the cached data row ids of the given global keys.
+
+        Args:
+            namespace (str): Identifies the account, entries are only shared
+                within a namespace.
+            global_keys (iterable of str): Global keys to look up.
+        Returns:
+            A dict from the global keys found in the cache to their data row id.
+        """
+        found = {}
+        with self._lock:
+            for global_key in global_keys:
+                data_row_id = self._data_row_ids.get((namespace, global_key))
+                if data_row_id is not None:
+                    self._data_row_ids.move_to_end((namespace, global_key))
+                    found[global_key] = data_row_id
+        return found
+
+    def get_global_keys(
+        self, namespace: str, data_row_ids: Iterable[str]
+    ) -> Dict[str, str]:
+        """Returns the cached global keys of the given data row ids.
+
+        Args:
+            namespace (str): Identifies the account.
+            data_row_ids (iterable of str): Data row ids to look up.
+        Returns:
+            A dict from the data row ids found in the cache to their global key.
+        """
+        with self._lock:
+            return {
+                data_row_id: self._global_keys[(namespace, data_row_id)]
+                for data_row_id in data_row_ids
+                if (namespace, data_row_id) in self._global_keys
+            }
+
+    def put(self, namespace: str, data_row_ids: Dict[str, str]) -> None:
+        """Caches the data row ids of global keys, replacing any previous
+        entry of the global keys or of the data rows.
+
+        Args:
+            namespace (str): Identifies the account.
+            data_row_ids (dict): Maps global keys to data row ids.
+        """
+        with self._lock:
+            for global_key, data_row_id in data_row_ids.items():
+                self._remove(namespace, global_key, data_row_id)
+                self._data_row_ids[(namespace, global_key)] = data_row_id
+                self._global_keys[(namespace, data_row_id)] = global_key
+            while len(self._data_row_ids) > self.max_entries:
+                (evicted_namespace, _), data_row_id = (
+                    self._data_row_ids.popitem(last=False)
+                )
+                del self._global_keys[(evicted_namespace, data_row_id)]
+
+    def invalidate(
+        self,
+        namespace: str,
+        global_keys: Iterable[str] = (),
+        data_row_ids: Iterable[str] = (),
+    ) -> None:
+        """Removes the entries of the given global keys and data rows.
+
+        Args:
+            namespace (str): Identifies the account.
+            global_keys (iterable of str): Global keys to remove.
+            data_row_ids (iterable of str): Data row ids to remove.
+        """
+        with self._lock:
+            for global_key in global_keys:
+                self._remove(namespace, global_key, None)
+            for data_row_id in data_row_ids:
+                self._remove(namespace, None, data_row_id)
+
+    def clear(self) -> None:
+        """Removes all the entries of the cache."""
+        with self._lock:
+            self._data_row_ids.clear()
+            self._global_keys.clear()
+
+    def save(self) -> None:
+        """Writes the cache to its file, if it has a `path`."""
+        if self.path is None:
+            return
+        with self._lock:
+            entries = [
+                [namespace, global_key, data_row_id]
+                for (namespace, global_key), data_row_id in (
+                    self._data_row_ids.items()
+                )
+            ]
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # write to a temporary file first so that an interrupted save does not
+        # leave a truncated cache behind
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": _FILE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self) -> None:
+        self.save()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+            if content.get("version") != _FILE_VERSION:
+                raise ValueError(f"Unknown version {content.get('version')}")
+            entries = content["entries"]
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(
+                "Ignoring unreadable global key cache %s: %s", self.path, e
+            )
+            return
+        # entries are saved least recently used first
+        for namespace, global_key, data_row_id in entries:
+            self.put(namespace, {global_key: data_row_id})
+
+    def _remove(
+        self,
+        namespace: str,
+        global_key: Optional[str],
+        data_row_id: Optional[str],
+    ) -> None:
+        """Removes the entries of a global key and of a data row. Must be
+        called with the lock held."""
+        if global_key is not None:
+            previous_id = self._data_row_ids.pop((namespace, global_key), None)
+            if previous_id is not None:
+                del self._global_keys[(namespace, previous_id)]
+        if data_row_id is not None:
+            previous_key = self._global_keys.pop((namespace, data_row_id), None)
+            if previous_key is not None:
+                del self._data_row_ids[(namespace, previous_key)]
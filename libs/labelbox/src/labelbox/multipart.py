@@ -0,0 +1,94 @@
+from typing import BinaryIO, Callable, Dict, Iterator, Optional
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+# Size of the blocks read from uploaded files.
+_CHUNK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class MultipartFileStream:
+    """A multipart/form-data request body made of form fields and a file.
+
+    The file is read in blocks of `chunk_size` bytes while the body is being
+    iterated over, so the memory used does not depend on the size of the
+    file. The encoding is the one `requests` uses for `data` and `files`.
+    `requests` sends iterable bodies as they are iterated over and sets the
+    Content-Length header from `len`. Each iteration sends the file from the
+    position it had when the body was created, so requests can be retried.
+
+    Intended for use by library internals and not by the end user.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        file: BinaryIO,
+        size: int,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ):
+        """Creates a MultipartFileStream.
+
+        Args:
+            fields (dict): Form fields sent before the file.
+            file_field (str): Name of the form field of the file.
+            file (file object): Seekable binary file object positioned at
+                the start of the content to send.
+            size (int): Number of bytes of `file` to send.
+            filename (str): Name of the file, defaults to `file_field`.
+            content_type (str): Content type of the file.
+            progress_callback (callable): Called with the number of bytes of
+                the file sent so far and `size` after each block.
+            chunk_size (int): Size of the blocks read from `file`.
+        """
+        boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        preamble = b""
+        for name, value in fields.items():
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            preamble += self._part_header(boundary, field)
+            preamble += value.encode("utf-8") + b"\r\n"
+        file_part = RequestField(
+            name=file_field, data=b"", filename=filename or file_field
+        )
+        file_part.make_multipart(content_type=content_type)
+        self._preamble = preamble + self._part_header(boundary, file_part)
+        self._epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        self.file = file
+        self.start = file.tell()
+        self.size = size
+        self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
+        self.len = len(self._preamble) + size + len(self._epilogue)
+
+    @staticmethod
+    def _part_header(boundary: str, field: RequestField) -> bytes:
+        return f"--{boundary}\r\n{field.render_headers()}".encode("utf-8")
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._preamble
+        self.file.seek(self.start)
+        sent = 0
+        while sent < self.size:
+            chunk = self.file.read(min(self.chunk_size, self.size - sent))
+            if not chunk:
+                raise ValueError(
+                    f"Expected {self.size} bytes but the file ended after {sent}"
+                )
+            sent += len(chunk)
+            yield chunk
+            if self.progress_callback is not None:
+                self.progress_callback(sent, self.size)
+        yield self._epilogue
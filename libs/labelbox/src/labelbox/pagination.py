@@ -1,11 +1,15 @@
 # Size of a single page in a paginated query.
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from labelbox import Client
+    from labelbox import AsyncClient, Client
     from labelbox.orm.db_object import DbObject
 
 _PAGE_SIZE = 100
@@ -29,6 +33,8 @@ class PaginatedCollection:
         obj_class: Union[Type["DbObject"], Callable[[Any, Any], Any]],
         cursor_path: Optional[List[str]] = None,
         experimental: bool = False,
+        prefetch_pages: int = 0,
+        streaming: bool = False,
     ):
         """Creates a PaginatedCollection.
 
@@ -45,10 +51,17 @@ class PaginatedCollection:
                 dict containing db values.
             cursor_path: If not None, this is used to find the cursor
             experimental: Used to call experimental endpoints
+            prefetch_pages: The number of pages fetched in the background
+                ahead of iteration. See `prefetch`.
+            streaming: Whether pages are dropped once iterated over. See
+                `stream`.
         """
         self._fetched_all = False
-        self._data: List[Dict[str, Any]] = []
+        self._data: List["DbObject"] = []
         self._data_ind = 0
+        self._prefetch_pages = prefetch_pages
+        self._prefetcher: Optional[_PagePrefetcher] = None
+        self._streaming = streaming
 
         pagination_kwargs = {
             "client": client,
@@ -66,15 +79,30 @@ class PaginatedCollection:
         )
 
     def __iter__(self):
+        # stops the background fetches of an iteration that was left early,
+        # the pages they would return are fetched again when needed
+        self._close_prefetcher()
+        if self._streaming:
+            self._restart()
         self._data_ind = 0
         return self
 
+    def _restart(self) -> None:
+        self._close_prefetcher()
+        self.paginator.reset()
+        self._fetched_all = False
+        self._data = []
+
     def __next__(self):
         if len(self._data) <= self._data_ind:
             if self._fetched_all:
                 raise StopIteration()
 
-            page_data, self._fetched_all = self.paginator.get_next_page()
+            page_data, self._fetched_all = self._get_next_page()
+            if self._streaming:
+                # drop the page that was iterated over
+                self._data = []
+                self._data_ind = 0
             self._data.extend(page_data)
             if len(page_data) == 0:
                 raise StopIteration()
@@ -83,6 +111,70 @@ class PaginatedCollection:
         self._data_ind += 1
         return rval
 
+    def _get_next_page(self):
+        if self._prefetch_pages <= 0:
+            return self.paginator.get_next_page()
+        if self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(
+                self.paginator, self._prefetch_pages
+            )
+        try:
+            page_data, fetched_all = self._prefetcher.get_next_page()
+        except Exception:
+            self._close_prefetcher()
+            raise
+        if fetched_all or len(page_data) == 0:
+            self._close_prefetcher()
+        return page_data, fetched_all
+
+    def _close_prefetcher(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    def prefetch(self, pages: int) -> "PaginatedCollection":
+        """Fetches up to `pages` pages in background threads while the
+        current page is being iterated over.
+
+        Pages of offset paginated queries are fetched in parallel. Cursor
+        paginated queries only know the next page once the current one
+        arrives, so at most one page is fetched ahead of iteration for them.
+        A few requests past the last page may be sent for offset queries.
+
+        >>> for data_row in dataset.data_rows().prefetch(4):
+        >>>     ...
+
+        Args:
+            pages (int): The number of pages to fetch ahead, 0 disables
+                prefetching.
+        Returns:
+            This collection.
+        """
+        if pages < 0:
+            raise ValueError("Expected a non-negative number of pages")
+        self._close_prefetcher()
+        self._prefetch_pages = pages
+        return self
+
+    def stream(self, enabled: bool = True) -> "PaginatedCollection":
+        """Keeps only the page being iterated over in memory, so that memory
+        use doesn't grow with the size of the collection.
+
+        Iterating over a streaming collection again queries the server again
+        instead of replaying the objects already fetched. A streaming
+        collection supports a single iteration at a time.
+
+        >>> for data_row in dataset.data_rows().stream():
+        >>>     ...
+
+        Args:
+            enabled (bool): Whether pages are dropped once iterated over.
+        Returns:
+            This collection.
+        """
+        self._streaming = enabled
+        return self
+
     def get_one(self):
         """Iterates over self and returns first value
         This method is idempotent
@@ -110,6 +202,91 @@ class PaginatedCollection:
         return results
 
 
+class AsyncPaginatedCollection:
+    """Iterates over a `PaginatedCollection` with an `AsyncClient`.
+
+    Pages are fetched without blocking the event loop and are shared with the
+    wrapped collection, so pages fetched by either of them are not fetched
+    again. Obtained with `AsyncClient.paginate`.
+
+    >>> async for project in async_client.paginate(client.get_projects()):
+    >>>     print(project.name)
+    """
+
+    def __init__(self, client: "AsyncClient", collection: PaginatedCollection):
+        self.client = client
+        self.collection = collection
+        # created on first use, within the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        collection = self.collection
+        if collection._streaming:
+            async for value in self._stream():
+                yield value
+            return
+        index = 0
+        while True:
+            if len(collection._data) <= index:
+                await self._fetch_next_page(index)
+                if len(collection._data) <= index:
+                    return
+            yield collection._data[index]
+            index += 1
+
+    async def _stream(self):
+        collection = self.collection
+        collection._restart()
+        while not collection._fetched_all:
+            page_data, collection._fetched_all = await self._fetch_page()
+            if len(page_data) == 0:
+                return
+            for value in page_data:
+                yield value
+
+    async def _fetch_page(self) -> Tuple[List["DbObject"], bool]:
+        paginator = self.collection.paginator
+        query, params = paginator.next_query()
+        results = await self.client.execute(
+            query, params, experimental=paginator.experimental
+        )
+        return paginator.process_results(results)
+
+    async def _fetch_next_page(self, index: int) -> None:
+        collection = self.collection
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # another iteration may have fetched the page in the meantime
+            if len(collection._data) > index or collection._fetched_all:
+                return
+            page_data, collection._fetched_all = await self._fetch_page()
+            collection._data.extend(page_data)
+
+    async def get_one(self):
+        """Returns the first value. This method is idempotent."""
+        async for value in self:
+            return value
+
+    async def get_many(self, n: int):
+        """Returns the first n values. This method is idempotent.
+
+        Args:
+            n (int): Number of elements to retrieve
+        """
+        results: List["DbObject"] = []
+        if n <= 0:
+            return results
+        async for value in self:
+            results.append(value)
+            if len(results) >= n:
+                break
+        return results
+
+
 class _Pagination(ABC):
     def __init__(
         self,
@@ -133,15 +310,47 @@ class _Pagination(ABC):
 
         return [self.obj_class(self.client, result) for result in results]
 
+    def fetch_results(self) -> Dict[str, Any]:
+        query, params = self.next_query()
+        return self.client.execute(
+            query, params, experimental=self.experimental
+        )
+
+    def get_next_page(self) -> Tuple[List["DbObject"], bool]:
+        return self.process_results(self.fetch_results())
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Restarts pagination from the first page."""
+
+    @abstractmethod
+    def next_query(self) -> Tuple[str, Dict[str, Any]]:
+        """Returns the query and parameters fetching the next page."""
+
+    @abstractmethod
+    def prefetch_queries(
+        self, in_flight: int, depth: int
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Returns the queries of the pages that can be fetched ahead of
+        iteration, given the number of pages already being fetched."""
+
     @abstractmethod
-    def get_next_page(self) -> Tuple[Dict[str, Any], bool]: ...
+    def process_results(
+        self, results: Dict[str, Any]
+    ) -> Tuple[List["DbObject"], bool]:
+        """Advances past a fetched page and returns its objects and whether
+        it was the last page."""
 
 
 class _CursorPagination(_Pagination):
     def __init__(self, cursor_path: List[str], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.cursor_path = cursor_path
-        self.next_cursor: Optional[Any] = kwargs.get("params", {}).get("from")
+        self._first_cursor: Optional[Any] = kwargs.get("params", {}).get("from")
+        self.next_cursor: Optional[Any] = self._first_cursor
+
+    def reset(self) -> None:
+        self.next_cursor = self._first_cursor
 
     def increment_page(self, results: Dict[str, Any]):
         for path in self.cursor_path:
@@ -151,15 +360,20 @@ class _CursorPagination(_Pagination):
     def fetched_all(self) -> bool:
         return not self.next_cursor
 
-    def fetch_results(self) -> Dict[str, Any]:
+    def next_query(self) -> Tuple[str, Dict[str, Any]]:
         page_size = self.params.get("first", _PAGE_SIZE)
         self.params.update({"from": self.next_cursor, "first": page_size})
-        return self.client.execute(
-            self.query, self.params, experimental=self.experimental
-        )
+        return self.query, self.params
+
+    def prefetch_queries(
+        self, in_flight: int, depth: int
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        # the cursor of a page is only known once the previous page arrived
+        if in_flight > 0:
+            return []
+        return [self.next_query()]
 
-    def get_next_page(self):
-        results = self.fetch_results()
+    def process_results(self, results: Dict[str, Any]):
         page_data = self.get_page_data(results)
         self.increment_page(results)
         done = self.fetched_all()
@@ -171,21 +385,82 @@ class _OffsetPagination(_Pagination):
         super().__init__(*args, **kwargs)
         self._fetched_pages = 0
 
+    def reset(self) -> None:
+        self._fetched_pages = 0
+
     def increment_page(self):
         self._fetched_pages += 1
 
     def fetched_all(self, n_items: int) -> bool:
         return n_items < _PAGE_SIZE
 
-    def fetch_results(self) -> Dict[str, Any]:
-        query = self.query % (self._fetched_pages * _PAGE_SIZE, _PAGE_SIZE)
-        return self.client.execute(
-            query, self.params, experimental=self.experimental
-        )
+    def page_query(self, page: int) -> Tuple[str, Dict[str, Any]]:
+        query = self.query % (page * _PAGE_SIZE, _PAGE_SIZE)
+        return query, self.params
+
+    def next_query(self) -> Tuple[str, Dict[str, Any]]:
+        return self.page_query(self._fetched_pages)
 
-    def get_next_page(self):
-        results = self.fetch_results()
+    def prefetch_queries(
+        self, in_flight: int, depth: int
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        return [
+            self.page_query(self._fetched_pages + page)
+            for page in range(in_flight, depth)
+        ]
+
+    def process_results(self, results: Dict[str, Any]):
         page_data = self.get_page_data(results)
         self.increment_page()
         done = self.fetched_all(len(page_data))
         return page_data, done
+
+
+class _PagePrefetcher:
+    """Fetches the pages of a paginator in background threads, ahead of the
+    page being iterated over. Pages are returned in order.
+
+    The fetches are cancelled on `close`, or when the prefetcher is garbage
+    collected if an iteration is abandoned without being closed."""
+
+    def __init__(self, paginator: _Pagination, depth: int):
+        self.paginator = paginator
+        self.depth = depth
+        self._executor = ThreadPoolExecutor(max_workers=depth)
+        self._pending: deque = deque()
+        self._finalizer = weakref.finalize(
+            self, _PagePrefetcher._shutdown, self._executor, self._pending
+        )
+
+    def _submit(self) -> None:
+        for query, params in self.paginator.prefetch_queries(
+            len(self._pending), self.depth
+        ):
+            self._pending.append(
+                self._executor.submit(
+                    self.paginator.client.execute,
+                    query,
+                    # the paginator keeps updating its params
+                    dict(params),
+                    experimental=self.paginator.experimental,
+                )
+            )
+
+    def get_next_page(self) -> Tuple[List["DbObject"], bool]:
+        self._submit()
+        future: Future = self._pending.popleft()
+        page_data, done = self.paginator.process_results(future.result())
+        if not done:
+            # fetch the following pages while this one is iterated over
+            self._submit()
+        return page_data, done
+
+    def close(self) -> None:
+        self._finalizer()
+
+    @staticmethod
+    def _shutdown(executor: ThreadPoolExecutor, pending: deque) -> None:
+        for future in pending:
+            future.cancel()
+        pending.clear()
+        executor.shutdown(wait=False)
@@ -1,31 +1,149 @@
+"""Reading and writing newline-delimited JSON (ndjson).
+
+Lines are parsed one at a time, with `lbox.json_codec` unless decoding
+arguments for `json.loads` are given. `json_codec` uses orjson when the
+`labelbox[orjson]` extra is installed, see `json_codec.set_backend`.
+"""
+
+import io
 import json
+import warnings
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from lbox import json_codec  # type: ignore
+
+NdjsonSource = Union[str, bytes, bytearray, Iterable[Union[str, bytes]]]
+
+
+class NdjsonDecodeError(ValueError):
+    """Raised when a line of ndjson is not valid JSON.
+
+    Attributes:
+        line_number (int): Number of the invalid line, starting at 1.
+        line (str or bytes): The invalid line.
+    """
+
+    def __init__(self, line_number: int, line: Union[str, bytes], error):
+        super().__init__(f"Invalid JSON on line {line_number}: {error}")
+        self.line_number = line_number
+        self.line = line
 
 
 class NdjsonDecoder(json.JSONDecoder):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    """Decodes ndjson into a list, for `json.loads(s, cls=NdjsonDecoder)`.
+
+    Deprecated, use `iter_loads` or `loads` instead.
+    """
+
+    def __init__(self, **kwargs):
+        warnings.warn(
+            "NdjsonDecoder is deprecated and will be removed in a future "
+            "release. Please use parser.iter_loads or parser.loads instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        super().__init__(**kwargs)
+        self._loads_kwargs = kwargs
+
+    def decode(self, s: str, *args, **kwargs) -> List[Any]:
+        return list(iter_loads(s, **self._loads_kwargs))
+
+
+def iter_loads(
+    source: NdjsonSource,
+    on_error: Optional[Callable[[NdjsonDecodeError], None]] = None,
+    first_line_number: int = 1,
+    **kwargs,
+) -> Iterator[Any]:
+    """Parses ndjson one line at a time. Blank lines are skipped.
+
+    >>> with open("annotations.ndjson", "rb") as f:
+    >>>     for annotation in parser.iter_loads(f):
+    >>>         ...
+
+    Args:
+        source: The ndjson as a string or bytes, or an iterable of its lines
+            such as a file object or `requests.Response.iter_lines()`.
+        on_error: Called with the error of each invalid line, which is then
+            skipped. Invalid lines raise the error if None.
+        first_line_number: Number of the first line of `source` in errors.
+        kwargs: Passed to `json.loads` for each line.
+    Yields:
+        The parsed lines.
+    Raises:
+        NdjsonDecodeError: If a line is not valid JSON and `on_error` is None.
+    """
+    if isinstance(source, str):
+        lines: Iterable[Union[str, bytes]] = io.StringIO(source, newline="\n")
+    elif isinstance(source, (bytes, bytearray)):
+        lines = io.BytesIO(source)
+    else:
+        lines = source
+
+    for line_number, line in enumerate(lines, first_line_number):
+        if not line.strip():
+            continue
+        try:
+            yield (
+                json_codec.loads(line)
+                if not kwargs
+                else json.loads(line, **kwargs)
+            )
+        except ValueError as e:
+            error = NdjsonDecodeError(line_number, line, e)
+            if on_error is None:
+                raise error from e
+            on_error(error)
+
+
+def loads(ndjson_string: NdjsonSource, **kwargs) -> List[Any]:
+    """Parses ndjson into a list, see `iter_loads`."""
+    return list(iter_loads(ndjson_string, **kwargs))
+
 
-    def decode(self, s: str, *args, **kwargs):
-        lines = ",".join(s.splitlines())
-        text = f"[{lines}]"  # NOTE: this is a hack to make json.loads work for ndjson
-        return super().decode(text, *args, **kwargs)
+def iter_dumps(obj: Iterable[Any], **kwargs) -> Iterator[str]:
+    """Serializes objects to ndjson one at a time, yielding a line per
+    object without its line break. kwargs are passed to `json.dumps`."""
+    for item in obj:
+        yield json.dumps(item, **kwargs)
 
 
-def loads(ndjson_string, **kwargs) -> list:
-    kwargs.setdefault("cls", NdjsonDecoder)
-    return json.loads(ndjson_string, **kwargs)
+def dumps(obj: Iterable[Any], **kwargs) -> str:
+    """Serializes objects to ndjson, one per line, see `dump`."""
+    buffer = io.StringIO()
+    dump(obj, buffer, **kwargs)
+    return buffer.getvalue()
 
 
-def dumps(obj, **kwargs):
-    lines = map(lambda obj: json.dumps(obj, **kwargs), obj)
-    return "\n".join(lines)
+def dump(obj: Iterable[Any], io: IO, **kwargs) -> None:
+    """Writes objects to a text or binary file object as ndjson, one line at
+    a time, so that they need not fit in memory at once. kwargs are passed
+    to `json.dumps`."""
+    binary = _is_binary(io)
+    for i, line in enumerate(iter_dumps(obj, **kwargs)):
+        if i > 0:
+            line = "\n" + line
+        io.write(line.encode("utf-8") if binary else line)
 
 
-def dump(obj, io, **kwargs):
-    lines = dumps(obj, **kwargs)
-    io.write(lines)
+def reader(io_handle: Iterable[Union[str, bytes]], **kwargs) -> Iterator[Any]:
+    """Parses the lines of a file object, see `iter_loads`."""
+    return iter_loads(io_handle, **kwargs)
 
 
-def reader(io_handle, **kwargs):
-    for line in io_handle:
-        yield json.loads(line, **kwargs)
+def _is_binary(file: IO) -> bool:
+    # file objects are assumed to be text unless they are known to be binary
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(file, io.TextIOBase):
+        return False
+    return "b" in str(getattr(file, "mode", ""))
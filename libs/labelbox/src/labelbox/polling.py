@@ -0,0 +1,106 @@
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default bounds of the intervals between two polls, in seconds.
+INITIAL_INTERVAL = 0.5
+MAX_INTERVAL = 10.0
+# Default number of checks run at once by poll_all.
+MAX_CONCURRENT_CHECKS = 4
+
+
+def backoff_intervals(
+    initial_interval: float = INITIAL_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+    multiplier: float = 2.0,
+) -> Iterator[float]:
+    """Yields the intervals to sleep between successive polls of a job.
+
+    Intervals start at `initial_interval`, so short jobs are noticed quickly,
+    and grow exponentially up to `max_interval` for long ones. Each interval
+    is drawn uniformly from its upper half so that jobs polled concurrently do
+    not query the server in lockstep.
+
+    Intended for use by library internals and not by the end user.
+    """
+    interval = min(initial_interval, max_interval)
+    while True:
+        yield random.uniform(interval / 2, interval)
+        interval = min(interval * multiplier, max_interval)
+
+
+def poll(
+    check: Callable[[], Optional[T]],
+    timeout_seconds: float,
+    initial_interval: float = INITIAL_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+) -> Optional[T]:
+    """Calls `check` until it returns something else than None, sleeping
+    between calls with `backoff_intervals`.
+
+    Args:
+        check (callable): Returns the result of the job once it is done and
+            None while it is running. Raises if the job failed.
+        timeout_seconds (float): Time after which polling stops, in seconds.
+        initial_interval (float): First interval between two calls.
+        max_interval (float): Maximum interval between two calls.
+
+    Returns:
+        The result of `check`, or None if the job is still running after
+        `timeout_seconds`.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    for interval in backoff_intervals(initial_interval, max_interval):
+        result = check()
+        if result is not None:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        logger.debug("Polling again in %.1f seconds", interval)
+        time.sleep(min(interval, remaining))
+    return None  # unreachable, backoff_intervals is infinite
+
+
+def poll_all(
+    checks: Sequence[Callable[[], bool]],
+    timeout_seconds: float,
+    initial_interval: float = INITIAL_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+    max_concurrent_checks: int = MAX_CONCURRENT_CHECKS,
+) -> bool:
+    """Polls several jobs until they are all done, see `poll`.
+
+    The checks of the jobs still running are run concurrently, at most
+    `max_concurrent_checks` at once, and finished jobs are not checked again.
+
+    Args:
+        checks (list of callables): Each returns whether its job is done.
+
+    Returns:
+        Whether all the jobs are done before `timeout_seconds`.
+    """
+    pending = list(checks)
+    if not pending:
+        return True
+
+    with ThreadPoolExecutor(max_concurrent_checks) as executor:
+
+        def check_pending() -> Optional[bool]:
+            nonlocal pending
+            if len(pending) == 1:
+                done = [pending[0]()]
+            else:
+                done = list(executor.map(lambda check: check(), pending))
+            pending = [c for c, is_done in zip(pending, done) if not is_done]
+            return True if not pending else None
+
+        return bool(
+            poll(check_pending, timeout_seconds, initial_interval, max_interval)
+        )
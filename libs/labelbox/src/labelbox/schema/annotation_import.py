@@ -1,46 +1,77 @@
-import functools
+import io
 import json
 import logging
+import math
 import os
+import tempfile
 import time
+import zlib
 from collections import defaultdict
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     BinaryIO,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Union,
     cast,
 )
 
-import requests
 from google.api_core import retry
+from lbox import json_codec  # type: ignore
 from lbox.exceptions import ApiLimitError, NetworkError, ResourceNotFoundError
 from tqdm import tqdm  # type: ignore
 
 import labelbox
-from labelbox import parser
+from labelbox import parser, polling
 from labelbox.orm import query
 from labelbox.orm.db_object import DbObject
+from labelbox.multipart import MultipartFileStream
 from labelbox.orm.model import Field, Relationship
 from labelbox.schema.confidence_presence_checker import (
     LabelsConfidencePresenceChecker,
 )
 from labelbox.schema.enums import AnnotationImportState
 from labelbox.schema.serialization import serialize_labels
-from labelbox.utils import is_exactly_one_set
+from labelbox.utils import _map_in_threads, is_exactly_one_set
 
 if TYPE_CHECKING:
     from labelbox.types import Label
 
 NDJSON_MIME_TYPE = "application/x-ndjson"
 ANNOTATION_PER_LABEL_LIMIT = 5000
+# Serialized annotations are kept in memory up to this size, in bytes, and
+# written to a temporary file beyond it.
+NDJSON_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+# Default number of import jobs of create_sharded_from_objects, and of jobs
+# created at once.
+IMPORT_SHARD_COUNT = 8
+IMPORT_SHARD_CONCURRENCY = 4
+# Input, error and status files of at most this many rows are kept in memory
+# once read, larger files are downloaded again each time they are read.
+NDJSON_CACHE_MAX_ROWS = 100_000
 
 logger = logging.getLogger(__name__)
 
 
+def _data_row_shard(object: Dict[str, Any], shard_count: int) -> int:
+    """Returns the shard of an annotation, the same for all the annotations
+    of a data row referenced the same way."""
+    if shard_count == 1:
+        return 0
+    data_row = object.get("dataRow")
+    if not isinstance(data_row, dict):
+        return 0
+    key = data_row.get("globalKey") or data_row.get("id") or ""
+    return zlib.crc32(str(key).encode("utf-8")) % shard_count
+
+
 class AnnotationImport(DbObject):
     name = Field.String("name")
     state = Field.Enum(AnnotationImportState, "state")
@@ -51,6 +82,12 @@ class AnnotationImport(DbObject):
 
     created_by = Relationship.ToOne("User", False, "created_by")
 
+    def __init__(self, client, field_values):
+        super().__init__(client, field_values)
+        # name of a remote ndjson file -> its url and rows, see
+        # `_iter_remote_ndjson`
+        self._ndjson_cache: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+
     @property
     def inputs(self) -> List[Dict[str, Any]]:
         """
@@ -60,7 +97,14 @@ class AnnotationImport(DbObject):
             Uploaded ndjson.
         * This information will expire after 24 hours.
         """
-        return self._fetch_remote_ndjson(self.input_file_url)
+        return list(self.iter_inputs())
+
+    def iter_inputs(self) -> Iterator[Dict[str, Any]]:
+        """
+        Like `inputs`, but parses the inputs one at a time while they are
+        downloaded, so the memory used does not depend on their number.
+        """
+        return self._iter_remote_ndjson("inputs", self.input_file_url)
 
     @property
     def errors(self) -> List[Dict[str, Any]]:
@@ -72,8 +116,15 @@ class AnnotationImport(DbObject):
             See `AnnotationImport.statuses` for more details.
         * This information will expire after 24 hours.
         """
+        return list(self.iter_errors())
+
+    def iter_errors(self) -> Iterator[Dict[str, Any]]:
+        """
+        Like `errors`, but parses the errors one at a time while they are
+        downloaded. Blocks until the import is done.
+        """
         self.wait_until_done()
-        return self._fetch_remote_ndjson(self.error_file_url)
+        return self._iter_remote_ndjson("errors", self.error_file_url)
 
     @property
     def statuses(self) -> List[Dict[str, Any]]:
@@ -101,8 +152,15 @@ class AnnotationImport(DbObject):
 
         * This information will expire after 24 hours.
         """
+        return list(self.iter_statuses())
+
+    def iter_statuses(self) -> Iterator[Dict[str, Any]]:
+        """
+        Like `statuses`, but parses the statuses one at a time while they
+        are downloaded. Blocks until the import is done.
+        """
         self.wait_until_done()
-        return self._fetch_remote_ndjson(self.status_file_url)
+        return self._iter_remote_ndjson("statuses", self.status_file_url)
 
     def wait_till_done(
         self, sleep_time_seconds: int = 10, show_progress: bool = False
@@ -149,56 +207,170 @@ class AnnotationImport(DbObject):
     def __backoff_refresh(self) -> None:
         self.refresh()
 
-    @functools.lru_cache()
-    def _fetch_remote_ndjson(self, url: str) -> List[Dict[str, Any]]:
+    def _iter_remote_ndjson(
+        self, name: str, url: str
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Fetches the remote ndjson file and caches the results.
+        Iterates over the rows of a remote ndjson file.
+
+        Files of at most `NDJSON_CACHE_MAX_ROWS` rows are cached once read
+        completely, the last one read from `url` under each `name`.
         Args:
+            name (str): Name of the file in the cache, e.g. "statuses".
             url (str): Can be any url pointing to an ndjson file.
         Returns:
-            ndjson as a list of dicts.
+            An iterator over the rows of the file, as dicts.
         """
+        cached = self._ndjson_cache.get(name)
+        if cached is not None and cached[0] == url:
+            return iter(cached[1])
+
         if self.state == AnnotationImportState.FAILED:
             raise ValueError("Import failed.")
-
-        response = requests.get(url)
-        response.raise_for_status()
-        return parser.loads(response.text)
+        return self._stream_remote_ndjson(name, url)
+
+    def _stream_remote_ndjson(
+        self, name: str, url: str
+    ) -> Iterator[Dict[str, Any]]:
+        rows: Optional[List[Dict[str, Any]]] = []
+        with self.client.download_connection.get(url, stream=True) as response:
+            response.raise_for_status()
+            for row in parser.iter_loads(response.iter_lines()):
+                if rows is not None:
+                    if len(rows) < NDJSON_CACHE_MAX_ROWS:
+                        rows.append(row)
+                    else:
+                        rows = None
+                yield row
+        if rows is not None:
+            self._ndjson_cache[name] = (url, rows)
 
     @classmethod
     def _create_from_bytes(
-        cls, client, variables, query_str, file_name, bytes_data
+        cls,
+        client,
+        variables,
+        query_str,
+        file_name,
+        bytes_data: Union[bytes, BinaryIO],
     ) -> Dict[str, Any]:
+        """Sends ndjson as the file of a multipart request. Seekable file
+        objects are streamed from their current position."""
+        if isinstance(bytes_data, (bytes, bytearray)):
+            bytes_data = io.BytesIO(bytes_data)
         operations = json.dumps({"variables": variables, "query": query_str})
-        data = {
-            "operations": operations,
-            "map": (None, json.dumps({file_name: ["variables.file"]})),
-        }
-        file_data = (file_name, bytes_data, NDJSON_MIME_TYPE)
-        files = {file_name: file_data}
-        return client.execute(data=data, files=files)
+        start = bytes_data.tell()
+        size = bytes_data.seek(0, os.SEEK_END) - start
+        bytes_data.seek(start)
+        body = MultipartFileStream(
+            fields={
+                "operations": operations,
+                "map": json.dumps({file_name: ["variables.file"]}),
+            },
+            file_field=file_name,
+            file=bytes_data,
+            size=size,
+            filename=file_name,
+            content_type=NDJSON_MIME_TYPE,
+        )
+        return client.execute(data=body, content_type=body.content_type)
 
     @classmethod
     def _get_ndjson_from_objects(
         cls,
-        objects: Union[List[Dict[str, Any]], List["Label"]],
+        objects: Iterable[Union[Dict[str, Any], "Label"]],
         object_name: str,
-    ) -> BinaryIO:
-        if not isinstance(objects, list):
+        confidence_warning: Optional[str] = None,
+    ) -> Tuple[BinaryIO, int]:
+        """Serializes and validates objects into ndjson, one object at a time.
+
+        The ndjson is written to a temporary file, kept in memory up to
+        `NDJSON_SPOOL_MAX_SIZE` bytes, so that objects can come from a
+        generator and need not fit in memory at once.
+
+        Args:
+            objects: Annotations as dicts, or Labels.
+            object_name: Name of the objects in error messages.
+            confidence_warning: Logged if any object has a confidence score.
+        Returns:
+            The ndjson file, positioned at its start, and its size in bytes.
+            The caller must close the file.
+        """
+        (shard,) = cls._get_ndjson_shards_from_objects(
+            objects, object_name, 1, confidence_warning
+        )
+        return shard
+
+    @classmethod
+    def _get_ndjson_shards_from_objects(
+        cls,
+        objects: Iterable[Union[Dict[str, Any], "Label"]],
+        object_name: str,
+        shard_count: int,
+        confidence_warning: Optional[str] = None,
+    ) -> List[Tuple[BinaryIO, int]]:
+        """Like `_get_ndjson_from_objects`, but splits the ndjson into up to
+        `shard_count` files. All the annotations of a data row go to the same
+        file, picked from a hash of its global key or id. Empty files are not
+        returned.
+
+        All the files are open at once, so each one is kept in memory up to
+        `NDJSON_SPOOL_MAX_SIZE / shard_count` bytes only.
+        """
+        if isinstance(objects, (dict, str, bytes)) or not isinstance(
+            objects, Iterable
+        ):
             raise TypeError(
                 f"{object_name} must be in a form of list. Found {type(objects)}"
             )
 
-        objects = serialize_labels(objects)
-        cls._validate_data_rows(objects)
-
-        data_str = parser.dumps(objects)
-        if not data_str:
-            raise ValueError(f"{object_name} cannot be empty")
-
-        return data_str.encode(
-            "utf-8"
-        )  # NOTICE this method returns bytes, NOT BinaryIO... should have done  io.BytesIO(...) but not going to change this at the moment since it works and fools mypy
+        spool_max_size = max(NDJSON_SPOOL_MAX_SIZE // shard_count, 1)
+        ndjson_files = [
+            tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+            for _ in range(shard_count)
+        ]
+        has_confidence = False
+
+        def write(objects: Iterator[Dict[str, Any]]):
+            nonlocal has_confidence
+            for object in objects:
+                ndjson_file = ndjson_files[_data_row_shard(object, shard_count)]
+                if ndjson_file.tell() > 0:
+                    ndjson_file.write(b"\n")
+                ndjson_file.write(json_codec.dumps_bytes(object))
+                if confidence_warning and not has_confidence:
+                    has_confidence = LabelsConfidencePresenceChecker.check(
+                        [object]
+                    )
+                yield object
+
+        try:
+            cls._validate_data_rows(write(serialize_labels(objects)))
+            shards = []
+            for ndjson_file in ndjson_files:
+                size = ndjson_file.tell()
+                if size == 0:
+                    ndjson_file.close()
+                    continue
+                ndjson_file.seek(0)
+                shards.append((cast(BinaryIO, ndjson_file), size))
+            if not shards:
+                raise ValueError(f"{object_name} cannot be empty")
+        except BaseException:
+            for ndjson_file in ndjson_files:
+                ndjson_file.close()
+            raise
+
+        if has_confidence:
+            logger.warning(confidence_warning)
+        return shards
+
+    def _is_done(self) -> bool:
+        """Refreshes the state of a running import and returns whether it
+        is no longer running."""
+        if self.state.value == AnnotationImportState.RUNNING.value:
+            self.__backoff_refresh()
+        return self.state.value != AnnotationImportState.RUNNING.value
 
     def refresh(self) -> None:
         """Synchronizes values of all fields with the database."""
@@ -209,10 +381,11 @@ class AnnotationImport(DbObject):
         self._set_field_values(res)
 
     @classmethod
-    def _validate_data_rows(cls, objects: List[Dict[str, Any]]):
+    def _validate_data_rows(cls, objects: Iterable[Dict[str, Any]]):
         """
         Validates annotations by checking 'dataRow' is provided
-        and only one of 'id' or 'globalKey' is provided.
+        and only one of 'id' or 'globalKey' is provided. Objects are
+        iterated over once.
 
         Shows up to `max_num_errors` errors if invalidated, to prevent
         large number of error messages from being printed out
@@ -274,6 +447,10 @@ class AnnotationImport(DbObject):
 
 
 class CreatableAnnotationImport(AnnotationImport):
+    # Logged when importing annotations with confidence scores, if they
+    # are not supported.
+    _confidence_warning: Optional[str] = None
+
     @classmethod
     def create(
         cls,
@@ -282,7 +459,7 @@ class CreatableAnnotationImport(AnnotationImport):
         name: str,
         path: Optional[str] = None,
         url: Optional[str] = None,
-        labels: Union[List[Dict[str, Any]], List["Label"]] = [],
+        labels: Iterable[Union[Dict[str, Any], "Label"]] = [],
     ) -> "AnnotationImport":
         if not is_exactly_one_set(url, labels, path):
             raise ValueError(
@@ -312,10 +489,201 @@ class CreatableAnnotationImport(AnnotationImport):
         client: "labelbox.Client",
         id: str,
         name: str,
-        labels: Union[List[Dict[str, Any]], List["Label"]],
+        labels: Iterable[Union[Dict[str, Any], "Label"]],
     ) -> "AnnotationImport":
         raise NotImplementedError("Inheriting class must override")
 
+    @classmethod
+    def create_sharded_from_objects(
+        cls,
+        client: "labelbox.Client",
+        id: str,
+        name: str,
+        labels: Iterable[Union[Dict[str, Any], "Label"]],
+        shard_count: int = IMPORT_SHARD_COUNT,
+        max_concurrent_imports: int = IMPORT_SHARD_CONCURRENCY,
+    ) -> "ShardedAnnotationImport":
+        """
+        Creates several import jobs from annotations, run in parallel by the
+        server, see `create_from_objects`.
+
+        The annotations are split into up to `shard_count` imports named
+        `{name}-{i}`. All the annotations of a data row go to the same
+        import, as long as they all reference it by the same global key or
+        id, so limits per data row and relationships hold in each import.
+
+        If some of the imports cannot be created, the ones that were are
+        still returned, and the errors of the others are in the `failures`
+        of the returned `ShardedAnnotationImport`. Raises the error of the
+        first import if none could be created.
+
+        >>> sharded_import = MALPredictionImport.create_sharded_from_objects(
+        >>>     client, project.uid, "predictions", label_generator)
+        >>> sharded_import.wait_until_done()
+        >>> sharded_import.errors
+
+        Args:
+            client: Labelbox Client for executing queries
+            id: Project or model run to import the annotations into
+            name: Prefix of the names of the import jobs
+            labels: Annotations or Labels, as a list or any iterable
+            shard_count: Maximum number of import jobs
+            max_concurrent_imports: Number of import jobs uploaded at once
+        Returns:
+            ShardedAnnotationImport
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        if max_concurrent_imports < 1:
+            raise ValueError("max_concurrent_imports must be at least 1")
+
+        shards = cls._get_ndjson_shards_from_objects(
+            labels, "labels", shard_count, cls._confidence_warning
+        )
+
+        def create(shard: Tuple[int, Tuple[BinaryIO, int]]):
+            i, (data, size) = shard
+            shard_name = f"{name}-{i}"
+            # catches the error so that the other imports are still created
+            # and returned
+            try:
+                with data:
+                    return shard_name, cls._create_from_ndjson(
+                        client, id, shard_name, data, size
+                    )
+            except Exception as e:
+                logger.warning("Failed to create import %s: %s", shard_name, e)
+                return shard_name, e
+
+        imports: List[CreatableAnnotationImport] = []
+        failures: Dict[str, Exception] = {}
+        try:
+            for shard_name, result in _map_in_threads(
+                create, enumerate(shards), max_concurrent_imports
+            ):
+                if isinstance(result, Exception):
+                    failures[shard_name] = result
+                else:
+                    imports.append(result)
+        finally:
+            for data, _ in shards:
+                data.close()
+        if not imports:
+            raise next(iter(failures.values()))
+        return ShardedAnnotationImport(imports, failures)
+
+    @classmethod
+    def _create_from_ndjson(
+        cls,
+        client: "labelbox.Client",
+        id: str,
+        name: str,
+        data: BinaryIO,
+        size: int,
+    ) -> "CreatableAnnotationImport":
+        raise NotImplementedError("Inheriting class must override")
+
+
+class ShardedAnnotationImport:
+    """
+    An annotation import split into several import jobs, created by
+    `create_sharded_from_objects`. Its statuses, errors and inputs are the
+    ones of all the jobs.
+
+    `failures` maps the names of the jobs that could not be created to their
+    errors. Their annotations are not imported.
+    """
+
+    def __init__(
+        self,
+        imports: List[CreatableAnnotationImport],
+        failures: Optional[Dict[str, Exception]] = None,
+    ):
+        self.imports = imports
+        self.failures = failures or {}
+
+    @property
+    def state(self) -> AnnotationImportState:
+        """FAILED if any job failed or could not be created, else RUNNING if
+        any job is running, else FINISHED. Updated by `wait_until_done`."""
+        if self.failures:
+            return AnnotationImportState.FAILED
+        states = {i.state.value for i in self.imports}
+        for state in (
+            AnnotationImportState.FAILED,
+            AnnotationImportState.RUNNING,
+        ):
+            if state.value in states:
+                return state
+        return AnnotationImportState.FINISHED
+
+    @property
+    def inputs(self) -> List[Dict[str, Any]]:
+        """Inputs of all the import jobs, see `AnnotationImport.inputs`."""
+        return self._merge(lambda i: i.inputs)
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        """Errors of all the import jobs, see `AnnotationImport.errors`."""
+        self.wait_until_done()
+        return self._merge(lambda i: i.errors)
+
+    @property
+    def statuses(self) -> List[Dict[str, Any]]:
+        """Statuses of all the import jobs, see `AnnotationImport.statuses`."""
+        self.wait_until_done()
+        return self._merge(lambda i: i.statuses)
+
+    def iter_inputs(self) -> Iterator[Dict[str, Any]]:
+        """Like `inputs`, but streams the inputs of one job after the other,
+        see `AnnotationImport.iter_inputs`."""
+        return chain.from_iterable(i.iter_inputs() for i in self.imports)
+
+    def iter_errors(self) -> Iterator[Dict[str, Any]]:
+        """Like `errors`, but streams the errors of one job after the other."""
+        self.wait_until_done()
+        return chain.from_iterable(i.iter_errors() for i in self.imports)
+
+    def iter_statuses(self) -> Iterator[Dict[str, Any]]:
+        """Like `statuses`, but streams the statuses of one job after the
+        other."""
+        self.wait_until_done()
+        return chain.from_iterable(i.iter_statuses() for i in self.imports)
+
+    def wait_until_done(
+        self,
+        sleep_time_seconds: int = 10,
+        timeout_seconds: Optional[float] = None,
+    ) -> bool:
+        """Blocks until all the import jobs are done, polling the jobs still
+        running together.
+
+        Args:
+            sleep_time_seconds (int): Maximum time between two polls.
+            timeout_seconds (float): Time after which to stop waiting, waits
+                until the jobs are done if None.
+        Returns:
+            Whether all the jobs are done.
+        """
+        return polling.poll_all(
+            [i._is_done for i in self.imports],
+            math.inf if timeout_seconds is None else timeout_seconds,
+            max_interval=sleep_time_seconds,
+        )
+
+    def _merge(
+        self,
+        results: Callable[[AnnotationImport], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        # downloads the results of the jobs concurrently
+        return list(
+            chain.from_iterable(
+                _map_in_threads(
+                    results, self.imports, polling.MAX_CONCURRENT_CHECKS
+                )
+            )
+        )
+
 
 class MEAPredictionImport(CreatableAnnotationImport):
     model_run_id = Field.String("model_run_id")
@@ -356,7 +724,7 @@ class MEAPredictionImport(CreatableAnnotationImport):
         client: "labelbox.Client",
         model_run_id: str,
         name,
-        predictions: Union[List[Dict[str, Any]], List["Label"]],
+        predictions: Iterable[Union[Dict[str, Any], "Label"]],
     ) -> "MEAPredictionImport":
         """
         Create an MEA prediction import job from an in memory dictionary
@@ -365,15 +733,17 @@ class MEAPredictionImport(CreatableAnnotationImport):
             client: Labelbox Client for executing queries
             model_run_id: Model run to import labels into
             name: Name of the import job. Can be used to reference the task later
-            predictions: List of prediction annotations
+            predictions: Prediction annotations or Labels, as a list or any
+                iterable (e.g. a LabelGenerator). They are serialized to a
+                temporary file one at a time, and the file is streamed.
         Returns:
             MEAPredictionImport
         """
-        data = cls._get_ndjson_from_objects(predictions, "annotations")
-
-        return cls._create_mea_import_from_bytes(
-            client, model_run_id, name, data, len(str(data))
-        )
+        data, size = cls._get_ndjson_from_objects(predictions, "annotations")
+        with data:
+            return cls._create_mea_import_from_bytes(
+                client, model_run_id, name, data, size
+            )
 
     @classmethod
     def create_from_url(
@@ -391,7 +761,7 @@ class MEAPredictionImport(CreatableAnnotationImport):
         Returns:
             MEAPredictionImport
         """
-        if requests.head(url):
+        if client.download_connection.head(url):
             query_str = cls._get_url_mutation()
             return cls(
                 client,
@@ -460,6 +830,17 @@ class MEAPredictionImport(CreatableAnnotationImport):
         }) {%s}
         }""" % query.results_query_part(cls)
 
+    @classmethod
+    def _create_from_ndjson(
+        cls,
+        client: "labelbox.Client",
+        id: str,
+        name: str,
+        data: BinaryIO,
+        size: int,
+    ) -> "MEAPredictionImport":
+        return cls._create_mea_import_from_bytes(client, id, name, data, size)
+
     @classmethod
     def _create_mea_import_from_bytes(
         cls,
@@ -580,6 +961,11 @@ class MEAToMALPredictionImport(AnnotationImport):
 class MALPredictionImport(CreatableAnnotationImport):
     project = Relationship.ToOne("Project", cache=True)
 
+    _confidence_warning = """
+                Confidence scores are not supported in MAL Prediction Import.
+                Corresponding confidence score values will be ignored.
+                """
+
     @property
     def parent_id(self) -> str:
         """
@@ -616,7 +1002,7 @@ class MALPredictionImport(CreatableAnnotationImport):
         client: "labelbox.Client",
         project_id: str,
         name: str,
-        predictions: Union[List[Dict[str, Any]], List["Label"]],
+        predictions: Iterable[Union[Dict[str, Any], "Label"]],
     ) -> "MALPredictionImport":
         """
         Create an MAL prediction import job from an in memory dictionary
@@ -625,25 +1011,20 @@ class MALPredictionImport(CreatableAnnotationImport):
             client: Labelbox Client for executing queries
             project_id: Project to import labels into
             name: Name of the import job. Can be used to reference the task later
-            predictions: List of prediction annotations
+            predictions: Prediction annotations or Labels, as a list or any
+                iterable (e.g. a LabelGenerator). They are serialized to a
+                temporary file one at a time, and the file is streamed.
         Returns:
             MALPredictionImport
         """
 
-        data = cls._get_ndjson_from_objects(predictions, "annotations")
-        if len(predictions) > 0 and isinstance(predictions[0], Dict):
-            predictions_dicts = cast(List[Dict[str, Any]], predictions)
-            has_confidence = LabelsConfidencePresenceChecker.check(
-                predictions_dicts
-            )
-            if has_confidence:
-                logger.warning("""
-                Confidence scores are not supported in MAL Prediction Import.
-                Corresponding confidence score values will be ignored.
-                """)
-        return cls._create_mal_import_from_bytes(
-            client, project_id, name, data, len(str(data))
+        data, size = cls._get_ndjson_from_objects(
+            predictions, "annotations", cls._confidence_warning
         )
+        with data:
+            return cls._create_mal_import_from_bytes(
+                client, project_id, name, data, size
+            )
 
     @classmethod
     def create_from_url(
@@ -661,7 +1042,7 @@ class MALPredictionImport(CreatableAnnotationImport):
         Returns:
             MALPredictionImport
         """
-        if requests.head(url):
+        if client.download_connection.head(url):
             query_str = cls._get_url_mutation()
             return cls(
                 client,
@@ -730,6 +1111,17 @@ class MALPredictionImport(CreatableAnnotationImport):
         }) {%s}
         }""" % query.results_query_part(cls)
 
+    @classmethod
+    def _create_from_ndjson(
+        cls,
+        client: "labelbox.Client",
+        id: str,
+        name: str,
+        data: BinaryIO,
+        size: int,
+    ) -> "MALPredictionImport":
+        return cls._create_mal_import_from_bytes(client, id, name, data, size)
+
     @classmethod
     def _create_mal_import_from_bytes(
         cls,
@@ -756,6 +1148,11 @@ class MALPredictionImport(CreatableAnnotationImport):
 class LabelImport(CreatableAnnotationImport):
     project = Relationship.ToOne("Project", cache=True)
 
+    _confidence_warning = """
+                Confidence scores are not supported in Label Import.
+                Corresponding confidence score values will be ignored.
+                """
+
     @property
     def parent_id(self) -> str:
         """
@@ -792,7 +1189,7 @@ class LabelImport(CreatableAnnotationImport):
         client: "labelbox.Client",
         project_id: str,
         name: str,
-        labels: Union[List[Dict[str, Any]], List["Label"]],
+        labels: Iterable[Union[Dict[str, Any], "Label"]],
     ) -> "LabelImport":
         """
         Create a label import job from an in memory dictionary
@@ -801,23 +1198,19 @@ class LabelImport(CreatableAnnotationImport):
             client: Labelbox Client for executing queries
             project_id: Project to import labels into
             name: Name of the import job. Can be used to reference the task later
-            labels: List of labels
+            labels: Annotations or Labels, as a list or any iterable (e.g. a
+                LabelGenerator). They are serialized to a temporary file one
+                at a time, and the file is streamed.
         Returns:
             LabelImport
         """
-        data = cls._get_ndjson_from_objects(labels, "labels")
-
-        if len(labels) > 0 and isinstance(labels[0], Dict):
-            label_dicts = cast(List[Dict[str, Any]], labels)
-            has_confidence = LabelsConfidencePresenceChecker.check(label_dicts)
-            if has_confidence:
-                logger.warning("""
-                Confidence scores are not supported in Label Import.
-                Corresponding confidence score values will be ignored.
-                """)
-        return cls._create_label_import_from_bytes(
-            client, project_id, name, data, len(str(data))
+        data, size = cls._get_ndjson_from_objects(
+            labels, "labels", cls._confidence_warning
         )
+        with data:
+            return cls._create_label_import_from_bytes(
+                client, project_id, name, data, size
+            )
 
     @classmethod
     def create_from_url(
@@ -835,7 +1228,7 @@ class LabelImport(CreatableAnnotationImport):
         Returns:
             LabelImport
         """
-        if requests.head(url):
+        if client.download_connection.head(url):
             query_str = cls._get_url_mutation()
             return cls(
                 client,
@@ -904,6 +1297,17 @@ class LabelImport(CreatableAnnotationImport):
         }) {%s}
         }""" % query.results_query_part(cls)
 
+    @classmethod
+    def _create_from_ndjson(
+        cls,
+        client: "labelbox.Client",
+        id: str,
+        name: str,
+        data: BinaryIO,
+        size: int,
+    ) -> "LabelImport":
+        return cls._create_label_import_from_bytes(client, id, name, data, size)
+
     @classmethod
     def _create_label_import_from_bytes(
         cls,
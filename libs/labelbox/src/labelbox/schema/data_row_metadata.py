@@ -3,13 +3,16 @@ import warnings
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from itertools import chain
 from typing import (
     Annotated,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generator,
+    Iterable,
     List,
     Optional,
     Type,
@@ -17,6 +20,8 @@ from typing import (
     overload,
 )
 
+from google.api_core import retry
+from lbox.exceptions import ApiLimitError
 from pydantic import (
     BaseModel,
     BeforeValidator,
@@ -33,6 +38,7 @@ from labelbox.schema.identifiables import DataRowIdentifiers, UniqueIds
 from labelbox.schema.ontology import SchemaId
 from labelbox.utils import (
     _CamelCaseMixin,
+    _map_in_threads,
     format_iso_datetime,
     format_iso_from_string,
 )
@@ -143,6 +149,7 @@ _BatchInputs = Union[
     List[_UpsertBatchDataRowMetadata], List[_DeleteBatchDataRowMetadata]
 ]
 _BatchFunction = Callable[[_BatchInputs], List[DataRowMetadataBatchResponse]]
+_UpsertValidator = Callable[[DataRowMetadataField], List[Dict[str, Any]]]
 
 
 class _UpsertCustomMetadataSchemaEnumOptionInput(_CamelCaseMixin):
@@ -178,6 +185,8 @@ class DataRowMetadataOntology:
     def __init__(self, client):
         self._client = client
         self._batch_size = 50  # used for uploads and deletes
+        # number of batches sent to the server at once by bulk operations
+        self._max_concurrent_batches = 1
 
         self._raw_ontology = self._get_ontology()
         self._build_ontology()
@@ -211,6 +220,13 @@ class DataRowMetadataOntology:
             self._make_normalized_name_index(self.custom_fields)
         )
 
+        # upsert validators, compiled once per schema
+        self._upsert_validators: Dict[SchemaId, _UpsertValidator] = {
+            f.uid: _make_upsert_validator(f)
+            for f in self.fields
+            if f.kind != DataRowMetadataKind.option
+        }
+
     @staticmethod
     def _lookup_in_index_by_name(reserved_index, custom_index, name):
         # search through reserved names first
@@ -241,6 +257,12 @@ class DataRowMetadataOntology:
             self.reserved_by_name, self.custom_by_name, name
         )
 
+    def _has_name_normalized(self, name: str) -> bool:
+        return (
+            name in self.reserved_by_name_normalized
+            or name in self.custom_by_name_normalized
+        )
+
     def _get_by_name_normalized(self, name: str) -> DataRowMetadataSchema:
         """Get metadata by name. For options, it provides the option schema instead of list of
         options
@@ -552,7 +574,10 @@ class DataRowMetadataOntology:
         return parsed
 
     def bulk_upsert(
-        self, metadata: List[DataRowMetadata]
+        self,
+        metadata: List[DataRowMetadata],
+        batch_size: Optional[int] = None,
+        max_concurrent_batches: Optional[int] = None,
     ) -> List[DataRowMetadataBatchResponse]:
         """Upsert metadata to a list of data rows
 
@@ -569,6 +594,11 @@ class DataRowMetadataOntology:
 
         Args:
             metadata: List of DataRow Metadata to upsert
+            batch_size: Number of data rows upserted per request. Defaults to 50
+            max_concurrent_batches: Maximum number of requests in flight at
+                once. Defaults to 1, requests are sent sequentially. Concurrent
+                requests that hit the API rate limit are retried for up to 10
+                minutes.
 
         Returns:
             list of unsuccessful upserts.
@@ -619,11 +649,20 @@ class DataRowMetadataOntology:
                     ),
                 ).model_dump(by_alias=True)
             )
-        res = _batch_operations(_batch_upsert, items, self._batch_size)
+        res = _batch_operations(
+            _batch_upsert,
+            items,
+            batch_size=batch_size or self._batch_size,
+            max_concurrent_batches=max_concurrent_batches
+            or self._max_concurrent_batches,
+        )
         return res
 
     def bulk_delete(
-        self, deletes: List[DeleteDataRowMetadata]
+        self,
+        deletes: List[DeleteDataRowMetadata],
+        batch_size: Optional[int] = None,
+        max_concurrent_batches: Optional[int] = None,
     ) -> List[DataRowMetadataBatchResponse]:
         """Delete metadata from a datarow by specifiying the fields you want to remove
 
@@ -663,6 +702,11 @@ class DataRowMetadataOntology:
                 For data row, we support UniqueId, str, and GlobalKey.
                 If you pass a str, we will assume it is a UniqueId
                 Do not pass a mix of data row ids and global keys in the same list
+            batch_size: Number of data rows deleted from per request. Defaults to 50
+            max_concurrent_batches: Maximum number of requests in flight at
+                once. Defaults to 1, requests are sent sequentially. Concurrent
+                requests that hit the API rate limit are retried for up to 10
+                minutes.
 
         Returns:
             list of unsuccessful deletions.
@@ -713,20 +757,34 @@ class DataRowMetadataOntology:
 
         items = [self._validate_delete(m) for m in deletes]
         return _batch_operations(
-            _batch_delete, items, batch_size=self._batch_size
+            _batch_delete,
+            items,
+            batch_size=batch_size or self._batch_size,
+            max_concurrent_batches=max_concurrent_batches
+            or self._max_concurrent_batches,
         )
 
     @overload
-    def bulk_export(self, data_row_ids: List[str]) -> List[DataRowMetadata]:
+    def bulk_export(
+        self,
+        data_row_ids: List[str],
+        batch_size: Optional[int] = None,
+        max_concurrent_batches: Optional[int] = None,
+    ) -> List[DataRowMetadata]:
         pass
 
     @overload
     def bulk_export(
-        self, data_row_ids: DataRowIdentifiers
+        self,
+        data_row_ids: DataRowIdentifiers,
+        batch_size: Optional[int] = None,
+        max_concurrent_batches: Optional[int] = None,
     ) -> List[DataRowMetadata]:
         pass
 
-    def bulk_export(self, data_row_ids) -> List[DataRowMetadata]:
+    def bulk_export(
+        self, data_row_ids, batch_size=None, max_concurrent_batches=None
+    ) -> List[DataRowMetadata]:
         """Exports metadata for a list of data rows
 
         >>> mdo.bulk_export([data_row.uid for data_row in data_rows])
@@ -734,6 +792,11 @@ class DataRowMetadataOntology:
         Args:
             data_row_ids: List of data data rows to fetch metadata for. This can be a list of strings or a DataRowIdentifiers object
             DataRowIdentifier objects are lists of ids or global keys. A DataIdentifier object can be a UniqueIds or GlobalKeys class.
+            batch_size: Number of data rows exported per request. Defaults to 50
+            max_concurrent_batches: Maximum number of requests in flight at
+                once. Defaults to 1, requests are sent sequentially. Concurrent
+                requests that hit the API rate limit are retried for up to 10
+                minutes.
         Returns:
             A list of DataRowMetadata.
             There will be one DataRowMetadata for each data_row_id passed in.
@@ -778,7 +841,11 @@ class DataRowMetadataOntology:
             )
 
         return _batch_operations(
-            _bulk_export, data_row_ids, batch_size=self._batch_size
+            _bulk_export,
+            data_row_ids,
+            batch_size=batch_size or self._batch_size,
+            max_concurrent_batches=max_concurrent_batches
+            or self._max_concurrent_batches,
         )
 
     def parse_upsert_metadata(self, metadata_fields) -> List[Dict[str, Any]]:
@@ -794,31 +861,6 @@ class DataRowMetadataOntology:
             List of dictionaries representing a flattened view of metadata fields
         """
 
-        def _convert_metadata_field(metadata_field):
-            if isinstance(metadata_field, DataRowMetadataField):
-                return metadata_field
-            elif isinstance(metadata_field, dict):
-                if "value" not in metadata_field:
-                    raise ValueError(
-                        f"Custom metadata field '{metadata_field}' must have a 'value' key"
-                    )
-                if (
-                    "schema_id" not in metadata_field
-                    and "name" not in metadata_field
-                ):
-                    raise ValueError(
-                        f"Custom metadata field '{metadata_field}' must have either 'schema_id' or 'name' key"
-                    )
-                return DataRowMetadataField(
-                    schema_id=metadata_field.get("schema_id"),
-                    name=metadata_field.get("name"),
-                    value=metadata_field["value"],
-                )
-            else:
-                raise ValueError(
-                    f"Metadata field '{metadata_field}' is neither 'DataRowMetadataField' type or a dictionary"
-                )
-
         # Convert all metadata fields to DataRowMetadataField type
         metadata_fields = [_convert_metadata_field(m) for m in metadata_fields]
         parsed_metadata = list(
@@ -826,6 +868,70 @@ class DataRowMetadataOntology:
         )
         return [m.model_dump(by_alias=True) for m in parsed_metadata]
 
+    def parse_upsert_metadata_batch(
+        self, metadata_fields_by_row: Iterable[List]
+    ) -> List[List[Dict[str, Any]]]:
+        """Parses the metadata fields of many data rows in one call, see
+        `parse_upsert_metadata`. Each metadata name of the batch is resolved
+        once, and the ontology is refreshed at most once, if some schema ids
+        are missing from it.
+
+        >>> mdo.parse_upsert_metadata_batch([
+        >>>     [{"name": "tag", "value": "a"}],
+        >>>     [DataRowMetadataField(schema_id="schema-id", value="b")],
+        >>> ])
+
+        Args:
+            metadata_fields_by_row: The metadata fields of each data row
+        Returns:
+            The parsed metadata fields of each data row, in the same order
+        Raises:
+            ValueError: When the metadata of some rows is invalid. The
+                message lists the error of each of these rows by its index
+        """
+        errors: Dict[int, str] = {}
+        rows: List[List[DataRowMetadataField]] = []
+        for i, metadata_fields in enumerate(metadata_fields_by_row):
+            try:
+                rows.append(
+                    [_convert_metadata_field(m) for m in metadata_fields]
+                )
+            except ValueError as e:
+                errors[i] = str(e)
+                rows.append([])
+
+        fields = list(chain.from_iterable(rows))
+        if any(
+            f.schema_id is not None and f.schema_id not in self.fields_by_id
+            for f in fields
+        ):
+            # Fetch latest metadata ontology if metadata can't be found
+            self.refresh_ontology()
+        schemas_by_name: Dict[str, DataRowMetadataSchema] = {}
+        for name in {f.name for f in fields if f.schema_id is None}:
+            if name is not None and self._has_name_normalized(name):
+                schemas_by_name[name] = self._get_by_name_normalized(name)
+
+        parsed = []
+        for i, row in enumerate(rows):
+            try:
+                parsed_row = [
+                    m.model_dump(by_alias=True)
+                    for f in row
+                    for m in self._parse_batch_upsert(f, schemas_by_name)
+                ]
+            except (ValueError, KeyError) as e:
+                errors.setdefault(i, e.args[0] if e.args else str(e))
+                parsed_row = []
+            parsed.append(parsed_row)
+
+        if errors:
+            raise ValueError(
+                "Invalid metadata in rows:\n"
+                + "\n".join(f"row {i}: {e}" for i, e in sorted(errors.items()))
+            )
+        return parsed
+
     def _upsert_schema(
         self, upsert_schema: _UpsertCustomMetadataSchemaInput
     ) -> DataRowMetadataSchema:
@@ -885,24 +991,42 @@ class DataRowMetadataOntology:
                     f"Schema Id `{metadatum.schema_id}` not found in ontology"
                 )
 
-        schema = self.fields_by_id[metadatum.schema_id]
+        return self._validate_upsert(metadatum, data_row_id)
+
+    def _parse_batch_upsert(
+        self,
+        metadatum: DataRowMetadataField,
+        schemas_by_name: Dict[str, DataRowMetadataSchema],
+    ) -> List[_UpsertDataRowMetadataInput]:
+        """Like `_parse_upsert`, with the names resolved and the ontology
+        refreshed beforehand for the whole batch."""
+        if metadatum.schema_id is None:
+            if metadatum.name not in schemas_by_name:
+                raise KeyError(
+                    f"There is no metadata with name '{metadatum.name}'"
+                )
+            schema = schemas_by_name[metadatum.name]
+            metadatum.schema_id = schema.uid
+            if schema.options:
+                self._load_option_by_name(metadatum)
+
+        if metadatum.schema_id not in self.fields_by_id:
+            raise ValueError(
+                f"Schema Id `{metadatum.schema_id}` not found in ontology"
+            )
+
+        return self._validate_upsert(metadatum)
+
+    def _validate_upsert(
+        self, metadatum: DataRowMetadataField, data_row_id: Optional[str] = None
+    ) -> List[_UpsertDataRowMetadataInput]:
+        validator = self._upsert_validators.get(metadatum.schema_id)
         try:
-            if schema.kind == DataRowMetadataKind.datetime:
-                parsed = _validate_parse_datetime(metadatum)
-            elif schema.kind == DataRowMetadataKind.string:
-                parsed = _validate_parse_text(metadatum)
-            elif schema.kind == DataRowMetadataKind.number:
-                parsed = _validate_parse_number(metadatum)
-            elif schema.kind == DataRowMetadataKind.embedding:
-                parsed = _validate_parse_embedding(metadatum)
-            elif schema.kind == DataRowMetadataKind.enum:
-                parsed = _validate_enum_parse(schema, metadatum)
-            elif schema.kind == DataRowMetadataKind.option:
+            if validator is None:
                 raise ValueError(
                     "An Option id should not be set as the Schema id"
                 )
-            else:
-                raise ValueError(f"Unknown type: {schema}")
+            parsed = validator(metadatum)
         except ValueError as e:
             error_str = f"Could not validate metadata [{metadatum}]"
             if data_row_id:
@@ -948,6 +1072,14 @@ class DataRowMetadataOntology:
         return self.custom_by_name_normalized[name]
 
 
+_API_LIMIT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(ApiLimitError),
+    initial=1.0,
+    maximum=60.0,
+    timeout=600.0,
+)
+
+
 def _batch_items(iterable: List[Any], size: int) -> Generator[Any, None, None]:
     for ndx in range(0, len(iterable), size):
         yield iterable[ndx : min(ndx + size, len(iterable))]
@@ -957,14 +1089,61 @@ def _batch_operations(
     batch_function: _BatchFunction,
     items: List,
     batch_size: int = 100,
+    max_concurrent_batches: int = 1,
 ):
-    response = []
+    """Applies batch_function to consecutive batches of items and concatenates
+    the results in the order of items.
+
+    With max_concurrent_batches > 1, batches are sent from a thread pool and
+    at most max_concurrent_batches requests are in flight at once. Batches that
+    hit the API rate limit are then retried with exponential backoff and
+    jitter, for up to 10 minutes. Sequential batches are not retried.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive. Found {batch_size}")
+    if max_concurrent_batches < 1:
+        raise ValueError(
+            "max_concurrent_batches must be positive. "
+            f"Found {max_concurrent_batches}"
+        )
+
+    batches = _batch_items(items, batch_size)
+    if max_concurrent_batches == 1:
+        results = map(batch_function, batches)
+    else:
+        results = _map_in_threads(
+            _API_LIMIT_RETRY(batch_function), batches, max_concurrent_batches
+        )
 
-    for batch in _batch_items(items, batch_size):
-        response += batch_function(batch)
+    response = []
+    for result in results:
+        response += result
     return response
 
 
+def _convert_metadata_field(metadata_field) -> DataRowMetadataField:
+    if isinstance(metadata_field, DataRowMetadataField):
+        return metadata_field
+    elif isinstance(metadata_field, dict):
+        if "value" not in metadata_field:
+            raise ValueError(
+                f"Custom metadata field '{metadata_field}' must have a 'value' key"
+            )
+        if "schema_id" not in metadata_field and "name" not in metadata_field:
+            raise ValueError(
+                f"Custom metadata field '{metadata_field}' must have either 'schema_id' or 'name' key"
+            )
+        return DataRowMetadataField(
+            schema_id=metadata_field.get("schema_id"),
+            name=metadata_field.get("name"),
+            value=metadata_field["value"],
+        )
+    else:
+        raise ValueError(
+            f"Metadata field '{metadata_field}' is neither 'DataRowMetadataField' type or a dictionary"
+        )
+
+
 def _validate_parse_embedding(
     field: DataRowMetadataField,
 ) -> List[Dict[str, Union[SchemaId, Embedding]]]:
@@ -1020,10 +1199,14 @@ def _validate_parse_text(
 
 
 def _validate_enum_parse(
-    schema: DataRowMetadataSchema, field: DataRowMetadataField
+    schema: DataRowMetadataSchema,
+    field: DataRowMetadataField,
+    option_ids: Optional[FrozenSet[SchemaId]] = None,
 ) -> List[Dict[str, Union[SchemaId, dict]]]:
     if schema.options:
-        if field.value not in {o.uid for o in schema.options}:
+        if option_ids is None:
+            option_ids = frozenset(o.uid for o in schema.options)
+        if field.value not in option_ids:
             raise ValueError(
                 f"Option `{field.value}` not found for {field.schema_id}"
             )
@@ -1036,6 +1219,26 @@ def _validate_enum_parse(
     ]
 
 
+def _make_upsert_validator(schema: DataRowMetadataSchema) -> _UpsertValidator:
+    """Returns the function validating and formatting upserts of a schema"""
+    if schema.kind == DataRowMetadataKind.datetime:
+        return _validate_parse_datetime
+    elif schema.kind == DataRowMetadataKind.string:
+        return _validate_parse_text
+    elif schema.kind == DataRowMetadataKind.number:
+        return _validate_parse_number
+    elif schema.kind == DataRowMetadataKind.embedding:
+        return _validate_parse_embedding
+    elif schema.kind == DataRowMetadataKind.enum:
+        option_ids = frozenset(o.uid for o in schema.options or [])
+        return partial(_validate_enum_parse, schema, option_ids=option_ids)
+
+    def _unknown_type(field: DataRowMetadataField):
+        raise ValueError(f"Unknown type: {schema}")
+
+    return _unknown_type
+
+
 def _parse_metadata_schema(
     unparsed: Dict[str, Union[str, List]],
 ) -> DataRowMetadataSchema:
@@ -5,7 +5,16 @@ import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import islice
 from string import Template
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from lbox.exceptions import (
     InvalidQueryError,
@@ -476,6 +485,9 @@ class Dataset(DbObject, Updateable, Deletable):
         """
         Upserts data rows in this dataset. When "key" is provided, and it references an existing data row,
         an update will be performed. When "key" is not provided a new data row will be created.
+        `items` can be a list, checked for empty items before anything is uploaded, or an iterator,
+        e.g. a generator. An iterator is consumed once, while the chunks are being uploaded, so it
+        does not need to fit in memory, and fails at its first empty item.
 
         >>>     task = dataset.upsert_data_rows([
         >>>         # create new data row
@@ -503,12 +515,20 @@ class Dataset(DbObject, Updateable, Deletable):
         >>>     ])
         >>>     task.wait_till_done()
         """
-        specs = DataRowUpsertItem.build(self.uid, items, (UniqueId, GlobalKey))
+        specs: Iterable[DataRowItemBase]
+        if isinstance(items, Iterator):
+            specs = DataRowUpsertItem.iter_build(
+                self.uid, items, (UniqueId, GlobalKey)
+            )
+        else:
+            specs = DataRowUpsertItem.build(
+                self.uid, items, (UniqueId, GlobalKey)
+            )
         return self._exec_upsert_data_rows(specs, file_upload_thread_count)
 
     def _exec_upsert_data_rows(
         self,
-        specs: List[DataRowItemBase],
+        specs: Iterable[DataRowItemBase],
         file_upload_thread_count: int = FILE_UPLOAD_THREAD_COUNT,
     ) -> "DataUpsertTask":
         manifest = data_row_uploader.upload_in_chunks(
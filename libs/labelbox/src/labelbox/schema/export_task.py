@@ -1,8 +1,9 @@
 import json
 import os
-import tempfile
 import warnings
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
@@ -18,9 +19,10 @@ from typing import (
     Union,
 )
 
-import requests
+from lbox import json_codec  # type: ignore
 from pydantic import BaseModel
 
+from labelbox import parser
 from labelbox.schema.task import Task
 from labelbox.utils import _CamelCaseMixin
 
@@ -107,10 +109,20 @@ class FileRetrieverStrategy(ABC):  # pylint: disable=too-few-public-methods
     def get_next_chunk(self) -> Optional[Tuple[_MetadataFileInfo, str]]:
         """Retrieves the file."""
 
+    def close(self) -> None:
+        """Releases any resources held by the strategy."""
+
     def _get_file_content(
         self, query: str, variables: dict, result_field_name: str
     ) -> Tuple[_MetadataFileInfo, str]:
         """Runs the query."""
+        file_info = self._get_file_info(query, variables, result_field_name)
+        return file_info, self._download_file(file_info)
+
+    def _get_file_info(
+        self, query: str, variables: dict, result_field_name: str
+    ) -> _MetadataFileInfo:
+        """Resolves the metadata (and signed url) of the next file."""
         res = self._ctx.client.execute(query, variables, error_log_key="errors")
         res = res["task"][result_field_name]
         file_info = _MetadataFileInfo(**res) if res else None
@@ -119,7 +131,13 @@ class FileRetrieverStrategy(ABC):  # pylint: disable=too-few-public-methods
                 f"Task {self._ctx.task_id} does not have a metadata file for the "
                 f"{self._ctx.stream_type.value} stream"
             )
-        response = requests.get(file_info.file, timeout=30)
+        return file_info
+
+    def _download_file(self, file_info: _MetadataFileInfo) -> str:
+        """Downloads the content of a file and validates its size."""
+        response = self._ctx.client.download_connection.get(
+            file_info.file, timeout=30
+        )
         response.raise_for_status()
         response.encoding = "utf-8"
         assert (
@@ -129,7 +147,7 @@ class FileRetrieverStrategy(ABC):  # pylint: disable=too-few-public-methods
             f"expected {file_info.offsets.end - file_info.offsets.start + 1} bytes, "
             f"got {len(response.content)} bytes"
         )
-        return file_info, response.text
+        return response.text
 
 
 class _Reader(ABC):  # pylint: disable=too-few-public-methods
@@ -140,27 +158,40 @@ class _Reader(ABC):  # pylint: disable=too-few-public-methods
         """Sets the retrieval strategy."""
 
     @abstractmethod
-    def read(self) -> Iterator[Tuple[_MetadataFileInfo, str]]:
-        """Reads data from the source."""
+    def read_lines(self) -> Iterator[Tuple[str, int]]:
+        """Reads data from the source line by line."""
 
 
 class _BufferedFileRetrieverByOffset(FileRetrieverStrategy):  # pylint: disable=too-few-public-methods
-    """Retrieves files by offset."""
+    """Retrieves files by offset.
 
-    def __init__(
-        self,
-        ctx: _TaskContext,
-        offset: int,
-    ) -> None:
+    Args:
+        ctx: The task context.
+        line: The line number of the row to start retrieving from. The file
+            containing it is found from the line ranges of the export files,
+            so the files before it are not downloaded.
+    """
+
+    def __init__(self, ctx: _TaskContext, line: int = 0) -> None:
         super().__init__(ctx)
-        self._current_offset = offset
+        self._current_offset = 0
         self._current_line = 0
-        if self._current_offset >= self._ctx.metadata_header.total_size:
+        self._seek_line = line
+        if line >= self._ctx.metadata_header.total_lines:
             raise ValueError(
-                f"offset is out of range, max offset is {self._ctx.metadata_header.total_size - 1}"
+                f"line is out of range, max line is {self._ctx.metadata_header.total_lines - 1}"
             )
 
     def get_next_chunk(self) -> Optional[Tuple[_MetadataFileInfo, str]]:
+        if self._seek_line:
+            return self._get_chunk_from_line()
+        file_info = self._get_next_file_info()
+        if file_info is None:
+            return None
+        return file_info, self._download_file(file_info)
+
+    def _get_next_file_info(self) -> Optional[_MetadataFileInfo]:
+        """Resolves the next file and advances the offsets past it."""
         if self._current_offset >= self._ctx.metadata_header.total_size:
             return None
         query = (
@@ -176,29 +207,208 @@ class _BufferedFileRetrieverByOffset(FileRetrieverStrategy):  # pylint: disable=
             "streamType": self._ctx.stream_type.value,
             "offset": str(self._current_offset),
         }
-        file_info, file_content = self._get_file_content(
+        file_info = self._get_file_info(
             query, variables, "exportFileFromOffset"
         )
         file_info.offsets.start = self._current_offset
         file_info.lines.start = self._current_line
         self._current_offset = file_info.offsets.end + 1
         self._current_line = file_info.lines.end + 1
+        return file_info
+
+    def _get_chunk_from_line(self) -> Tuple[_MetadataFileInfo, str]:
+        """Retrieves the file containing the line to start from, starting at
+        that line.
+
+        Files are resolved from the start of the stream, without downloading
+        them, until the one containing the line is found. Within that file
+        the line is located by counting line breaks, as only line numbers
+        are used to resume.
+        """
+        line, self._seek_line = self._seek_line, 0
+        while True:
+            file_info = self._get_next_file_info()
+            if file_info is None:
+                raise ValueError(
+                    f"Task {self._ctx.task_id} does not have line {line} in "
+                    f"the {self._ctx.stream_type.value} stream"
+                )
+            if file_info.lines.end >= line:
+                break
+        file_content = self._download_file(file_info)
+        position = 0
+        for _ in range(line - file_info.lines.start):
+            position = file_content.find("\n", position) + 1
+            if position == 0:
+                raise ValueError(
+                    f"Export file {file_info.file} does not contain line "
+                    f"{line} of the {self._ctx.stream_type.value} stream"
+                )
+        file_info.offsets.start += len(file_content[:position].encode("utf-8"))
+        file_info.lines.start = line
+        return file_info, file_content[position:]
+
+
+class _PrefetchingFileRetrieverByOffset(_BufferedFileRetrieverByOffset):  # pylint: disable=too-few-public-methods
+    """Retrieves files by offset, downloading several files concurrently.
+
+    File urls are resolved ahead of the consumer and their downloads are
+    submitted to a thread pool. At most `max_concurrent_downloads` files are
+    held in the prefetch window at any time and chunks are always returned
+    in offset order.
+    """
+
+    def __init__(
+        self,
+        ctx: _TaskContext,
+        max_concurrent_downloads: int,
+        line: int = 0,
+    ) -> None:
+        super().__init__(ctx, line)
+        if max_concurrent_downloads < 1:
+            raise ValueError("max_concurrent_downloads must be at least 1")
+        self._max_concurrent_downloads = max_concurrent_downloads
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._window: "deque[Tuple[_MetadataFileInfo, Future]]" = deque()
+        self._exhausted = False
+
+    def _fill_window(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._max_concurrent_downloads)
+        if self._seek_line:
+            first_file, file_content = self._get_chunk_from_line()
+            future: Future = Future()
+            future.set_result(file_content)
+            self._window.append((first_file, future))
+        while (
+            not self._exhausted
+            and len(self._window) < self._max_concurrent_downloads
+        ):
+            file_info = self._get_next_file_info()
+            if file_info is None:
+                self._exhausted = True
+                break
+            self._window.append(
+                (
+                    file_info,
+                    self._executor.submit(self._download_file, file_info),
+                )
+            )
+
+    def get_next_chunk(self) -> Optional[Tuple[_MetadataFileInfo, str]]:
+        self._fill_window()
+        if not self._window:
+            self.close()
+            return None
+        file_info, future = self._window.popleft()
+        try:
+            file_content = future.result()
+        except Exception:
+            self.close()
+            raise
+        # keep the window full while the caller processes this chunk
+        self._fill_window()
         return file_info, file_content
 
+    def close(self) -> None:
+        for _, future in self._window:
+            future.cancel()
+        self._window.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+@dataclass
+class ExportCheckpoint:
+    """The position of the last committed row of a buffered stream.
+
+    Attributes:
+        task_id: The id of the export task.
+        stream_type: The type of the stream.
+        offset: The byte offset of the next row to read. It is only kept
+            for reference, streams resume from `line`.
+        line: The line number of the next row to read.
+    """
+
+    task_id: str
+    stream_type: StreamType
+    offset: int
+    line: int
+
+    @staticmethod
+    def load(path: str) -> Optional["ExportCheckpoint"]:
+        """Loads a checkpoint from a file. Returns None if it does not exist."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as checkpoint_file:
+            data = json.load(checkpoint_file)
+        return ExportCheckpoint(
+            task_id=data["task_id"],
+            stream_type=StreamType(data["stream_type"]),
+            offset=data["offset"],
+            line=data["line"],
+        )
+
+    def save(self, path: str) -> None:
+        """Atomically writes the checkpoint to a file."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as checkpoint_file:
+            json.dump(
+                {
+                    "task_id": self.task_id,
+                    "stream_type": self.stream_type.value,
+                    "offset": self.offset,
+                    "line": self.line,
+                },
+                checkpoint_file,
+            )
+        os.replace(tmp_path, path)
+
 
 class BufferedStream(Generic[OutputT]):
-    """Streams data from a Reader."""
+    """Streams data from a Reader.
+
+    Args:
+        ctx: The task context.
+        max_concurrent_downloads: The number of export files downloaded
+            concurrently. When greater than 1, file urls are resolved ahead
+            of time and files are prefetched into a bounded window while rows
+            are still yielded in order.
+        line: The line number of the row to start streaming from.
+        checkpoint_file: A file that the stream periodically updates with
+            the position of the last row processed by the caller.
+        checkpoint_interval: The number of rows between checkpoint updates.
+    """
 
     def __init__(
         self,
         ctx: _TaskContext,
+        max_concurrent_downloads: int = 1,
+        line: int = 0,
+        checkpoint_file: Optional[str] = None,
+        checkpoint_interval: int = 1000,
     ):
         self._ctx = ctx
         self._reader = _BufferedGCSFileReader()
         self._converter = _BufferedJsonConverter()
-        self._reader.set_retrieval_strategy(
-            _BufferedFileRetrieverByOffset(self._ctx, 0)
-        )
+        self._checkpoint_file = checkpoint_file
+        self._checkpoint_interval = checkpoint_interval
+        # the byte offset of the first row is only known once the file
+        # containing it has been retrieved
+        self._offset = 0
+        self._line = line
+        self._done = line == ctx.metadata_header.total_lines
+        if self._done:
+            return
+        strategy: FileRetrieverStrategy
+        if max_concurrent_downloads > 1:
+            strategy = _PrefetchingFileRetrieverByOffset(
+                self._ctx, max_concurrent_downloads, line
+            )
+        else:
+            strategy = _BufferedFileRetrieverByOffset(self._ctx, line)
+        self._reader.set_retrieval_strategy(strategy)
 
     def __iter__(self):
         yield from self._fetch()
@@ -209,16 +419,76 @@ class BufferedStream(Generic[OutputT]):
         """Fetches the result data.
         Returns an iterator that yields the offset and the data.
         """
-        if self._ctx.metadata_header.total_size is None:
+        with self._converter as converter:
+            for line in self._iter_lines():
+                # while a line is being processed the stream position still
+                # points at its start
+                size = len(line.encode("utf-8"))
+                file_info = _MetadataFileInfo(
+                    offsets=Range(
+                        start=self._offset, end=self._offset + size - 1
+                    ),
+                    lines=Range(start=self._line, end=self._line + 1),
+                    file=self._reader._file_name,
+                )
+                yield from converter.convert(
+                    Converter.ConverterInputArgs(self._ctx, file_info, line)
+                )
+
+    def iter_json(self) -> Iterator[Any]:
+        """Yields each row as a parsed JSON object.
+
+        Unlike iterating over the stream, rows are not wrapped in converter
+        outputs and no per-row metadata models are built, which makes this
+        the fastest way to consume large exports.
+        """
+        # self._line is the index of the next row
+        yield from parser.iter_loads(
+            self._iter_lines(), first_line_number=self._line + 1
+        )
+
+    def iter_raw(self) -> Iterator[str]:
+        """Yields each row as its raw, undecoded JSON line."""
+        yield from self._iter_lines()
+
+    def _iter_lines(self) -> Iterator[str]:
+        """Yields the raw lines of the stream.
+
+        A line is committed, and the checkpoint advanced past it, once the
+        caller asks for the next one.
+        """
+        if self._ctx.metadata_header.total_size is None or self._done:
             return
 
-        stream = self._reader.read()
-        with self._converter as converter:
-            for file_info, raw_data in stream:
-                for output in converter.convert(
-                    Converter.ConverterInputArgs(self._ctx, file_info, raw_data)
-                ):
-                    yield output
+        uncommitted = 0
+        try:
+            for i, (line, next_offset) in enumerate(self._reader.read_lines()):
+                if i == 0:
+                    self._offset = self._reader._start_offset or 0
+                yield line
+                self._offset = next_offset
+                self._line += 1
+                uncommitted += 1
+                if uncommitted >= self._checkpoint_interval:
+                    self._save_checkpoint()
+                    uncommitted = 0
+        finally:
+            if uncommitted:
+                self._save_checkpoint()
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint_file is not None:
+            self.checkpoint.save(self._checkpoint_file)
+
+    @property
+    def checkpoint(self) -> ExportCheckpoint:
+        """Returns the position of the last row processed by the caller."""
+        return ExportCheckpoint(
+            task_id=self._ctx.task_id,
+            stream_type=self._ctx.stream_type,
+            offset=self._offset,
+            line=self._line,
+        )
 
     def start(
         self, stream_handler: Optional[Callable[[OutputT], None]] = None
@@ -245,48 +515,67 @@ class _BufferedJsonConverter(Converter[BufferedJsonConverterOutput]):
     def convert(
         self, input_args: Converter.ConverterInputArgs
     ) -> Iterator[BufferedJsonConverterOutput]:
-        yield BufferedJsonConverterOutput(json=json.loads(input_args.raw_data))
+        yield BufferedJsonConverterOutput(
+            json=json_codec.loads(input_args.raw_data)
+        )
 
 
 class _BufferedGCSFileReader(_Reader):
-    """Reads data from multiple GCS files and buffer them to disk"""
+    """Reads data from multiple GCS files and streams it line by line.
+
+    Lines are yielded as soon as the chunk containing them has been
+    retrieved. A line that is split across two chunks is carried over and
+    completed with the next chunk, so only the current chunk (plus whatever
+    the retrieval strategy prefetches) is held in memory.
+    """
 
     def __init__(self):
         super().__init__()
         self._retrieval_strategy = None
+        self._start_offset: Optional[int] = None
+        self._start_line = 0
+        self._file_name = ""
 
     def set_retrieval_strategy(self, strategy: FileRetrieverStrategy) -> None:
         """Sets the retrieval strategy."""
         self._retrieval_strategy = strategy
 
-    def read(self) -> Iterator[Tuple[_MetadataFileInfo, str]]:
+    def read_lines(self) -> Iterator[Tuple[str, int]]:
+        """Reads the data line by line without building any metadata models.
+
+        Yields:
+            The line and the byte offset right after it.
+        """
         if not self._retrieval_strategy:
             raise ValueError("retrieval strategy not set")
-        # create a buffer
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+        # the offsets reported for each chunk are not reliable, so chunks are
+        # treated as consecutive pieces of a single file and only line breaks
+        # are used to delimit rows
+        offset = 0
+        carry = ""
+        try:
             result = self._retrieval_strategy.get_next_chunk()
             while result:
-                _, raw_data = result
-                # there is something wrong with the way the offsets are being calculated
-                # so just write all of the chunks as is too the file, with pointer initially
-                # pointed to the start of the file (like what is in GCS) and do not
-                # rely on offsets for file location
-                # temp_file.seek(file_info.offsets.start)
-                temp_file.write(raw_data)
+                file_info, raw_data = result
+                if self._start_offset is None:
+                    self._start_offset = offset = file_info.offsets.start
+                    self._start_line = file_info.lines.start
+                self._file_name = file_info.file
+                lines = (carry + raw_data).split("\n")
+                carry = lines.pop()
+                for line in lines:
+                    line += "\n"
+                    offset += (
+                        len(line)
+                        if line.isascii()
+                        else len(line.encode("utf-8"))
+                    )
+                    yield line, offset
                 result = self._retrieval_strategy.get_next_chunk()
-        # read buffer
-        with open(temp_file.name, "r") as temp_file_reopened:
-            for idx, line in enumerate(temp_file_reopened):
-                yield (
-                    _MetadataFileInfo(
-                        offsets=Range(start=0, end=len(line) - 1),
-                        lines=Range(start=idx, end=idx + 1),
-                        file=temp_file.name,
-                    ),
-                    line,
-                )
-        # manually delete buffer
-        os.unlink(temp_file.name)
+        finally:
+            self._retrieval_strategy.close()
+        if carry:
+            yield carry, offset + len(carry.encode("utf-8"))
 
 
 class ExportTask:
@@ -421,22 +710,21 @@ class ExportTask:
         if not self.has_errors():
             return None
 
-        data = []
-
         metadata_header = ExportTask._get_metadata_header(
             self._task.client, self._task.uid, StreamType.ERRORS
         )
         if metadata_header is None:
             return None
-        BufferedStream(
-            _TaskContext(
-                self._task.client,
-                self._task.uid,
-                StreamType.ERRORS,
-                metadata_header,
-            ),
-        ).start(stream_handler=lambda output: data.append(output.json))
-        return data
+        return list(
+            BufferedStream(
+                _TaskContext(
+                    self._task.client,
+                    self._task.uid,
+                    StreamType.ERRORS,
+                    metadata_header,
+                ),
+            ).iter_json()
+        )
 
     @property
     def result(self):
@@ -446,22 +734,21 @@ class ExportTask:
                 raise ExportTask.ExportTaskException("Task failed")
             if self.status != "COMPLETE":
                 raise ExportTask.ExportTaskException("Task is not ready yet")
-            data = []
-
             metadata_header = ExportTask._get_metadata_header(
                 self._task.client, self._task.uid, StreamType.RESULT
             )
             if metadata_header is None:
                 return []
-            BufferedStream(
-                _TaskContext(
-                    self._task.client,
-                    self._task.uid,
-                    StreamType.RESULT,
-                    metadata_header,
-                ),
-            ).start(stream_handler=lambda output: data.append(output.json))
-            return data
+            return list(
+                BufferedStream(
+                    _TaskContext(
+                        self._task.client,
+                        self._task.uid,
+                        StreamType.RESULT,
+                        metadata_header,
+                    ),
+                ).iter_json()
+            )
         return self._task.result_url
 
     @property
@@ -545,19 +832,31 @@ class ExportTask:
     def get_buffered_stream(
         self,
         stream_type: StreamType = StreamType.RESULT,
+        max_concurrent_downloads: int = 1,
+        line: Optional[int] = None,
+        checkpoint_file: Optional[str] = None,
+        checkpoint_interval: int = 1000,
     ) -> BufferedStream:
         """
         Returns the result of the task.
 
         Args:
             stream_type (StreamType, optional): The type of stream to retrieve. Defaults to StreamType.RESULT.
+            max_concurrent_downloads (int, optional): The number of export files to download concurrently.
+                Values greater than 1 prefetch upcoming files while earlier ones are being read. Defaults to 1.
+            line (int, optional): The line number of the row to resume streaming from.
+            checkpoint_file (str, optional): A file the stream periodically updates with the position of the
+                last row processed. If the file already exists and `line` is not given, the stream resumes
+                from the line it records.
+            checkpoint_interval (int, optional): The number of rows between checkpoint updates. Defaults to 1000.
 
         Returns:
             Stream: The buffered stream object.
 
         Raises:
             ExportTask.ExportTaskException: If the task has failed or is not ready yet.
-            ValueError: If the task does not have the specified stream type.
+            ValueError: If the task does not have the specified stream type or the checkpoint
+                belongs to a different task or stream.
         """
         if self._task.status == "FAILED":
             raise ExportTask.ExportTaskException("Task failed")
@@ -571,10 +870,26 @@ class ExportTask:
             raise ValueError(
                 f"Task {self._task.uid} does not have a {stream_type.value} stream"
             )
+        if checkpoint_file and line is None:
+            checkpoint = ExportCheckpoint.load(checkpoint_file)
+            if checkpoint is not None:
+                if (
+                    checkpoint.task_id != self._task.uid
+                    or checkpoint.stream_type != stream_type
+                ):
+                    raise ValueError(
+                        f"Checkpoint {checkpoint_file} belongs to the "
+                        f"{checkpoint.stream_type.value} stream of task {checkpoint.task_id}"
+                    )
+                line = checkpoint.line
         return BufferedStream(
             _TaskContext(
                 self._task.client, self._task.uid, stream_type, metadata_header
             ),
+            max_concurrent_downloads=max_concurrent_downloads,
+            line=line or 0,
+            checkpoint_file=checkpoint_file,
+            checkpoint_interval=checkpoint_interval,
         )
 
     @staticmethod
@@ -1,6 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from typing import List
+from typing import Iterable, List
 
 from labelbox.schema.internal.data_row_upsert_item import (
     DataRowItemBase,
@@ -24,10 +24,38 @@ SOURCE_SDK = "SDK"
 
 def upload_in_chunks(
     client,
-    specs: List[DataRowItemBase],
+    specs: Iterable[DataRowItemBase],
     file_upload_thread_count: int,
     max_chunk_size_bytes: int,
 ) -> UploadManifest:
+    """Uploads the specs in chunks and returns the manifest of the chunks.
+
+    `specs` is consumed once, lazily, so it can be a generator. A list is
+    checked for empty items before anything is uploaded, other iterables
+    fail at their first empty item.
+    """
+    if isinstance(specs, list):
+        _check_not_empty(specs)
+
+    item_count = 0
+
+    def checked_specs():
+        nonlocal item_count
+        for spec in specs:
+            _check_not_empty([spec])
+            item_count += 1
+            yield spec
+
+    chunk_uris = DescriptorFileCreator(client).create(
+        checked_specs(), max_chunk_size_bytes=max_chunk_size_bytes
+    )
+
+    return UploadManifest(
+        source=SOURCE_SDK, item_count=item_count, chunk_uris=chunk_uris
+    )
+
+
+def _check_not_empty(specs: List[DataRowItemBase]) -> None:
     empty_specs = list(filter(lambda spec: spec.is_empty(), specs))
     if empty_specs:
         ids = list(map(lambda spec: spec.id.get("value"), empty_specs))
@@ -38,11 +66,3 @@ def upload_in_chunks(
             )
         else:  # case of create items
             raise ValueError("Some items have an empty payload")
-
-    chunk_uris = DescriptorFileCreator(client).create(
-        specs, max_chunk_size_bytes=max_chunk_size_bytes
-    )
-
-    return UploadManifest(
-        source=SOURCE_SDK, item_count=len(specs), chunk_uris=chunk_uris
-    )
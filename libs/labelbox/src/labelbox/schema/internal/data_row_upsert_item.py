@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, Tuple, Optional
 
 from labelbox.schema.identifiable import UniqueId, GlobalKey
 from labelbox.schema.data_row import DataRow
@@ -25,8 +25,16 @@ class DataRowItemBase(ABC, BaseModel):
         items: List[dict],
         key_types: Optional[Tuple[type, ...]] = (),
     ) -> List["DataRowItemBase"]:
-        upload_items = []
+        return list(cls.iter_build(dataset_id, items, key_types))
 
+    @classmethod
+    def iter_build(
+        cls,
+        dataset_id: str,
+        items: Iterable[dict],
+        key_types: Optional[Tuple[type, ...]] = (),
+    ) -> Iterator["DataRowItemBase"]:
+        """Builds the items lazily, as the returned iterator is consumed."""
         for item in items:
             # enforce current dataset's id for all specs
             item["dataset_id"] = dataset_id
@@ -46,8 +54,7 @@ class DataRowItemBase(ABC, BaseModel):
             item = {
                 k: v for k, v in item.items() if v is not None
             }  # remove None values
-            upload_items.append(cls(payload=item, id=key))
-        return upload_items
+            yield cls(payload=item, id=key)
 
 
 class DataRowUpsertItem(DataRowItemBase):
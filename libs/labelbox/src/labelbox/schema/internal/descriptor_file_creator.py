@@ -1,8 +1,7 @@
-import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Generator, Iterable, List
 
+from lbox import json_codec  # type: ignore
 from lbox.exceptions import (
     InvalidAttributeError,
     InvalidQueryError,
@@ -16,6 +15,7 @@ from labelbox.schema.internal.data_row_upsert_item import (
 from labelbox.schema.internal.datarow_upload_constants import (
     FILE_UPLOAD_THREAD_COUNT,
 )
+from labelbox.utils import _map_in_threads
 
 if TYPE_CHECKING:
     from labelbox import Client
@@ -27,6 +27,10 @@ class DescriptorFileCreator:
     It will create multiple files if the size of upload the max_chunk_size in bytes,
         upload the files to gcs in parallel, and return a list of urls
 
+    Items are prepared, chunked and uploaded as a pipeline: chunks are uploaded
+    while the following items are still being prepared, and only a bounded
+    number of items and chunks are held in memory at once.
+
     Args:
         client (Client): The client object
         max_chunk_size_bytes (int): The maximum size of the file in bytes
@@ -39,24 +43,16 @@ class DescriptorFileCreator:
         is_upsert = True  # This class will only support upsert use cases
         items = self._prepare_items_for_upload(items, is_upsert=is_upsert)
         json_chunks = self._chunk_down_by_bytes(items, max_chunk_size_bytes)
-        with ThreadPoolExecutor(FILE_UPLOAD_THREAD_COUNT) as executor:
-            futures = [
-                executor.submit(
-                    self.client.upload_data,
-                    chunk,
-                    "application/json",
-                    "json_import.json",
-                )
-                for chunk in json_chunks
-            ]
-            return [future.result() for future in as_completed(futures)]
+        return self._upload_chunks(json_chunks)
 
     def create_one(self, items) -> List[str]:
-        items = self._prepare_items_for_upload(
-            items,
+        items = list(
+            self._prepare_items_for_upload(
+                items,
+            )
         )
         # Prepare and upload the descriptor file
-        data = json.dumps(items)
+        data = json_codec.dumps(items)
         return self.client.upload_data(
             data, content_type="application/json", filename="json_import.json"
         )
@@ -91,7 +87,8 @@ class DescriptorFileCreator:
             items (iterable of (dict or str)): See above for details.
 
         Returns:
-            uri (string): A reference to the uploaded json data.
+            Iterator[dict]: The prepared items, in the order of `items`. Items are
+                prepared lazily, as the iterator is consumed.
 
         Raises:
             InvalidQueryError: If the `items` parameter does not conform to
@@ -242,6 +239,20 @@ class DescriptorFileCreator:
             item["row_data"] = one_conversation
             return item
 
+        def has_local_file(data_row_item):
+            # Only items with a local file to upload are prepared in threads,
+            # the validation of other items is cheaper than a thread hand-off
+            if isinstance(data_row_item, DataRowItemBase):
+                item = data_row_item.payload
+            else:
+                item = data_row_item
+            if isinstance(item, str):
+                return True
+            if not isinstance(item, dict):
+                return False
+            row_data = item.get("row_data", item.get(DataRow.row_data))
+            return isinstance(row_data, str) and os.path.exists(row_data)
+
         def convert_item(data_row_item):
             if isinstance(data_row_item, DataRowItemBase):
                 item = data_row_item.payload
@@ -278,34 +289,55 @@ class DescriptorFileCreator:
                 f"Must pass an iterable to create_data_rows. Found {type(items)}"
             )
 
-        with ThreadPoolExecutor(file_upload_thread_count) as executor:
-            futures = [executor.submit(convert_item, item) for item in items]
-            items = [future.result() for future in as_completed(futures)]
+        return _map_in_threads(
+            convert_item,
+            items,
+            file_upload_thread_count,
+            in_thread=has_local_file,
+        )
+
+    def _upload_chunks(self, chunks: Iterable[bytes]) -> List[str]:
+        """
+        Uploads chunks while the following ones are being produced. At most
+        FILE_UPLOAD_THREAD_COUNT chunks are uploading at once, producing more
+        waits for the oldest upload to finish.
 
-        return items
+        Returns:
+            List[str]: The urls of the uploaded chunks, in the order of `chunks`
+        """
+
+        def upload_chunk(chunk):
+            return self.client.upload_data(
+                chunk,
+                content_type="application/json",
+                filename="json_import.json",
+            )
+
+        return list(
+            _map_in_threads(upload_chunk, chunks, FILE_UPLOAD_THREAD_COUNT)
+        )
 
     def _chunk_down_by_bytes(
-        self, items: List[dict], max_chunk_size: int
-    ) -> Generator[str, None, None]:
+        self, items: Iterable[dict], max_chunk_size: int
+    ) -> Generator[bytes, None, None]:
         """
-        Recursively chunks down a list of items into smaller lists until each list is less than or equal to max_chunk_size bytes
+        Packs items, in order, into json arrays of at most max_chunk_size bytes. Items are serialized once
+        and consumed lazily, so `items` can be a generator.
         NOTE: if one data row is larger than max_chunk_size, it will be returned as one chunk
 
         Returns:
-            Generator[str, None, None]: A generator that yields a json string
+            Generator[bytes, None, None]: A generator that yields utf-8 encoded json arrays
         """
-        if not items:
-            return
-        data = json.dumps(items)
-        chunk_size = len(data.encode("utf-8"))
-        if chunk_size <= max_chunk_size:
-            yield data
-            return
-
-        if len(items) == 1:
-            yield data
-            return
-
-        half = len(items) // 2
-        yield from self._chunk_down_by_bytes(items[:half], max_chunk_size)
-        yield from self._chunk_down_by_bytes(items[half:], max_chunk_size)
+        chunk: List[bytes] = []
+        chunk_size = 2  # the enclosing brackets
+        for item in items:
+            data = json_codec.dumps_bytes(item)
+            item_size = len(data) + (1 if chunk else 0)  # the separator
+            if chunk and chunk_size + item_size > max_chunk_size:
+                yield b"[" + b",".join(chunk) + b"]"
+                chunk, chunk_size = [], 2
+                item_size = len(data)
+            chunk.append(data)
+            chunk_size += item_size
+        if chunk:
+            yield b"[" + b",".join(chunk) + b"]"
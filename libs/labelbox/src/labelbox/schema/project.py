@@ -1,9 +1,9 @@
 import json
 import logging
-import time
 import warnings
 from collections import namedtuple
 from datetime import datetime, timezone
+from functools import partial
 from string import Template
 from typing import (
     TYPE_CHECKING,
@@ -24,7 +24,7 @@ from lbox.exceptions import (
     error_message_for_unparsed_graphql_error,
 )  # type: ignore
 
-from labelbox import utils
+from labelbox import polling, utils
 from labelbox.orm import query
 from labelbox.orm.db_object import DbObject, Deletable, Updateable, experimental
 from labelbox.orm.model import Entity, Field, Relationship
@@ -1427,59 +1427,38 @@ class Project(DbObject, Updateable, Deletable):
         wait_processing_max_seconds: int = _wait_processing_max_seconds,
         sleep_interval=30,
     ):
-        """Wait until all the specified data rows are processed"""
-        start_time = datetime.now()
+        """Wait until all the specified data rows are processed
 
+        Data rows are checked in chunks, concurrently. The interval between
+        two checks starts small and backs off up to `sleep_interval` seconds.
+        """
         max_data_rows_per_poll = 100_000
+        checks = []
         if data_row_ids is not None:
             for i in range(0, len(data_row_ids), max_data_rows_per_poll):
                 chunk = data_row_ids[i : i + max_data_rows_per_poll]
-                self._poll_data_row_processing_status(
-                    chunk,
-                    [],
-                    start_time,
-                    wait_processing_max_seconds,
-                    sleep_interval,
+                checks.append(
+                    partial(self.__check_data_rows_have_been_processed, chunk)
                 )
 
         if global_keys is not None:
             for i in range(0, len(global_keys), max_data_rows_per_poll):
                 chunk = global_keys[i : i + max_data_rows_per_poll]
-                self._poll_data_row_processing_status(
-                    [],
-                    chunk,
-                    start_time,
-                    wait_processing_max_seconds,
-                    sleep_interval,
-                )
-
-    def _poll_data_row_processing_status(
-        self,
-        data_row_ids: List[str],
-        global_keys: List[str],
-        start_time: datetime,
-        wait_processing_max_seconds: int = _wait_processing_max_seconds,
-        sleep_interval=30,
-    ):
-        while True:
-            if (
-                datetime.now() - start_time
-            ).total_seconds() >= wait_processing_max_seconds:
-                raise ProcessingWaitTimeout(
-                    """Maximum wait time exceeded while waiting for data rows to be processed.
-                    Try creating a batch a bit later"""
+                checks.append(
+                    partial(
+                        self.__check_data_rows_have_been_processed, [], chunk
+                    )
                 )
 
-            all_good = self.__check_data_rows_have_been_processed(
-                data_row_ids, global_keys
-            )
-            if all_good:
-                return
-
-            logger.debug(
-                "Some of the data rows are still being processed, waiting..."
+        if not polling.poll_all(
+            checks,
+            wait_processing_max_seconds,
+            max_interval=sleep_interval,
+        ):
+            raise ProcessingWaitTimeout(
+                """Maximum wait time exceeded while waiting for data rows to be processed.
+                Try creating a batch a bit later"""
             )
-            time.sleep(sleep_interval)
 
     def __check_data_rows_have_been_processed(
         self,
@@ -1,24 +1,37 @@
-from typing import cast, Any, Dict, Generator, List, TYPE_CHECKING, Union
+from itertools import chain
+from typing import (
+    cast,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    TYPE_CHECKING,
+    Union,
+)
 
 if TYPE_CHECKING:
     from labelbox.types import Label
 
 
 def serialize_labels(
-    objects: Union[List[Dict[str, Any]], List["Label"]],
-) -> List[Dict[str, Any]]:
+    objects: Iterable[Union[Dict[str, Any], "Label"]],
+) -> Iterator[Dict[str, Any]]:
     """
     Checks if objects are of type Labels and serializes labels for annotation import. Serialization depends the labelbox[data] package, therefore NDJsonConverter is only loaded if using `Label` objects instead of `dict` objects.
+
+    Objects are serialized lazily, as the returned iterator is consumed, so any iterable (e.g. a `LabelGenerator`) can be serialized without holding all of it in memory.
     """
-    if len(objects) == 0:
-        return []
+    objects = iter(objects)
+    first = next(objects, None)
+    if first is None:
+        return iter(())
+    objects = chain([first], objects)
 
-    is_label_type = not isinstance(objects[0], Dict)
+    is_label_type = not isinstance(first, Dict)
     if is_label_type:
         # If a Label object exists, labelbox[data] is already installed, so no error checking is needed.
         from labelbox.data.serialization import NDJsonConverter
 
-        labels = cast(List["Label"], objects)
-        return list(NDJsonConverter.serialize(labels))
+        return NDJsonConverter.serialize(cast(Iterable["Label"], objects))
 
-    return cast(List[Dict[str, Any]], objects)
+    return cast(Iterator[Dict[str, Any]], objects)
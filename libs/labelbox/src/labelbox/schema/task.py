@@ -1,12 +1,11 @@
 import json
 import logging
-import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
-import requests
+from lbox import json_codec  # type: ignore
 from lbox.exceptions import ResourceNotFoundError
 
-from labelbox import parser
+from labelbox import parser, polling
 from labelbox.orm.db_object import DbObject
 from labelbox.orm.model import Entity, Field, Relationship
 from labelbox.pagination import PaginatedCollection
@@ -24,6 +23,11 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# First interval between two queries of the status of a task, in seconds. It
+# bounds the extra queries sent for short tasks, compared to polling every
+# `check_frequency` seconds.
+INITIAL_CHECK_INTERVAL = 1.0
+
 
 class Task(DbObject):
     """Represents a server-side process that might take a longer time to process.
@@ -73,6 +77,9 @@ class Task(DbObject):
         """Refreshes Task data from the server."""
         assert self._user is not None
         tasks = list(self._user.created_tasks(where=Task.uid == self.uid))
+        self._update_from_tasks(tasks)
+
+    def _update_from_tasks(self, tasks: List["Task"]) -> None:
         if len(tasks) != 1:
             raise ResourceNotFoundError(Task, self.uid)
         for field in self.fields():
@@ -100,27 +107,43 @@ class Task(DbObject):
         """Waits until the task is completed. Periodically queries the server
         to update the task attributes.
 
+        The first query is sent about one second after the call. The interval
+        between queries then doubles up to `check_frequency` seconds. Each
+        interval is drawn at random between half of its value and its full
+        value, so that tasks waited on concurrently are not queried in
+        lockstep.
+
         Args:
             timeout_seconds (float): Maximum time this method can block, in seconds. Defaults to five minutes.
-            check_frequency (float): Frequency of queries to server to update the task attributes, in seconds. Defaults to two seconds. Minimal value is two seconds.
+            check_frequency (float): Maximum interval between queries to the server, in seconds. Defaults to two seconds and must be at least two seconds.
         """
         if check_frequency < 2.0:
             raise ValueError(
                 "Expected check frequency to be two seconds or more"
             )
-        while timeout_seconds > 0:
-            if self.status != "IN_PROGRESS":
-                if self.has_errors():
-                    logger.warning(
-                        "There are errors present. Please look at `task.errors` for more details"
-                    )
-                return
-            logger.debug(
-                "Task.wait_till_done sleeping for %d seconds", check_frequency
+        refresh = False
+
+        def is_done() -> Optional[bool]:
+            nonlocal refresh
+            if refresh:
+                self.refresh()
+            refresh = True
+            return True if self.status != "IN_PROGRESS" else None
+
+        if timeout_seconds <= 0:
+            return
+        if (
+            polling.poll(
+                is_done,
+                timeout_seconds,
+                initial_interval=INITIAL_CHECK_INTERVAL,
+                max_interval=check_frequency,
+            )
+            and self.has_errors()
+        ):
+            logger.warning(
+                "There are errors present. Please look at `task.errors` for more details"
             )
-            time.sleep(check_frequency)
-            timeout_seconds -= check_frequency
-            self.refresh()
 
     @property
     def errors(self) -> Optional[Dict[str, Any]]:
@@ -193,12 +216,17 @@ class Task(DbObject):
             if url is None:
                 return None
 
-            response = requests.get(url)
-            response.raise_for_status()
             if format == "json":
-                return response.json()
+                response = self.client.download_connection.get(url)
+                response.raise_for_status()
+                return json_codec.loads(response.content)
             elif format == "ndjson":
-                return parser.loads(response.text)
+                # parsed one line at a time while being downloaded
+                with self.client.download_connection.get(
+                    url, stream=True
+                ) as response:
+                    response.raise_for_status()
+                    return parser.loads(response.iter_lines())
             else:
                 raise ValueError(
                     "Expected the result format to be either `ndjson` or `json`."
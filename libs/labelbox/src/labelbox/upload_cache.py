@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Size of the blocks read when hashing files.
+_HASH_CHUNK_SIZE = 1024 * 1024
+# Number of writes between two evictions of stale entries.
+_EVICTION_INTERVAL = 1000
+
+
+class UploadCache:
+    """An on-disk cache of the urls of uploaded local files.
+
+    Files are identified by the SHA-256 hash and size of their content, so a
+    file that is byte-identical to one already uploaded is not uploaded again,
+    whatever its path. The hash of a file is itself cached by path, size and
+    modification time, so unchanged files are not read again either.
+
+    Entries expire `ttl_seconds` after the upload and the least recently used
+    entries are evicted beyond `max_entries`. The cache is a SQLite database
+    that can be shared by the threads of a client and by subsequent runs.
+
+    >>> client = Client(upload_cache=UploadCache("~/.labelbox/uploads.db"))
+    >>> dataset.create_data_rows(["path/to/file1.jpg", "path/to/file2.jpg"])
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_entries: int = 1_000_000,
+    ):
+        """Opens or creates an UploadCache.
+
+        Args:
+            path (str): Path of the cache database file.
+            ttl_seconds (float): Time after which an uploaded url is not
+                reused anymore, in seconds. Defaults to 30 days.
+            max_entries (int): Maximum number of uploads kept in the cache.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("Expected ttl_seconds to be positive")
+        if max_entries <= 0:
+            raise ValueError("Expected max_entries to be positive")
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS uploads (
+                    namespace TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, content_hash, size)
+                );
+                CREATE INDEX IF NOT EXISTS uploads_used_at ON uploads (used_at);
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                );
+                """
+            )
+            self._evict()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get_or_upload(
+        self, namespace: str, path: str, upload: Callable[[], str]
+    ) -> str:
+        """Returns the url of a previous upload of the content of `path`,
+        or uploads it with `upload` and caches the returned url.
+
+        Args:
+            namespace (str): Identifies the account that uploads, urls are
+                only reused within a namespace.
+            path (str): Path of the local file.
+            upload (callable): Uploads the file and returns its url.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        content_hash = self._get_content_hash(path, stat)
+        url = self._get_url(namespace, content_hash, stat.st_size)
+        if url is not None:
+            logger.debug("Reusing the upload of %s", path)
+            return url
+
+        url = upload()
+        self._put_url(namespace, content_hash, stat.st_size, url)
+        return url
+
+    def _get_content_hash(self, path: str, stat: os.stat_result) -> str:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content_hash FROM files "
+                "WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+        if row is not None:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, content_hash),
+            )
+        return content_hash
+
+    def _get_url(
+        self, namespace: str, content_hash: str, size: int
+    ) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url FROM uploads WHERE namespace = ? "
+                "AND content_hash = ? AND size = ? AND created_at > ?",
+                (namespace, content_hash, size, now - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE uploads SET used_at = ? WHERE namespace = ? "
+                "AND content_hash = ? AND size = ?",
+                (now, namespace, content_hash, size),
+            )
+        return row[0]
+
+    def _put_url(
+        self, namespace: str, content_hash: str, size: int, url: str
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, content_hash, size, url, now, now),
+            )
+            self._writes += 1
+            if self._writes % _EVICTION_INTERVAL == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Deletes expired and least recently used entries. Must be called
+        with the lock held."""
+        self._connection.execute(
+            "DELETE FROM uploads WHERE created_at <= ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        self._connection.execute(
+            "DELETE FROM uploads WHERE rowid IN (SELECT rowid FROM uploads "
+            "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._connection.execute(
+            "DELETE FROM files WHERE content_hash NOT IN "
+            "(SELECT content_hash FROM uploads)"
+        )
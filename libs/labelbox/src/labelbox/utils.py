@@ -1,5 +1,8 @@
 import datetime
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generator, Iterable, Optional
 
 from dateutil.tz import tzoffset
 from dateutil.parser import isoparse as dateutil_parse
@@ -115,3 +118,37 @@ def format_iso_from_string(date_string: str) -> datetime.datetime:
     """
     # return datetime.datetime.fromisoformat(date_string)
     return default_tzinfo(dateutil_parse(date_string), DFLT_TZ)
+
+
+def _map_in_threads(
+    func: Callable,
+    items: Iterable,
+    thread_count: int,
+    in_thread: Optional[Callable[..., bool]] = None,
+) -> Generator:
+    """
+    Lazily applies func to items in a thread pool and yields the results in the
+    order of items. At most 2 * thread_count items are submitted ahead of the
+    result being consumed.
+
+    If in_thread is given, func is only run in the thread pool for the items it
+    returns True for, and is called directly for the others.
+    """
+    with ThreadPoolExecutor(thread_count) as executor:
+        pending: deque = deque()
+        for item in items:
+            while pending and (
+                len(pending) >= 2 * thread_count or pending[0].done()
+            ):
+                yield pending.popleft().result()
+            if in_thread is None or in_thread(item):
+                pending.append(executor.submit(func, item))
+            elif pending:
+                # wait for the items ahead of this one
+                done: Future = Future()
+                done.set_result(func(item))
+                pending.append(done)
+            else:
+                yield func(item)
+        while pending:
+            yield pending.popleft().result()
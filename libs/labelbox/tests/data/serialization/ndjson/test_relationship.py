@@ -163,3 +163,76 @@ def test_relationship():
     assert res_relationship_second_annotation["relationship"]["target"] in [
         annot["uuid"] for annot in res_source_and_target
     ]
+
+
+def test_relationship_serialization_does_not_modify_label():
+    source = ObjectAnnotation(
+        name="dog",
+        value=Rectangle(start=Point(x=0, y=0), end=Point(x=1, y=1)),
+    )
+    target = ObjectAnnotation(
+        name="cat",
+        value=Rectangle(start=Point(x=2, y=2), end=Point(x=3, y=3)),
+    )
+    relationship = RelationshipAnnotation(
+        name="is chasing",
+        value=Relationship(
+            source=source,
+            target=target,
+            type=Relationship.Type.UNIDIRECTIONAL,
+        ),
+    )
+    annotations = [source, target, relationship]
+    label = Label(
+        data=GenericDataRowData(uid="clf98gj90000qp38ka34yhptl"),
+        annotations=annotations,
+    )
+    uuids = [annotation._uuid for annotation in annotations]
+
+    # the same label twice, its uuids must be remapped the second time
+    res = list(NDJsonConverter.serialize([label, label]))
+
+    assert label.annotations == annotations
+    assert [annotation._uuid for annotation in annotations] == uuids
+    assert len({r["uuid"] for r in res}) == 6
+    for i in range(0, 6, 3):
+        dog, cat, rel = res[i : i + 3]
+        assert rel["relationship"]["source"] == dog["uuid"]
+        assert rel["relationship"]["target"] == cat["uuid"]
+
+
+def test_relationship_serialization_of_repeated_annotation():
+    source = ObjectAnnotation(
+        name="dog",
+        value=Rectangle(start=Point(x=0, y=0), end=Point(x=1, y=1)),
+    )
+    target = ObjectAnnotation(
+        name="cat",
+        value=Rectangle(start=Point(x=2, y=2), end=Point(x=3, y=3)),
+    )
+    relationship = RelationshipAnnotation(
+        name="is chasing",
+        value=Relationship(
+            source=source,
+            target=target,
+            type=Relationship.Type.UNIDIRECTIONAL,
+        ),
+    )
+    # the same annotation objects twice in one label
+    label = Label(
+        data=GenericDataRowData(uid="clf98gj90000qp38ka34yhptl"),
+        annotations=[source, target, relationship] * 2,
+    )
+
+    res = list(NDJsonConverter.serialize([label]))
+
+    assert len({r["uuid"] for r in res}) == 6
+    relationships = [r for r in res if "relationship" in r]
+    assert len(relationships) == 2
+    ends = {
+        r["relationship"][end]
+        for r in relationships
+        for end in ("source", "target")
+    }
+    assert len(ends) == 4
+    assert ends <= {r["uuid"] for r in res}
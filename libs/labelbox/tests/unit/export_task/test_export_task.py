@@ -2,13 +2,14 @@ import json
 import pytest
 
 from unittest.mock import MagicMock, patch
-from labelbox.schema.export_task import ExportTask
+from labelbox.schema.export_task import ExportCheckpoint, ExportTask
 
 
 class TestExportTask:
     def test_export_task(self):
         with patch("requests.get") as mock_requests_get:
             mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
             mock_task.client.execute.side_effect = [
                 {
                     "task": {
@@ -64,6 +65,7 @@ class TestExportTask:
     def test_get_buffered_stream(self):
         with patch("requests.get") as mock_requests_get:
             mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
             mock_task.client.execute.side_effect = [
                 {
                     "task": {
@@ -109,6 +111,7 @@ class TestExportTask:
     def test_export_task_bad_offsets(self):
         with patch("requests.get") as mock_requests_get:
             mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
             mock_task.client.execute.side_effect = [
                 {
                     "task": {
@@ -152,3 +155,289 @@ class TestExportTask:
             mock_requests_get.return_value.content = "b"
             export_task = ExportTask(mock_task, is_export_v2=True)
             assert export_task.result[0] == data
+
+    def test_get_buffered_stream_with_concurrent_downloads(self):
+        lines = [json.dumps({"id": idx}) + "\n" for idx in range(5)]
+        files = {f"file-{idx}": line for idx, line in enumerate(lines)}
+        file_infos = []
+        offset = 0
+        for idx, line in enumerate(lines):
+            file_infos.append(
+                {
+                    "task": {
+                        "exportFileFromOffset": {
+                            "lines": {"start": idx, "end": idx},
+                            "offsets": {
+                                "start": offset,
+                                "end": offset + len(line) - 1,
+                            },
+                            "file": f"file-{idx}",
+                        }
+                    }
+                }
+            )
+            offset += len(line)
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.text = files[url]
+            response.content = files[url].encode("utf-8")
+            return response
+
+        with patch("requests.get", side_effect=get) as mock_requests_get:
+            mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
+            mock_task.client.execute.side_effect = [
+                {
+                    "task": {
+                        "exportMetadataHeader": {
+                            "total_size": offset,
+                            "total_lines": len(lines),
+                        }
+                    }
+                },
+                *file_infos,
+            ]
+            mock_task.status = "COMPLETE"
+            export_task = ExportTask(mock_task, is_export_v2=True)
+            stream = export_task.get_buffered_stream(max_concurrent_downloads=3)
+            output_data = [output.json for output in stream]
+            assert output_data == [{"id": idx} for idx in range(5)]
+            assert mock_requests_get.call_count == len(lines)
+
+    def test_get_buffered_stream_lines_split_across_chunks(self):
+        content = "".join(json.dumps({"id": idx}) + "\n" for idx in range(3))
+        chunks = [content[:5], content[5:20], content[20:]]
+        file_infos = []
+        offset = 0
+        for idx, chunk in enumerate(chunks):
+            file_infos.append(
+                {
+                    "task": {
+                        "exportFileFromOffset": {
+                            "lines": {"start": idx, "end": idx},
+                            "offsets": {
+                                "start": offset,
+                                "end": offset + len(chunk) - 1,
+                            },
+                            "file": f"file-{idx}",
+                        }
+                    }
+                }
+            )
+            offset += len(chunk)
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.text = chunks[int(url.split("-")[1])]
+            response.content = response.text.encode("utf-8")
+            return response
+
+        with patch("requests.get", side_effect=get) as mock_requests_get:
+            mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
+            mock_task.client.execute.side_effect = [
+                {
+                    "task": {
+                        "exportMetadataHeader": {
+                            "total_size": offset,
+                            "total_lines": 3,
+                        }
+                    }
+                },
+                *file_infos,
+            ]
+            mock_task.status = "COMPLETE"
+            export_task = ExportTask(mock_task, is_export_v2=True)
+            output_data = [
+                output.json for output in export_task.get_buffered_stream()
+            ]
+            assert output_data == [{"id": idx} for idx in range(3)]
+
+    def test_get_buffered_stream_resumes_from_checkpoint(self, tmp_path):
+        lines = [json.dumps({"id": idx}) + "\n" for idx in range(4)]
+        content = "".join(lines)
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.text = content
+            response.content = content.encode("utf-8")
+            return response
+
+        def file_info():
+            return {
+                "task": {
+                    "exportFileFromOffset": {
+                        "lines": {"start": 0, "end": 3},
+                        "offsets": {"start": 0, "end": len(content) - 1},
+                        "file": "file",
+                    }
+                }
+            }
+
+        metadata_header = {
+            "task": {
+                "exportMetadataHeader": {
+                    "total_size": len(content),
+                    "total_lines": len(lines),
+                }
+            }
+        }
+        checkpoint_file = str(tmp_path / "checkpoint.json")
+        ExportTask._get_metadata_header.cache_clear()
+        with patch("requests.get", side_effect=get) as mock_requests_get:
+            mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
+            mock_task.uid = "task-id"
+            mock_task.client.execute.side_effect = [
+                metadata_header,
+                file_info(),
+            ]
+            mock_task.status = "COMPLETE"
+            export_task = ExportTask(mock_task, is_export_v2=True)
+            stream = export_task.get_buffered_stream(
+                checkpoint_file=checkpoint_file, checkpoint_interval=1
+            )
+            output_data = []
+            for output in stream:
+                output_data.append(output.json)
+                if len(output_data) == 2:
+                    break
+            assert output_data == [{"id": 0}, {"id": 1}]
+            checkpoint = ExportCheckpoint.load(checkpoint_file)
+            # a row is committed once the caller asks for the next one
+            assert checkpoint.line == 1
+            assert checkpoint.offset == len(lines[0])
+
+            ExportTask._get_metadata_header.cache_clear()
+            mock_task.client.execute.side_effect = [
+                metadata_header,
+                file_info(),
+            ]
+            stream = export_task.get_buffered_stream(
+                checkpoint_file=checkpoint_file
+            )
+            assert [output.json for output in stream] == [
+                {"id": 1},
+                {"id": 2},
+                {"id": 3},
+            ]
+            assert ExportCheckpoint.load(checkpoint_file).line == 4
+
+    def test_get_buffered_stream_from_line(self):
+        lines = [json.dumps({"id": idx}) + "\n" for idx in range(4)]
+        content = "".join(lines)
+        with patch("requests.get") as mock_requests_get:
+            mock_requests_get.return_value.text = content
+            mock_requests_get.return_value.content = content.encode("utf-8")
+            mock_task = MagicMock()
+            mock_task.client.download_connection.get = mock_requests_get
+            mock_task.uid = "line-task-id"
+            mock_task.client.execute.side_effect = [
+                {
+                    "task": {
+                        "exportMetadataHeader": {
+                            "total_size": len(content),
+                            "total_lines": len(lines),
+                        }
+                    }
+                },
+                {
+                    "task": {
+                        "exportFileFromOffset": {
+                            "lines": {"start": 0, "end": 3},
+                            "offsets": {"start": 0, "end": len(content) - 1},
+                            "file": "file",
+                        }
+                    }
+                },
+            ]
+            mock_task.status = "COMPLETE"
+            export_task = ExportTask(mock_task, is_export_v2=True)
+            stream = export_task.get_buffered_stream(line=2)
+            assert [output.json for output in stream] == [{"id": 2}, {"id": 3}]
+            assert stream.checkpoint.line == 4
+            assert stream.checkpoint.offset == len(content)
+
+    def test_get_buffered_stream_resumes_from_checkpoint_in_later_file(
+        self, tmp_path
+    ):
+        lines = [json.dumps({"id": idx}) + "\n" for idx in range(6)]
+        files = {
+            f"file-{idx}": "".join(lines[2 * idx : 2 * idx + 2])
+            for idx in range(3)
+        }
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.text = files[url]
+            response.content = files[url].encode("utf-8")
+            return response
+
+        def file_infos():
+            offset = 0
+            for idx, content in enumerate(files.values()):
+                yield {
+                    "task": {
+                        "exportFileFromOffset": {
+                            "lines": {"start": 2 * idx, "end": 2 * idx + 1},
+                            "offsets": {
+                                "start": offset,
+                                "end": offset + len(content) - 1,
+                            },
+                            "file": f"file-{idx}",
+                        }
+                    }
+                }
+                offset += len(content)
+
+        metadata_header = {
+            "task": {
+                "exportMetadataHeader": {
+                    "total_size": len("".join(lines)),
+                    "total_lines": len(lines),
+                }
+            }
+        }
+        checkpoint_file = str(tmp_path / "checkpoint.json")
+        ExportTask._get_metadata_header.cache_clear()
+        mock_requests_get = MagicMock(side_effect=get)
+        mock_task = MagicMock()
+        mock_task.client.download_connection.get = mock_requests_get
+        mock_task.uid = "multi-file-task-id"
+        mock_task.client.execute.side_effect = [
+            metadata_header,
+            *file_infos(),
+        ]
+        mock_task.status = "COMPLETE"
+        export_task = ExportTask(mock_task, is_export_v2=True)
+        stream = export_task.get_buffered_stream(
+            checkpoint_file=checkpoint_file, checkpoint_interval=1
+        )
+        for idx, output in enumerate(stream):
+            if idx == 3:
+                break
+        # rows 0 to 2 are committed, row 3 is the second row of file-1
+        assert ExportCheckpoint.load(checkpoint_file).line == 3
+
+        ExportTask._get_metadata_header.cache_clear()
+        mock_requests_get.reset_mock()
+        mock_task.client.execute.side_effect = [
+            metadata_header,
+            *file_infos(),
+        ]
+        stream = export_task.get_buffered_stream(
+            checkpoint_file=checkpoint_file, checkpoint_interval=1
+        )
+        rows = iter(stream)
+        assert next(rows).json == {"id": 3}
+        assert next(rows).json == {"id": 4}
+        assert stream.checkpoint.line == 4
+        assert stream.checkpoint.offset == len("".join(lines[:4]))
+        assert [output.json for output in rows] == [{"id": 5}]
+        assert stream.checkpoint.line == 6
+        # files before the checkpoint are resolved but not downloaded
+        assert [call.args[0] for call in mock_requests_get.call_args_list] == [
+            "file-1",
+            "file-2",
+        ]
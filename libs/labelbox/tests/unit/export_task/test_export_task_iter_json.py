@@ -0,0 +1,96 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from labelbox.schema.export_task import ExportTask
+
+ROW_COUNT = 1_000
+
+
+def _mock_export_task(
+    content: str, task_id: str, row_count: int = ROW_COUNT
+) -> ExportTask:
+    mock_task = MagicMock()
+    mock_task.client.download_connection.get.return_value.text = content
+    mock_task.client.download_connection.get.return_value.content = (
+        content.encode("utf-8")
+    )
+    mock_task.uid = task_id
+    mock_task.status = "COMPLETE"
+    mock_task.client.execute.side_effect = [
+        {
+            "task": {
+                "exportMetadataHeader": {
+                    "total_size": len(content),
+                    "total_lines": row_count,
+                }
+            }
+        },
+        {
+            "task": {
+                "exportFileFromOffset": {
+                    "lines": {"start": 0, "end": row_count - 1},
+                    "offsets": {"start": 0, "end": len(content) - 1},
+                    "file": "file",
+                }
+            }
+        },
+    ]
+    return ExportTask(mock_task, is_export_v2=True)
+
+
+def _export_rows(row_count: int):
+    rows = [
+        {"data_row": {"id": f"data-row-{idx}", "row_data": "x" * 64}}
+        for idx in range(row_count)
+    ]
+    return rows, "".join(json.dumps(row) + "\n" for row in rows)
+
+
+def test_buffered_stream_iter_json_matches_stream():
+    rows, content = _export_rows(ROW_COUNT)
+
+    stream = _mock_export_task(content, "iter-json-1").get_buffered_stream()
+    model_rows = [output.json for output in stream]
+
+    stream = _mock_export_task(content, "iter-json-2").get_buffered_stream()
+    fast_rows = list(stream.iter_json())
+
+    stream = _mock_export_task(content, "iter-json-3").get_buffered_stream()
+    raw_rows = list(stream.iter_raw())
+
+    assert model_rows == rows
+    assert fast_rows == rows
+    assert raw_rows == content.splitlines(keepends=True)
+
+
+@pytest.mark.slow
+def test_buffered_stream_iter_json_throughput(record_property):
+    row_count = 20_000
+    rows, content = _export_rows(row_count)
+
+    start = time.perf_counter()
+    stream = _mock_export_task(
+        content, "throughput-1", row_count
+    ).get_buffered_stream()
+    model_rows = [output.json for output in stream]
+    model_rows_per_sec = row_count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    stream = _mock_export_task(
+        content, "throughput-2", row_count
+    ).get_buffered_stream()
+    fast_rows = list(stream.iter_json())
+    fast_rows_per_sec = row_count / (time.perf_counter() - start)
+
+    # recorded in the junit report, printed with pytest -s
+    record_property("stream_rows_per_sec", round(model_rows_per_sec))
+    record_property("iter_json_rows_per_sec", round(fast_rows_per_sec))
+    print(
+        f"buffered stream: {model_rows_per_sec:,.0f} rows/sec, "
+        f"iter_json: {fast_rows_per_sec:,.0f} rows/sec"
+    )
+    assert model_rows == rows
+    assert fast_rows == rows
@@ -1,6 +1,13 @@
+import json
+from unittest.mock import MagicMock, patch
+
 import pytest
+from lbox import json_codec
 
-from labelbox.schema.annotation_import import AnnotationImport
+from labelbox.schema.annotation_import import (
+    AnnotationImport,
+    MALPredictionImport,
+)
 
 
 def test_data_row_validation_errors():
@@ -79,3 +86,117 @@ def test_data_row_validation_errors():
         in exception_str
     )
     assert "'dataRow': {'id': None, 'globalKey': None}" in exception_str
+
+
+def _prediction(i):
+    return {
+        "uuid": f"uuid-{i}",
+        "name": "box",
+        "dataRow": {"globalKey": f"key-{i}"},
+        "bbox": {"top": 0, "left": 0, "height": 1, "width": 1},
+    }
+
+
+def test_get_ndjson_from_objects_spools_generators():
+    predictions = (_prediction(i) for i in range(10))
+
+    # small enough for the ndjson to be written to disk
+    with patch("labelbox.schema.annotation_import.NDJSON_SPOOL_MAX_SIZE", 100):
+        data, size = AnnotationImport._get_ndjson_from_objects(
+            predictions, "annotations"
+        )
+
+    with data:
+        assert data._rolled
+        content = data.read()
+    assert size == len(content)
+    assert [json.loads(line) for line in content.split(b"\n")] == [
+        _prediction(i) for i in range(10)
+    ]
+
+
+def test_get_ndjson_from_objects_rejects_empty_and_invalid_objects():
+    with pytest.raises(ValueError, match="annotations cannot be empty"):
+        AnnotationImport._get_ndjson_from_objects(iter([]), "annotations")
+    with pytest.raises(TypeError):
+        AnnotationImport._get_ndjson_from_objects(_prediction(0), "annotations")
+
+
+def test_create_from_objects_streams_ndjson():
+    client = MagicMock()
+    requests = []
+
+    def execute(data, content_type):
+        requests.append((b"".join(data), content_type))
+        return {"createModelAssistedLabelingPredictionImport": {}}
+
+    client.execute.side_effect = execute
+
+    with patch.object(MALPredictionImport, "__init__", return_value=None):
+        MALPredictionImport.create_from_objects(
+            client, "project-id", "name", (_prediction(i) for i in range(2))
+        )
+
+    ((body, content_type),) = requests
+    ndjson = b"\n".join(
+        json_codec.dumps_bytes(_prediction(i)) for i in range(2)
+    )
+    assert content_type.startswith("multipart/form-data; boundary=")
+    assert f'"contentLength": {len(ndjson)}'.encode() in body
+    assert b"Content-Type: application/x-ndjson\r\n\r\n" + ndjson in body
+
+
+def _finished_import(lines):
+    client = MagicMock()
+    response = client.download_connection.get.return_value
+    response.__enter__.return_value = response
+    response.iter_lines.side_effect = lambda: iter(lines)
+    return AnnotationImport(
+        client,
+        {
+            "id": "import-id",
+            "name": "import",
+            "state": "FINISHED",
+            "inputFileUrl": "https://inputs",
+            "errorFileUrl": "https://errors",
+            "statusFileUrl": "https://statuses",
+            "progress": "100%",
+        },
+    )
+
+
+def test_iter_statuses_streams_and_caches_results():
+    lines = [b'{"uuid": "uuid-0"}', b"", b'{"uuid": "uuid-1"}']
+    annotation_import = _finished_import(lines)
+    get = annotation_import.client.download_connection.get
+
+    statuses = annotation_import.iter_statuses()
+
+    assert next(statuses) == {"uuid": "uuid-0"}
+    get.assert_called_once_with("https://statuses", stream=True)
+    assert list(statuses) == [{"uuid": "uuid-1"}]
+    assert annotation_import.statuses == [
+        {"uuid": "uuid-0"},
+        {"uuid": "uuid-1"},
+    ]
+    assert get.call_count == 1
+
+
+def test_iter_statuses_does_not_cache_large_or_partial_results():
+    lines = [b'{"uuid": "uuid-0"}', b'{"uuid": "uuid-1"}']
+    annotation_import = _finished_import(lines)
+    get = annotation_import.client.download_connection.get
+
+    next(annotation_import.iter_errors())
+    with patch("labelbox.schema.annotation_import.NDJSON_CACHE_MAX_ROWS", 1):
+        assert len(annotation_import.statuses) == 2
+    assert len(annotation_import.errors) == 2
+    assert len(annotation_import.statuses) == 2
+    assert len(annotation_import.errors) == 2
+
+    assert [c.args[0] for c in get.call_args_list] == [
+        "https://errors",
+        "https://statuses",
+        "https://errors",
+        "https://statuses",
+    ]
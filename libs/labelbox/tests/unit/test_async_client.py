@@ -0,0 +1,224 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from labelbox import AsyncClient, Client, UploadCache
+from labelbox.pagination import PaginatedCollection, _PAGE_SIZE
+from labelbox.schema.task import INITIAL_CHECK_INTERVAL
+
+# httpx is only installed with the "async" extra of lbox-clients
+httpx = pytest.importorskip("httpx")
+
+
+def _async_client(handler):
+    client = AsyncClient(
+        api_key="api_key", endpoint="http://localhost:8080/graphql"
+    )
+    client._request_client._connection = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _collection(client, cursor_path=None):
+    return PaginatedCollection(
+        client=client,
+        query="query %d %d" if cursor_path is None else "query",
+        params={},
+        dereferencing=["items"],
+        obj_class=lambda _, item: item["id"],
+        cursor_path=cursor_path,
+    )
+
+
+def test_async_client_reuses_client():
+    client = Client(api_key="api_key")
+    async_client = AsyncClient(client=client)
+
+    assert async_client.client is client
+    assert async_client._request_client.request_client is client._request_client
+
+
+def test_paginate_offset():
+    queries = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        queries.append(body["query"])
+        skip = int(body["query"].split()[1])
+        count = _PAGE_SIZE if skip == 0 else 3
+        items = [{"id": skip + i} for i in range(count)]
+        return httpx.Response(200, json={"data": {"items": items}})
+
+    client = _async_client(handler)
+    collection = _collection(client.client)
+
+    async def collect():
+        return [item async for item in client.paginate(collection)]
+
+    items = asyncio.run(collect())
+
+    assert items == list(range(_PAGE_SIZE + 3))
+    assert queries == [
+        f"query 0 {_PAGE_SIZE}",
+        f"query {_PAGE_SIZE} {_PAGE_SIZE}",
+    ]
+    # the pages are shared with the synchronous collection
+    assert list(collection) == items
+    assert len(queries) == 2
+
+
+def test_paginate_cursor():
+    cursors = []
+
+    def handler(request):
+        cursor = json.loads(request.content)["variables"]["from"]
+        cursors.append(cursor)
+        next_cursor = "page-2" if cursor is None else None
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "items": [{"id": cursor}],
+                    "next": next_cursor,
+                }
+            },
+        )
+
+    client = _async_client(handler)
+    collection = _collection(client.client, cursor_path=["next"])
+
+    async def collect():
+        return [item async for item in client.paginate(collection)]
+
+    assert asyncio.run(collect()) == [None, "page-2"]
+    assert cursors == [None, "page-2"]
+
+
+def test_paginate_get_one_and_get_many():
+    def handler(request):
+        items = [{"id": i} for i in range(_PAGE_SIZE)]
+        return httpx.Response(200, json={"data": {"items": items}})
+
+    client = _async_client(handler)
+    paginated = client.paginate(_collection(client.client))
+
+    assert asyncio.run(paginated.get_one()) == 0
+    assert asyncio.run(paginated.get_many(3)) == [0, 1, 2]
+
+
+def test_upload_data():
+    uploads = []
+
+    def handler(request):
+        uploads.append(request)
+        return httpx.Response(
+            200,
+            json={"data": {"uploadFile": {"url": "https://storage/file"}}},
+        )
+
+    client = _async_client(handler)
+    url = asyncio.run(
+        client.upload_data(b"content", filename="a.txt", content_type="text")
+    )
+
+    assert url == "https://storage/file"
+    request = uploads[0]
+    assert request.headers["Authorization"] == "Bearer api_key"
+    assert request.headers["Content-Type"].startswith("multipart/form-data")
+    assert b'name="map"\r\n\r\n{"1": ["variables.file"]}' in request.content
+    assert b"content" in request.content
+
+
+def test_upload_file_streams_and_uses_upload_cache(tmp_path):
+    uploads = []
+
+    def handler(request):
+        uploads.append(request)
+        return httpx.Response(
+            200,
+            json={"data": {"uploadFile": {"url": "https://storage/file"}}},
+        )
+
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"x" * 3000)
+    client = _async_client(handler)
+    client.client.upload_cache = UploadCache(str(tmp_path / "uploads.db"))
+    progress = []
+
+    async def upload():
+        return [
+            await client.upload_file(
+                str(path), lambda sent, total: progress.append(sent)
+            ),
+            await client.upload_file(str(path)),
+        ]
+
+    assert asyncio.run(upload()) == ["https://storage/file"] * 2
+    assert len(uploads) == 1
+    request = uploads[0]
+    assert "Transfer-Encoding" not in request.headers
+    assert int(request.headers["Content-Length"]) == len(request.content)
+    assert b'filename="a.txt"\r\nContent-Type: text/plain' in request.content
+    assert b"x" * 3000 in request.content
+    assert progress == [3000]
+
+
+def test_upload_data_error():
+    def handler(request):
+        return httpx.Response(
+            200, json={"errors": [{"message": "File too large"}]}
+        )
+
+    client = _async_client(handler)
+    with pytest.raises(Exception, match="File too large"):
+        asyncio.run(client.upload_data(b"content"))
+
+
+def test_wait_till_done():
+    task = MagicMock()
+    task.status = "IN_PROGRESS"
+    task.has_errors.return_value = False
+
+    async def refresh_task(_):
+        task.status = "COMPLETE"
+
+    client = AsyncClient(api_key="api_key")
+    with (
+        patch.object(client, "refresh_task", refresh_task),
+        patch(
+            "labelbox.async_client.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep,
+    ):
+        asyncio.run(client.wait_till_done(task))
+
+    assert task.status == "COMPLETE"
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] <= INITIAL_CHECK_INTERVAL
+    task.has_errors.assert_called_once()
+
+
+def test_wait_till_done_check_frequency():
+    client = AsyncClient(api_key="api_key")
+    with pytest.raises(ValueError):
+        asyncio.run(client.wait_till_done(MagicMock(), check_frequency=1))
+
+
+def test_paginate_streaming():
+    def handler(request):
+        skip = int(json.loads(request.content)["query"].split()[1])
+        count = _PAGE_SIZE if skip == 0 else 3
+        items = [{"id": skip + i} for i in range(count)]
+        return httpx.Response(200, json={"data": {"items": items}})
+
+    client = _async_client(handler)
+    collection = _collection(client.client).stream()
+
+    async def collect():
+        return [item async for item in client.paginate(collection)]
+
+    assert asyncio.run(collect()) == list(range(_PAGE_SIZE + 3))
+    assert collection._data == []
+    assert asyncio.run(collect()) == list(range(_PAGE_SIZE + 3))
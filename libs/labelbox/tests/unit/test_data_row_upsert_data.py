@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -170,3 +171,86 @@ def test_create_row_data_none():
             dataset.create_data_rows(items)
 
     client.execute.assert_not_called()
+
+
+def _dataset(client):
+    return Dataset(
+        client,
+        {
+            "id": "test_dataset",
+            "name": "test_dataset",
+            "createdAt": "2021-06-01T00:00:00.000Z",
+            "description": "test_dataset",
+            "updatedAt": "2021-06-01T00:00:00.000Z",
+            "rowCount": 0,
+        },
+    )
+
+
+def test_upsert_data_rows_consumes_generator():
+    uploads = []
+
+    def upload_data(data, content_type=None, filename=None):
+        uploads.append((filename, data))
+        return f"http://bar.com/{len(uploads)}"
+
+    client = MagicMock()
+    client.upload_data.side_effect = upload_data
+    items = (
+        {"key": GlobalKey(f"key{i}"), "external_id": f"ex_id{i}"}
+        for i in range(3)
+    )
+
+    with patch("labelbox.schema.dataset.DataUpsertTask"):
+        _dataset(client).upsert_data_rows(items)
+
+    (chunk_name, chunk), (manifest_name, manifest) = uploads
+    assert chunk_name == "json_import.json"
+    assert [item["id"]["value"] for item in json.loads(chunk)] == [
+        "key0",
+        "key1",
+        "key2",
+    ]
+    assert manifest_name == "manifest.json"
+    assert json.loads(manifest) == {
+        "source": "SDK",
+        "item_count": 3,
+        "chunk_uris": ["http://bar.com/1"],
+    }
+
+
+def test_upsert_data_rows_generator_with_empty_item():
+    client = MagicMock()
+    items = iter(
+        [
+            {"key": GlobalKey("key0"), "external_id": "ex_id"},
+            {"key": GlobalKey("foo")},
+        ]
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=r"The following items have an empty payload: \['foo'\]",
+    ):
+        _dataset(client).upsert_data_rows(items)
+    client.execute.assert_not_called()
+
+
+def test_upsert_data_rows_list_with_empty_items_uploads_nothing():
+    client = MagicMock()
+    items = [
+        {"key": GlobalKey("key0"), "external_id": "ex_id"},
+        {"key": GlobalKey("foo")},
+        {"key": GlobalKey("bar")},
+    ]
+
+    # one chunk per item, the first one would be uploaded if streamed
+    with patch("labelbox.schema.dataset.UPSERT_CHUNK_SIZE_BYTES", 1):
+        with pytest.raises(
+            ValueError,
+            match=r"The following items have an empty payload: "
+            r"\['foo', 'bar'\]",
+        ):
+            _dataset(client).upsert_data_rows(items)
+    client.upload_data.assert_not_called()
+    client.execute.assert_not_called()
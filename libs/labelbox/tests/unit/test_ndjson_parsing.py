@@ -1,5 +1,8 @@
 import ast
-from io import StringIO
+import json
+from io import BytesIO, StringIO
+
+import pytest
 
 from labelbox import parser
 
@@ -42,3 +45,82 @@ def test_non_ascii_new_line(ndjson_content_with_nonascii_and_line_breaks):
     # NOTE: json parser converts unicode chars to unicode literals by default and this is a good practice
     #   but it is not what we want here since we want to compare the strings with actual unicode chars
     assert ast.literal_eval("'" + parser.dumps(parsed) + "'") == line
+
+
+def test_iter_loads_file_handle(ndjson_content):
+    line, expected_objects = ndjson_content
+
+    objects = parser.iter_loads(BytesIO(line.encode("utf-8") + b"\n\n"))
+
+    assert next(objects) == expected_objects[0]
+    assert list(objects) == expected_objects[1:]
+
+
+def test_iter_loads_only_splits_on_new_lines():
+    # str.splitlines would also split on these
+    objects = [{"text": "a b\x1cc\x85d"}, {"text": "e"}]
+
+    assert (
+        parser.loads(
+            json.dumps(objects[0], ensure_ascii=False) + '\n{"text": "e"}'
+        )
+        == objects
+    )
+
+
+def test_iter_loads_reports_invalid_lines():
+    content = b'{"a": 1}\n\n{"a": \n{"a": 3}'
+
+    with pytest.raises(parser.NdjsonDecodeError, match="line 3") as exc_info:
+        parser.loads(content)
+    assert exc_info.value.line_number == 3
+    assert exc_info.value.line == b'{"a": \n'
+
+    errors = []
+    assert parser.loads(content, on_error=errors.append) == [
+        {"a": 1},
+        {"a": 3},
+    ]
+    assert [e.line_number for e in errors] == [3]
+
+
+def test_dump_to_text_and_binary_files(ndjson_content):
+    line, objects = ndjson_content
+    text_io, bytes_io = StringIO(), BytesIO()
+
+    parser.dump(iter(objects), text_io)
+    parser.dump(iter(objects), bytes_io)
+
+    assert text_io.getvalue() == line
+    assert bytes_io.getvalue() == line.encode("utf-8")
+
+
+def test_dumps_matches_dump(ndjson_content):
+    line, objects = ndjson_content
+
+    assert parser.dumps(iter(objects)) == line
+    assert list(parser.iter_dumps(objects)) == line.split("\n")
+
+
+def test_ndjson_decoder_is_deprecated(ndjson_content):
+    line, objects = ndjson_content
+
+    with pytest.warns(DeprecationWarning):
+        assert json.loads(line, cls=parser.NdjsonDecoder) == objects
+
+
+def test_dump_defaults_to_text_for_unknown_file_objects(ndjson_content):
+    line, objects = ndjson_content
+
+    class TextWriter:
+        def __init__(self):
+            self.parts = []
+
+        def write(self, part):
+            assert isinstance(part, str)
+            self.parts.append(part)
+
+    writer = TextWriter()
+    parser.dump(iter(objects), writer)
+
+    assert "".join(writer.parts) == line
@@ -0,0 +1,130 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lbox.exceptions import ApiLimitError
+
+from labelbox.schema.data_row_metadata import (
+    DataRowMetadataOntology,
+    _batch_operations,
+)
+
+
+def _echo_batches(batches):
+    def batch_function(batch):
+        batches.append(list(batch))
+        return [f"result-{item}" for item in batch]
+
+    return batch_function
+
+
+def test_batch_operations_sends_batches_of_batch_size():
+    batches = []
+
+    res = _batch_operations(_echo_batches(batches), list(range(7)), 3)
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert res == [f"result-{i}" for i in range(7)]
+
+
+def test_concurrent_batch_operations_keep_input_order():
+    def batch_function(batch):
+        # later batches finish first
+        time.sleep(0.01 * (10 - batch[0]))
+        return [f"result-{item}" for item in batch]
+
+    res = _batch_operations(
+        batch_function, list(range(10)), 1, max_concurrent_batches=5
+    )
+
+    assert res == [f"result-{i}" for i in range(10)]
+
+
+def test_concurrent_batch_operations_bound_requests_in_flight():
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def batch_function(batch):
+        with lock:
+            in_flight.append(batch)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(batch)
+        return batch
+
+    res = _batch_operations(
+        batch_function, list(range(20)), 2, max_concurrent_batches=3
+    )
+
+    assert res == list(range(20))
+    assert max(max_in_flight) == 3
+
+
+def test_batch_operations_back_off_on_api_limit():
+    batches = []
+    echo = _echo_batches(batches)
+    limited = []
+
+    def batch_function(batch):
+        if batch[0] == 0 and not limited:
+            limited.append(batch)
+            raise ApiLimitError("Too many requests")
+        return echo(batch)
+
+    with patch("time.sleep") as sleep:
+        res = _batch_operations(
+            batch_function,
+            [0, 1, 2],
+            2,
+            max_concurrent_batches=4,
+        )
+
+    assert res == ["result-0", "result-1", "result-2"]
+    assert sorted(batches) == [[0, 1], [2]]
+    sleep.assert_called_once()
+
+
+def test_batch_operations_sequential_do_not_retry():
+    batch_function = MagicMock(side_effect=ApiLimitError("Too many requests"))
+
+    with pytest.raises(ApiLimitError):
+        _batch_operations(batch_function, [0, 1], 1)
+    batch_function.assert_called_once()
+
+
+def test_batch_operations_raise_other_errors():
+    batch_function = MagicMock(side_effect=ValueError("Invalid"))
+
+    with pytest.raises(ValueError):
+        _batch_operations(batch_function, [0, 1], 1)
+    batch_function.assert_called_once()
+
+
+def test_batch_operations_validate_arguments():
+    with pytest.raises(ValueError):
+        _batch_operations(MagicMock(), [0], 0)
+    with pytest.raises(ValueError):
+        _batch_operations(MagicMock(), [0], 1, max_concurrent_batches=0)
+
+
+def test_bulk_export_uses_batch_size_and_concurrency():
+    client = MagicMock()
+    client.execute.side_effect = lambda query, params: {
+        "dataRowCustomMetadata": [
+            {"dataRowId": id, "globalKey": None, "fields": []}
+            for id in params["dataRowIdentifiers"]["ids"]
+        ]
+    }
+    with patch.object(
+        DataRowMetadataOntology, "_get_ontology", return_value=[]
+    ):
+        mdo = DataRowMetadataOntology(client)
+
+    ids = [f"data-row-{i}" for i in range(5)]
+    res = mdo.bulk_export(ids, batch_size=2, max_concurrent_batches=2)
+
+    assert [m.data_row_id for m in res] == ids
+    assert client.execute.call_count == 3
@@ -0,0 +1,163 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from labelbox.schema.data_row_metadata import (
+    DataRowMetadataField,
+    DataRowMetadataOntology,
+)
+
+TEXT_SCHEMA_ID = "cko8s9r5v0001h2dk9elqdidh"
+ENUM_SCHEMA_ID = "cko8sbczn0002h2dkdaxb5kal"
+OPTION_ID = "cko8sbscr0003h2dk04w86hof"
+NEW_SCHEMA_ID = "cko8sdzv70006h2dk8jg64zvb"
+
+RAW_ONTOLOGY = [
+    {
+        "id": TEXT_SCHEMA_ID,
+        "name": "tag",
+        "kind": "CustomMetadataString",
+        "reserved": True,
+        "options": [],
+    },
+    {
+        "id": ENUM_SCHEMA_ID,
+        "name": "split",
+        "kind": "CustomMetadataEnum",
+        "reserved": True,
+        "options": [
+            {
+                "id": OPTION_ID,
+                "name": "train",
+                "kind": "CustomMetadataEnumOption",
+                "reserved": True,
+            }
+        ],
+    },
+]
+
+
+@pytest.fixture
+def mdo():
+    with patch.object(
+        DataRowMetadataOntology, "_get_ontology", return_value=RAW_ONTOLOGY
+    ):
+        yield DataRowMetadataOntology(MagicMock())
+
+
+def test_parse_upsert_metadata_by_name_and_id(mdo):
+    parsed = mdo.parse_upsert_metadata(
+        [
+            {"name": "tag", "value": "a"},
+            {"name": "split", "value": "train"},
+            DataRowMetadataField(schema_id=ENUM_SCHEMA_ID, value=OPTION_ID),
+        ]
+    )
+
+    assert parsed == [
+        {"schemaId": TEXT_SCHEMA_ID, "value": "a"},
+        {"schemaId": ENUM_SCHEMA_ID, "value": {}},
+        {"schemaId": OPTION_ID, "value": {}},
+        {"schemaId": ENUM_SCHEMA_ID, "value": {}},
+        {"schemaId": OPTION_ID, "value": {}},
+    ]
+
+
+def test_parse_upsert_metadata_validates_values(mdo):
+    with pytest.raises(ValueError, match="Expected a string"):
+        mdo.parse_upsert_metadata([{"name": "tag", "value": 1}])
+    with pytest.raises(ValueError, match="not found"):
+        mdo.parse_upsert_metadata(
+            [{"schema_id": ENUM_SCHEMA_ID, "value": TEXT_SCHEMA_ID}]
+        )
+    with pytest.raises(ValueError, match="Option id"):
+        mdo.parse_upsert_metadata([{"schema_id": OPTION_ID, "value": "a"}])
+
+
+def test_validators_are_compiled_once(mdo):
+    with patch(
+        "labelbox.schema.data_row_metadata._make_upsert_validator"
+    ) as make_validator:
+        for _ in range(3):
+            mdo.parse_upsert_metadata([{"name": "tag", "value": "a"}])
+
+    make_validator.assert_not_called()
+
+
+def test_refresh_ontology_rebuilds_validators(mdo):
+    new_schema = {
+        "id": NEW_SCHEMA_ID,
+        "name": "score",
+        "kind": "CustomMetadataNumber",
+        "reserved": False,
+        "options": [],
+    }
+    mdo._get_ontology = MagicMock(return_value=RAW_ONTOLOGY + [new_schema])
+
+    parsed = mdo.parse_upsert_metadata(
+        [{"schema_id": NEW_SCHEMA_ID, "value": "1"}]
+    )
+
+    assert parsed == [{"schemaId": NEW_SCHEMA_ID, "value": 1.0}]
+    mdo._get_ontology.assert_called_once()
+
+
+def test_parse_upsert_metadata_batch(mdo):
+    with patch.object(
+        mdo, "_get_by_name_normalized", wraps=mdo._get_by_name_normalized
+    ) as get_by_name:
+        parsed = mdo.parse_upsert_metadata_batch(
+            [
+                [{"name": "tag", "value": "a"}],
+                [],
+                [
+                    {"name": "tag", "value": "b"},
+                    DataRowMetadataField(
+                        schema_id=ENUM_SCHEMA_ID, value=OPTION_ID
+                    ),
+                ],
+            ]
+        )
+
+    assert parsed == [
+        [{"schemaId": TEXT_SCHEMA_ID, "value": "a"}],
+        [],
+        [
+            {"schemaId": TEXT_SCHEMA_ID, "value": "b"},
+            {"schemaId": ENUM_SCHEMA_ID, "value": {}},
+            {"schemaId": OPTION_ID, "value": {}},
+        ],
+    ]
+    # names are resolved once for the whole batch
+    get_by_name.assert_called_once_with("tag")
+
+
+def test_parse_upsert_metadata_batch_reports_rows(mdo):
+    mdo._get_ontology = MagicMock(return_value=RAW_ONTOLOGY)
+
+    with pytest.raises(ValueError) as exc_info:
+        mdo.parse_upsert_metadata_batch(
+            [
+                [{"name": "tag", "value": "a"}],
+                [{"name": "tag", "value": 1}],
+                [{"name": "missing", "value": "a"}],
+                [{"schema_id": NEW_SCHEMA_ID, "value": "a"}],
+                [{"schema_id": NEW_SCHEMA_ID, "value": "b"}],
+                [{"value": "a"}],
+            ]
+        )
+
+    lines = str(exc_info.value).splitlines()
+    assert lines[0] == "Invalid metadata in rows:"
+    assert [line.split(":")[0] for line in lines[1:]] == [
+        "row 1",
+        "row 2",
+        "row 3",
+        "row 4",
+        "row 5",
+    ]
+    assert "Expected a string" in lines[1]
+    assert "no metadata with name 'missing'" in lines[2]
+    assert "not found in ontology" in lines[3]
+    # the ontology is refreshed once for the whole batch
+    mdo._get_ontology.assert_called_once()
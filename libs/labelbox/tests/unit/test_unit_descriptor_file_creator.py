@@ -1,7 +1,11 @@
-import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
 
-from unittest.mock import MagicMock, Mock
 import pytest
+from lbox import json_codec
 
 from labelbox.schema.internal.descriptor_file_creator import (
     DescriptorFileCreator,
@@ -19,7 +23,7 @@ def test_chunk_down_by_bytes_row_too_large():
     res = descriptor_file_creator._chunk_down_by_bytes(
         chunk, max_chunk_size_bytes
     )
-    assert [x for x in res] == [json.dumps([{"row_data": "a"}])]
+    assert [x for x in res] == [json_codec.dumps_bytes([{"row_data": "a"}])]
 
 
 def test_chunk_down_by_bytes_more_chunks():
@@ -28,14 +32,14 @@ def test_chunk_down_by_bytes_more_chunks():
     descriptor_file_creator = DescriptorFileCreator(client)
 
     chunk = [{"row_data": "a"}, {"row_data": "b"}]
-    max_chunk_size_bytes = len(json.dumps(chunk).encode("utf-8")) - 1
+    max_chunk_size_bytes = len(json_codec.dumps_bytes(chunk)) - 1
 
     res = descriptor_file_creator._chunk_down_by_bytes(
         chunk, max_chunk_size_bytes
     )
     assert [x for x in res] == [
-        json.dumps([{"row_data": "a"}]),
-        json.dumps([{"row_data": "b"}]),
+        json_codec.dumps_bytes([{"row_data": "a"}]),
+        json_codec.dumps_bytes([{"row_data": "b"}]),
     ]
 
 
@@ -45,11 +49,151 @@ def test_chunk_down_by_bytes_one_chunk():
     descriptor_file_creator = DescriptorFileCreator(client)
 
     chunk = [{"row_data": "a"}, {"row_data": "b"}]
-    max_chunk_size_bytes = len(json.dumps(chunk).encode("utf-8"))
+    max_chunk_size_bytes = len(json_codec.dumps_bytes(chunk))
 
     res = descriptor_file_creator._chunk_down_by_bytes(
         chunk, max_chunk_size_bytes
     )
     assert [x for x in res] == [
-        json.dumps([{"row_data": "a"}, {"row_data": "b"}])
+        json_codec.dumps_bytes([{"row_data": "a"}, {"row_data": "b"}])
     ]
+
+
+def test_chunk_down_by_bytes_packs_greedily():
+    client = MagicMock()
+
+    descriptor_file_creator = DescriptorFileCreator(client)
+
+    items = ({"row_data": str(i)} for i in range(10))
+    item_size = len(json_codec.dumps_bytes({"row_data": "0"}))
+    # three items and their separators fit in a chunk
+    max_chunk_size_bytes = 2 + 3 * item_size + 2
+
+    res = list(
+        descriptor_file_creator._chunk_down_by_bytes(
+            items, max_chunk_size_bytes
+        )
+    )
+    assert res == [
+        json_codec.dumps_bytes([{"row_data": str(i)} for i in range(0, 3)]),
+        json_codec.dumps_bytes([{"row_data": str(i)} for i in range(3, 6)]),
+        json_codec.dumps_bytes([{"row_data": str(i)} for i in range(6, 9)]),
+        json_codec.dumps_bytes([{"row_data": "9"}]),
+    ]
+    assert all(len(chunk) <= max_chunk_size_bytes for chunk in res)
+
+
+def test_chunk_down_by_bytes_counts_encoded_bytes():
+    client = MagicMock()
+
+    descriptor_file_creator = DescriptorFileCreator(client)
+
+    chunk = [{"row_data": "é"}, {"row_data": "ü"}]
+    max_chunk_size_bytes = len(json_codec.dumps(chunk))
+
+    res = descriptor_file_creator._chunk_down_by_bytes(
+        chunk, max_chunk_size_bytes
+    )
+    assert [x for x in res] == [
+        json_codec.dumps_bytes([{"row_data": "é"}]),
+        json_codec.dumps_bytes([{"row_data": "ü"}]),
+    ]
+
+
+def test_chunk_down_by_bytes_no_items():
+    client = MagicMock()
+
+    descriptor_file_creator = DescriptorFileCreator(client)
+
+    assert list(descriptor_file_creator._chunk_down_by_bytes([], 10)) == []
+
+
+def test_create_uploads_chunks_in_order():
+    client = MagicMock()
+    client.upload_data.side_effect = lambda chunk, **kwargs: chunk.decode()
+
+    descriptor_file_creator = DescriptorFileCreator(client)
+
+    items = [{"row_data": f"https://storage/{i:02d}.jpg"} for i in range(100)]
+    max_chunk_size_bytes = len(json_codec.dumps_bytes(items[:10]))
+
+    uris = descriptor_file_creator.create(items, max_chunk_size_bytes)
+
+    assert uris == [
+        json_codec.dumps(items[i : i + 10]) for i in range(0, 100, 10)
+    ]
+    assert client.upload_data.call_args.kwargs == {
+        "content_type": "application/json",
+        "filename": "json_import.json",
+    }
+
+
+def test_create_uploads_while_preparing():
+    events = []
+    client = MagicMock()
+
+    def upload_data(chunk, **kwargs):
+        events.append("upload")
+        return "uri"
+
+    client.upload_data.side_effect = upload_data
+
+    def items():
+        for i in range(200):
+            events.append("item")
+            yield {"row_data": f"https://storage/{i}.jpg"}
+
+    descriptor_file_creator = DescriptorFileCreator(client)
+    # one item per chunk
+    uris = descriptor_file_creator.create(items(), 1)
+
+    assert uris == ["uri"] * 200
+    # uploads started before all the items were read
+    assert events.index("upload") < len(events) - events[::-1].index("item")
+    assert events[-1] == "upload"
+
+
+def test_prepare_items_preserves_order(tmp_path):
+    client = MagicMock()
+
+    def upload_file(path):
+        # finish the uploads out of order
+        time.sleep(random.random() / 100)
+        return f"https://storage/{os.path.basename(path)}"
+
+    client.upload_file.side_effect = upload_file
+    items = []
+    for i in range(50):
+        if i % 3 == 0:
+            path = tmp_path / f"{i}.jpg"
+            path.write_bytes(b"image")
+            items.append({"row_data": str(path), "external_id": str(i)})
+        else:
+            items.append(
+                {"row_data": f"https://storage/{i}.jpg", "external_id": str(i)}
+            )
+
+    prepared = list(
+        DescriptorFileCreator(client)._prepare_items_for_upload(items)
+    )
+
+    assert [item["external_id"] for item in prepared] == [
+        str(i) for i in range(50)
+    ]
+    assert [item["row_data"] for item in prepared] == [
+        f"https://storage/{i}.jpg" for i in range(50)
+    ]
+    assert client.upload_file.call_count == 17
+
+
+def test_prepare_items_without_local_files_runs_inline():
+    client = MagicMock()
+    items = [{"row_data": f"https://storage/{i}.jpg"} for i in range(10)]
+
+    with patch.object(ThreadPoolExecutor, "submit") as submit:
+        prepared = list(
+            DescriptorFileCreator(client)._prepare_items_for_upload(items)
+        )
+
+    submit.assert_not_called()
+    assert prepared == items
@@ -0,0 +1,177 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from labelbox import Client, GlobalKeyCache
+
+
+def test_get_and_put():
+    cache = GlobalKeyCache()
+    cache.put("ns", {"key-1": "id-1", "key-2": "id-2"})
+
+    assert cache.get_data_row_ids("ns", ["key-1", "key-3"]) == {"key-1": "id-1"}
+    assert cache.get_global_keys("ns", ["id-2"]) == {"id-2": "key-2"}
+    assert cache.get_data_row_ids("other", ["key-1"]) == {}
+
+
+def test_put_replaces_entries_of_keys_and_data_rows():
+    cache = GlobalKeyCache()
+    cache.put("ns", {"key-1": "id-1", "key-2": "id-2"})
+
+    # key-1 moves to data row 2
+    cache.put("ns", {"key-1": "id-2"})
+
+    assert cache.get_data_row_ids("ns", ["key-1", "key-2"]) == {"key-1": "id-2"}
+    assert cache.get_global_keys("ns", ["id-1", "id-2"]) == {"id-2": "key-1"}
+
+
+def test_invalidate():
+    cache = GlobalKeyCache()
+    cache.put("ns", {"key-1": "id-1", "key-2": "id-2", "key-3": "id-3"})
+
+    cache.invalidate("ns", global_keys=["key-1"], data_row_ids=["id-2"])
+
+    assert cache.get_data_row_ids("ns", ["key-1", "key-2", "key-3"]) == {
+        "key-3": "id-3"
+    }
+    assert cache.get_global_keys("ns", ["id-1", "id-2"]) == {}
+
+
+def test_evicts_least_recently_used_entries():
+    cache = GlobalKeyCache(max_entries=2)
+    cache.put("ns", {"key-1": "id-1", "key-2": "id-2"})
+    cache.get_data_row_ids("ns", ["key-1"])
+
+    cache.put("ns", {"key-3": "id-3"})
+
+    assert cache.get_data_row_ids("ns", ["key-1", "key-2", "key-3"]) == {
+        "key-1": "id-1",
+        "key-3": "id-3",
+    }
+    assert cache.get_global_keys("ns", ["id-2"]) == {}
+
+
+def test_persists_to_disk(tmp_path):
+    path = str(tmp_path / "cache" / "keys.json")
+    cache = GlobalKeyCache(path, max_entries=2)
+    cache.put("ns", {"key-1": "id-1", "key-2": "id-2"})
+    cache.get_data_row_ids("ns", ["key-1"])
+    cache.close()
+
+    cache = GlobalKeyCache(path, max_entries=2)
+    cache.put("ns", {"key-3": "id-3"})
+
+    # recency is kept between instances
+    assert cache.get_data_row_ids("ns", ["key-1", "key-2"]) == {"key-1": "id-1"}
+
+
+def test_ignores_unreadable_files(tmp_path):
+    path = tmp_path / "keys.json"
+    path.write_text("not json")
+
+    cache = GlobalKeyCache(str(path))
+
+    assert cache.get_data_row_ids("ns", ["key-1"]) == {}
+
+
+def _result(name, data):
+    return {name: {"jobStatus": "COMPLETE", "data": data}}
+
+
+def _fetched(ids):
+    return _result(
+        "dataRowsForGlobalKeysResult",
+        {
+            "fetchedDataRows": [{"id": id} for id in ids],
+            "notFoundGlobalKeys": [],
+            "accessDeniedGlobalKeys": [],
+        },
+    )
+
+
+@pytest.fixture
+def client():
+    client = Client(api_key="api_key", global_key_cache=GlobalKeyCache())
+    client.execute = MagicMock()
+    return client
+
+
+def test_get_data_row_ids_for_global_keys_uses_cache(client):
+    client.execute.side_effect = [
+        {"dataRowsForGlobalKeys": {"jobId": "job-1"}},
+        _fetched(["id-1", ""]),
+        {"dataRowsForGlobalKeys": {"jobId": "job-2"}},
+        _fetched(["id-3"]),
+    ]
+
+    first = client.get_data_row_ids_for_global_keys(["key-1", "key-2"])
+    second = client.get_data_row_ids_for_global_keys(["key-3", "key-1"])
+    third = client.get_data_row_ids_for_global_keys(["key-1", "key-3"])
+
+    assert first["results"] == ["id-1", ""]
+    assert second == {
+        "status": "SUCCESS",
+        "results": ["id-3", "id-1"],
+        "errors": [],
+    }
+    assert third["results"] == ["id-1", "id-3"]
+    # only key-3 was resolved by the second job, the third made no request
+    assert client.execute.call_args_list[2].args[1] == {"globalKeys": ["key-3"]}
+    assert client.execute.call_count == 4
+
+
+def test_clear_global_keys_invalidates_cache(client):
+    client.global_key_cache.put(client._cache_namespace(), {"key-1": "id-1"})
+    client.execute.side_effect = [
+        {"clearGlobalKeys": {"jobId": "job"}},
+        _result(
+            "clearGlobalKeysResult",
+            {
+                "clearedGlobalKeys": ["key-1"],
+                "failedToClearGlobalKeys": [],
+                "notFoundGlobalKeys": [],
+                "accessDeniedGlobalKeys": [],
+            },
+        ),
+    ]
+
+    client.clear_global_keys(["key-1"])
+
+    assert (
+        client.global_key_cache.get_data_row_ids(
+            client._cache_namespace(), ["key-1"]
+        )
+        == {}
+    )
+
+
+def test_assign_global_keys_updates_cache(client):
+    namespace = client._cache_namespace()
+    client.global_key_cache.put(namespace, {"key-1": "id-1", "old": "id-2"})
+    client.execute.side_effect = [
+        {"assignGlobalKeysToDataRows": {"jobId": "job"}},
+        _result(
+            "assignGlobalKeysToDataRowsResult",
+            {
+                "sanitizedAssignments": [],
+                "invalidGlobalKeyAssignments": [
+                    {"dataRowId": "id-3", "globalKey": "key-1"}
+                ],
+                "unmodifiedAssignments": [
+                    {"dataRowId": "id-2", "globalKey": "new"}
+                ],
+                "accessDeniedAssignments": [],
+            },
+        ),
+    ]
+
+    client.assign_global_keys_to_data_rows(
+        [
+            {"data_row_id": "id-2", "global_key": "new"},
+            {"data_row_id": "id-3", "global_key": "key-1"},
+        ]
+    )
+
+    assert client.global_key_cache.get_data_row_ids(
+        namespace, ["key-1", "old", "new"]
+    ) == {"new": "id-2"}
@@ -0,0 +1,156 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from lbox.exceptions import LabelboxError
+
+from labelbox import Client
+
+
+def _get_ids_client(not_found=(), delays=None, statuses=None):
+    """A client resolving global key "key-i" to data row "id-i". Jobs
+    complete on their first poll, after delays[first key] seconds, unless
+    statuses[first key] gives another job status."""
+    client = Client(api_key="api_key")
+    lock = threading.Lock()
+    jobs = {}
+    started = []
+
+    def execute(query, params):
+        if "globalKeys" in params:
+            keys = params["globalKeys"]
+            with lock:
+                job_id = f"job-{len(jobs)}"
+                jobs[job_id] = keys
+                started.append(keys)
+            return {"dataRowsForGlobalKeys": {"jobId": job_id}}
+        keys = jobs[params["jobId"]]
+        time.sleep((delays or {}).get(keys[0], 0))
+        return {
+            "dataRowsForGlobalKeysResult": {
+                "jobStatus": (statuses or {}).get(keys[0], "COMPLETE"),
+                "data": {
+                    "fetchedDataRows": [
+                        {"id": "" if k in not_found else k.replace("key", "id")}
+                        for k in keys
+                    ],
+                    "notFoundGlobalKeys": [k for k in keys if k in not_found],
+                    "accessDeniedGlobalKeys": [],
+                },
+            }
+        }
+
+    client.execute = execute
+    return client, started
+
+
+@pytest.fixture(autouse=True)
+def small_chunks():
+    with patch("labelbox.client.GLOBAL_KEYS_CHUNK_SIZE", 2):
+        yield
+
+
+def test_get_data_row_ids_for_global_keys_in_chunks():
+    keys = [f"key-{i}" for i in range(5)]
+    # the first chunk completes last
+    client, started = _get_ids_client(
+        not_found={"key-3"}, delays={"key-0": 0.05}
+    )
+
+    res = client.get_data_row_ids_for_global_keys(keys)
+
+    assert sorted(started) == [
+        ["key-0", "key-1"],
+        ["key-2", "key-3"],
+        ["key-4"],
+    ]
+    assert res["status"] == "PARTIAL SUCCESS"
+    assert res["results"] == ["id-0", "id-1", "id-2", "", "id-4"]
+    assert res["errors"] == [
+        {"global_key": "key-3", "error": "Data Row not found"}
+    ]
+
+
+def test_iter_data_row_ids_for_global_keys_yields_chunks():
+    keys = [f"key-{i}" for i in range(3)]
+    client, _ = _get_ids_client(not_found={"key-2"})
+
+    chunks = list(client.iter_data_row_ids_for_global_keys(keys))
+
+    assert chunks == [
+        {"status": "SUCCESS", "results": ["id-0", "id-1"], "errors": []},
+        {
+            "status": "FAILURE",
+            "results": [""],
+            "errors": [{"global_key": "key-2", "error": "Data Row not found"}],
+        },
+    ]
+
+
+def test_get_data_row_ids_for_no_global_keys():
+    client, started = _get_ids_client()
+
+    res = client.get_data_row_ids_for_global_keys([])
+
+    assert res == {"status": "SUCCESS", "results": [], "errors": []}
+    assert started == []
+
+
+def test_assign_global_keys_validates_inputs_eagerly():
+    client = Client(api_key="api_key")
+
+    with pytest.raises(ValueError):
+        client.iter_assign_global_keys_to_data_rows([{"global_key": "key"}])
+
+
+def test_failed_job_raises_by_default():
+    keys = [f"key-{i}" for i in range(5)]
+    client, _ = _get_ids_client(statuses={"key-2": "FAILED"})
+
+    with pytest.raises(LabelboxError, match="dataRowsForGlobalKeys failed"):
+        client.get_data_row_ids_for_global_keys(keys)
+
+
+def test_failed_job_reported_does_not_discard_other_chunks():
+    keys = [f"key-{i}" for i in range(5)]
+    client, _ = _get_ids_client(statuses={"key-2": "FAILED"})
+
+    res = client.get_data_row_ids_for_global_keys(keys, report_failed_jobs=True)
+
+    assert res["status"] == "PARTIAL SUCCESS"
+    assert res["results"] == ["id-0", "id-1", "", "", "id-4"]
+    assert res["errors"] == [
+        {"global_key": "key-2", "error": "Job dataRowsForGlobalKeys failed."},
+        {"global_key": "key-3", "error": "Job dataRowsForGlobalKeys failed."},
+    ]
+
+
+def test_timeout_applies_to_the_whole_call():
+    keys = [f"key-{i}" for i in range(20)]
+    client, started = _get_ids_client(
+        statuses={f"key-{i}": "IN_PROGRESS" for i in range(0, 20, 2)}
+    )
+
+    start = time.monotonic()
+    res = client.get_data_row_ids_for_global_keys(
+        keys, timeout_seconds=0.3, report_failed_jobs=True
+    )
+
+    # the jobs run 4 at a time, so per chunk timeouts would add up to 0.9s
+    assert time.monotonic() - start < 0.6
+    assert res["status"] == "FAILURE"
+    assert res["results"] == [""] * 20
+    assert len(res["errors"]) == 20
+    assert len(started) < 10
+
+
+def test_timeout_starts_with_the_iteration():
+    keys = [f"key-{i}" for i in range(3)]
+    client, started = _get_ids_client(delays={"key-0": 0.1})
+
+    chunks = client.iter_data_row_ids_for_global_keys(keys, timeout_seconds=0.2)
+    time.sleep(0.3)
+
+    assert started == []
+    assert [chunk["status"] for chunk in chunks] == ["SUCCESS", "SUCCESS"]
@@ -0,0 +1,150 @@
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from labelbox.client import Client
+from labelbox.multipart import MultipartFileStream
+
+BOUNDARY = "0123456789abcdef"
+
+
+def _requests_body(data, files):
+    with patch("urllib3.filepost.choose_boundary", return_value=BOUNDARY):
+        prepped = requests.Request(
+            "POST", "http://localhost", data=data, files=files
+        ).prepare()
+    return prepped.body
+
+
+@pytest.mark.parametrize(
+    "filename,content_type,expected_file",
+    [
+        ("image.jpg", "image/jpeg", ("image.jpg", b"x" * 1000, "image/jpeg")),
+        (None, None, b"x" * 1000),
+    ],
+)
+def test_multipart_file_stream_matches_requests_encoding(
+    filename, content_type, expected_file
+):
+    fields = {"operations": '{"query": "q"}', "map": '{"1": ["a"]}'}
+    progress = []
+    with patch("labelbox.multipart.choose_boundary", return_value=BOUNDARY):
+        body = MultipartFileStream(
+            fields,
+            "1",
+            io.BytesIO(b"x" * 1000),
+            1000,
+            filename=filename,
+            content_type=content_type,
+            progress_callback=lambda sent, total: progress.append(sent),
+            chunk_size=300,
+        )
+
+    encoded = b"".join(body)
+
+    assert encoded == _requests_body(fields, {"1": expected_file})
+    assert len(body) == len(encoded)
+    assert body.content_type == f"multipart/form-data; boundary={BOUNDARY}"
+    assert progress == [300, 600, 900, 1000]
+
+
+def test_multipart_file_stream_truncated_file():
+    body = MultipartFileStream({}, "1", io.BytesIO(b"x" * 10), 20)
+
+    with pytest.raises(ValueError):
+        b"".join(body)
+
+
+def _upload_client(responses):
+    client = Client(api_key="api_key")
+    bodies = []
+
+    def send(prepped, **kwargs):
+        bodies.append((prepped.headers, b"".join(prepped.body)))
+        return responses.pop(0)
+
+    client._request_client._connection = MagicMock()
+    client._request_client._connection.headers = (
+        requests.structures.CaseInsensitiveDict(
+            {
+                "Authorization": "Bearer api_key",
+                "Content-Type": "application/json",
+            }
+        )
+    )
+    client._request_client._connection.send.side_effect = send
+    return client, bodies
+
+
+def _response(status_code, payload=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload or {}).encode("utf-8")
+    return response
+
+
+def test_upload_file_streams_from_disk(tmp_path):
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"y" * 5000)
+    client, bodies = _upload_client(
+        [_response(200, {"data": {"uploadFile": {"url": "https://file"}}})]
+    )
+    progress = []
+
+    url = client.upload_file(
+        str(path), progress_callback=lambda sent, total: progress.append(total)
+    )
+
+    assert url == "https://file"
+    headers, body = bodies[0]
+    assert headers["Content-Type"].startswith("multipart/form-data")
+    assert int(headers["Content-Length"]) == len(body)
+    assert b'"contentLength": 5000' in body
+    assert b'filename="image.jpg"' in body
+    assert b"y" * 5000 in body
+    assert progress == [5000]
+
+
+def test_upload_stream_retries_from_start():
+    client, bodies = _upload_client(
+        [
+            _response(502),
+            _response(200, {"data": {"uploadFile": {"url": "https://file"}}}),
+        ]
+    )
+    stream = io.BytesIO(b"header" + b"z" * 100)
+    stream.seek(6)
+
+    with patch("time.sleep"):
+        url = client.upload_stream(stream, "a.txt", "text/plain")
+
+    assert url == "https://file"
+    assert len(bodies) == 2
+    for _, body in bodies:
+        assert b"\r\n\r\n" + b"z" * 100 + b"\r\n--" in body
+        assert b"header" not in body
+    assert b'"contentLength": 100' in bodies[1][1]
+
+
+def test_upload_stream_spools_unseekable_streams():
+    client, bodies = _upload_client(
+        [_response(200, {"data": {"uploadFile": {"url": "https://file"}}})]
+    )
+    stream = MagicMock()
+    stream.seekable.return_value = False
+    stream.read.side_effect = [b"w" * 10, b""]
+
+    assert client.upload_stream(stream, "a.txt", "text/plain") == "https://file"
+    assert b'"contentLength": 10' in bodies[0][1]
+
+
+def test_upload_stream_raises_on_errors():
+    client, _ = _upload_client(
+        [_response(200, {"errors": [{"message": "Too large"}]})]
+    )
+
+    with pytest.raises(Exception, match="Too large"):
+        client.upload_stream(io.BytesIO(b"a"))
@@ -0,0 +1,151 @@
+import gc
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from labelbox.pagination import PaginatedCollection, _PAGE_SIZE
+
+
+def _offset_client(n_items):
+    client = MagicMock()
+    lock = threading.Lock()
+    client.queries = []
+
+    def execute(query, params, experimental=False):
+        skip = int(query.split()[1])
+        with lock:
+            client.queries.append(skip)
+        count = max(0, min(_PAGE_SIZE, n_items - skip))
+        return {"items": [{"id": skip + i} for i in range(count)]}
+
+    client.execute.side_effect = execute
+    return client
+
+
+def _cursor_client(n_pages):
+    client = MagicMock()
+    client.cursors = []
+
+    def execute(query, params, experimental=False):
+        cursor = params["from"] or 0
+        client.cursors.append(cursor)
+        next_cursor = cursor + 1 if cursor + 1 < n_pages else None
+        return {"items": [{"id": cursor}], "next": next_cursor}
+
+    client.execute.side_effect = execute
+    return client
+
+
+def _collection(client, cursor_path=None):
+    return PaginatedCollection(
+        client=client,
+        query="query %d %d" if cursor_path is None else "query",
+        params={},
+        dereferencing=["items"],
+        obj_class=lambda _, item: item["id"],
+        cursor_path=cursor_path,
+    )
+
+
+@pytest.mark.parametrize("n_items", [0, 5, _PAGE_SIZE, _PAGE_SIZE * 3 + 7])
+def test_offset_prefetch(n_items):
+    client = _offset_client(n_items)
+    collection = _collection(client).prefetch(4)
+
+    assert list(collection) == list(range(n_items))
+    # fetched pages are kept, iterating again doesn't query
+    n_queries = len(client.queries)
+    assert list(collection) == list(range(n_items))
+    assert len(client.queries) == n_queries
+
+
+def test_offset_prefetch_fetches_pages_ahead():
+    client = _offset_client(_PAGE_SIZE * 10)
+    collection = _collection(client).prefetch(3)
+
+    assert next(iter(collection)) == 0
+    # the pages following the current one are requested in parallel
+    assert sorted(client.queries)[:3] == [0, _PAGE_SIZE, 2 * _PAGE_SIZE]
+
+
+def test_cursor_prefetch():
+    client = _cursor_client(5)
+    collection = _collection(client, cursor_path=["next"]).prefetch(2)
+
+    assert list(collection) == [0, 1, 2, 3, 4]
+    assert client.cursors == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_propagates_errors():
+    client = MagicMock()
+    client.execute.side_effect = RuntimeError("failed")
+    collection = _collection(client).prefetch(2)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        list(collection)
+
+
+def test_prefetch_closed_when_iteration_restarts():
+    n_items = _PAGE_SIZE * 10
+    client = _offset_client(n_items)
+    collection = _collection(client).prefetch(3)
+
+    for value in collection:
+        if value == 1:
+            break
+    executor = collection._prefetcher._executor
+
+    iter(collection)
+    assert executor._shutdown
+    assert list(collection) == list(range(n_items))
+
+
+def test_prefetch_closed_when_iteration_is_abandoned():
+    client = _offset_client(_PAGE_SIZE * 10)
+    collection = _collection(client).prefetch(3)
+
+    assert next(iter(collection)) == 0
+    executor = collection._prefetcher._executor
+    del collection
+    gc.collect()
+
+    assert executor._shutdown
+
+
+def test_prefetch_validates_pages():
+    with pytest.raises(ValueError):
+        _collection(MagicMock()).prefetch(-1)
+
+
+def test_streaming_drops_consumed_pages():
+    client = _offset_client(_PAGE_SIZE * 3 + 7)
+    collection = _collection(client).stream()
+
+    n_items = 0
+    for value in collection:
+        assert value == n_items
+        assert len(collection._data) <= _PAGE_SIZE
+        n_items += 1
+
+    assert n_items == _PAGE_SIZE * 3 + 7
+
+
+def test_streaming_reiteration_queries_again():
+    client = _offset_client(_PAGE_SIZE + 1)
+    collection = _collection(client).stream().prefetch(2)
+
+    assert list(collection) == list(range(_PAGE_SIZE + 1))
+    n_queries = len(client.queries)
+    assert list(collection) == list(range(_PAGE_SIZE + 1))
+    assert len(client.queries) == 2 * n_queries
+    assert collection.get_many(2) == [0, 1]
+
+
+def test_streaming_cursor_restarts_from_first_page():
+    client = _cursor_client(3)
+    collection = _collection(client, cursor_path=["next"]).stream()
+
+    assert collection.get_one() == 0
+    assert list(collection) == [0, 1, 2]
+    assert client.cursors == [0, 0, 1, 2]
@@ -0,0 +1,272 @@
+import threading
+from itertools import islice
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lbox.exceptions import (
+    LabelboxError,
+    ProcessingWaitTimeout,
+    TimeoutError,
+)
+
+from labelbox import Client, polling
+from labelbox.schema.project import Project
+from labelbox.schema.task import INITIAL_CHECK_INTERVAL, Task
+
+
+class _Clock:
+    """A fake monotonic clock advanced by sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with (
+        patch("labelbox.polling.time.monotonic", clock.monotonic),
+        patch("labelbox.polling.time.sleep", clock.sleep),
+    ):
+        yield clock
+
+
+def test_backoff_intervals_grow_with_jitter():
+    intervals = list(islice(polling.backoff_intervals(1.0, 8.0), 6))
+
+    for interval, upper in zip(intervals, [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]):
+        assert upper / 2 <= interval <= upper
+
+
+def test_poll_returns_first_result(clock):
+    check = MagicMock(side_effect=[None, None, "done"])
+
+    assert polling.poll(check, 60) == "done"
+    assert check.call_count == 3
+    assert len(clock.sleeps) == 2
+    assert clock.sleeps[0] <= polling.INITIAL_INTERVAL
+
+
+def test_poll_times_out(clock):
+    check = MagicMock(return_value=None)
+
+    assert polling.poll(check, 30, max_interval=4) is None
+    assert clock.now == 30
+    assert max(clock.sleeps) <= 4
+
+
+def test_poll_raises_check_errors(clock):
+    with pytest.raises(ValueError):
+        polling.poll(MagicMock(side_effect=ValueError), 30)
+
+
+def test_poll_all_stops_checking_finished_jobs(clock):
+    quick = MagicMock(return_value=True)
+    slow = MagicMock(side_effect=[False, False, True])
+
+    assert polling.poll_all([quick, slow], 60)
+    assert quick.call_count == 1
+    assert slow.call_count == 3
+
+
+def test_poll_all_checks_concurrently(clock):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def check():
+        barrier.wait()
+        return True
+
+    assert polling.poll_all([check] * 3, 60, max_concurrent_checks=3)
+
+
+def test_poll_all_times_out(clock):
+    assert not polling.poll_all([lambda: False], 10)
+    assert polling.poll_all([], 10)
+
+
+def _task(status):
+    return Task(
+        MagicMock(),
+        {
+            "id": "task-id",
+            "updatedAt": None,
+            "createdAt": None,
+            "name": "task",
+            "status": status,
+            "completionPercentage": 0.0,
+            "result": None,
+            "errors": None,
+            "type": "add-data-rows-to-batch",
+            "metadata": None,
+        },
+    )
+
+
+def test_task_wait_till_done_backs_off(clock):
+    task = _task("IN_PROGRESS")
+    statuses = iter(["IN_PROGRESS", "IN_PROGRESS", "COMPLETE"])
+
+    def refresh():
+        task.status = next(statuses)
+
+    with patch.object(task, "refresh", side_effect=refresh) as refresh_task:
+        task.wait_till_done(check_frequency=2.0)
+
+    assert task.status == "COMPLETE"
+    assert refresh_task.call_count == 3
+    assert INITIAL_CHECK_INTERVAL / 2 <= clock.sleeps[0]
+    assert clock.sleeps[0] <= INITIAL_CHECK_INTERVAL
+    assert max(clock.sleeps) <= 2.0
+
+
+def test_task_wait_till_done_times_out(clock):
+    task = _task("IN_PROGRESS")
+
+    with patch.object(task, "refresh") as refresh_task:
+        task.wait_till_done(timeout_seconds=10)
+
+    assert task.status == "IN_PROGRESS"
+    assert refresh_task.call_count > 0
+
+
+def _global_keys_client(responses):
+    client = Client(api_key="api_key")
+    client.execute = MagicMock(side_effect=responses)
+    return client
+
+
+def test_get_data_row_ids_for_global_keys_polls(clock):
+    running = {
+        "dataRowsForGlobalKeysResult": {"jobStatus": "RUNNING", "data": None}
+    }
+    complete = {
+        "dataRowsForGlobalKeysResult": {
+            "jobStatus": "COMPLETE",
+            "data": {
+                "fetchedDataRows": [{"id": "data-row-id"}],
+                "notFoundGlobalKeys": [],
+                "accessDeniedGlobalKeys": [],
+            },
+        }
+    }
+    client = _global_keys_client(
+        [{"dataRowsForGlobalKeys": {"jobId": "job"}}, running, complete]
+    )
+
+    res = client.get_data_row_ids_for_global_keys(["key"])
+
+    assert res == {
+        "status": "SUCCESS",
+        "results": ["data-row-id"],
+        "errors": [],
+    }
+    assert len(clock.sleeps) == 1
+
+
+def test_clear_global_keys_failed_job(clock):
+    client = _global_keys_client(
+        [
+            {"clearGlobalKeys": {"jobId": "job"}},
+            {"clearGlobalKeysResult": {"jobStatus": "FAILED", "data": None}},
+        ]
+    )
+
+    with pytest.raises(LabelboxError, match="clearGlobalKeys failed"):
+        client.clear_global_keys(["key"])
+
+
+def test_assign_global_keys_times_out(clock):
+    running = {
+        "assignGlobalKeysToDataRowsResult": {
+            "jobStatus": "RUNNING",
+            "data": None,
+        }
+    }
+    client = Client(api_key="api_key")
+    client.execute = MagicMock(
+        side_effect=lambda query, params: (
+            {"assignGlobalKeysToDataRows": {"jobId": "job"}}
+            if "jobId" not in params
+            else running
+        )
+    )
+
+    with pytest.raises(TimeoutError):
+        client.assign_global_keys_to_data_rows(
+            [{"data_row_id": "data-row-id", "global_key": "key"}],
+            timeout_seconds=5,
+        )
+
+
+def _project(client):
+    return Project(
+        client,
+        {
+            "id": "project-id",
+            "name": "project",
+            "createdAt": "2021-06-01T00:00:00.000Z",
+            "updatedAt": "2021-06-01T00:00:00.000Z",
+            "autoAuditNumberOfLabels": 1,
+            "autoAuditPercentage": 100,
+            "dataRowCount": 1,
+            "description": "",
+            "editorTaskType": None,
+            "lastActivityTime": "2021-06-01T00:00:00.000Z",
+            "allowedMediaType": "IMAGE",
+            "setupComplete": "2021-06-01T00:00:00.000Z",
+            "modelSetupComplete": None,
+            "uploadType": "Auto",
+            "isBenchmarkEnabled": False,
+            "isConsensusEnabled": False,
+        },
+    )
+
+
+def _processed(value):
+    return {
+        "queryAllDataRowsHaveBeenProcessed": {
+            "allDataRowsHaveBeenProcessed": value
+        }
+    }
+
+
+def test_wait_until_data_rows_are_processed_polls_chunks(clock):
+    client = MagicMock()
+    polls = []
+
+    def execute(query, params):
+        (ids,) = params.values()
+        polls.append(ids[0])
+        # the first chunk of ids is processed on its second poll
+        return _processed(ids[0] != "id-0" or polls.count("id-0") > 1)
+
+    client.execute.side_effect = execute
+    project = _project(client)
+    data_row_ids = [f"id-{i}" for i in range(150_000)]
+
+    project._wait_until_data_rows_are_processed(
+        data_row_ids, ["key"], sleep_interval=5
+    )
+
+    assert sorted(polls) == ["id-0", "id-0", "id-100000", "key"]
+    assert len(clock.sleeps) == 1
+
+
+def test_wait_until_data_rows_are_processed_times_out(clock):
+    client = MagicMock()
+    client.execute.return_value = _processed(False)
+    project = _project(client)
+
+    with pytest.raises(ProcessingWaitTimeout):
+        project._wait_until_data_rows_are_processed(
+            ["id"], wait_processing_max_seconds=60, sleep_interval=30
+        )
+    assert clock.now == 60
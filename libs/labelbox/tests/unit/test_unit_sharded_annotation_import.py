@@ -0,0 +1,179 @@
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lbox import json_codec
+from lbox.exceptions import NetworkError
+
+from labelbox import ShardedAnnotationImport
+from labelbox.schema.annotation_import import (
+    NDJSON_SPOOL_MAX_SIZE,
+    AnnotationImport,
+    MALPredictionImport,
+)
+from labelbox.schema.enums import AnnotationImportState
+
+
+def _prediction(i, data_row):
+    return {
+        "uuid": f"uuid-{i}",
+        "name": "box",
+        "dataRow": {"globalKey": f"key-{data_row}"},
+        "bbox": {"top": 0, "left": 0, "height": 1, "width": 1},
+    }
+
+
+PREDICTIONS = [_prediction(i, i % 7) for i in range(30)]
+
+
+def _data_rows(ndjson):
+    return [json_codec.loads(line)["dataRow"]["globalKey"] for line in ndjson]
+
+
+def test_shards_keep_data_rows_together():
+    shards = AnnotationImport._get_ndjson_shards_from_objects(
+        iter(PREDICTIONS), "annotations", 3
+    )
+
+    data_rows = []
+    for data, size in shards:
+        with data:
+            content = data.read()
+        assert len(content) == size
+        data_rows.append(set(_data_rows(content.split(b"\n"))))
+    assert 1 < len(shards) <= 3
+    assert sum(map(len, data_rows)) == 7
+    assert set.union(*data_rows) == {f"key-{i}" for i in range(7)}
+
+
+def test_create_sharded_from_objects():
+    created = {}
+
+    def create(client, project_id, name, data, size):
+        created[name] = data.read()
+        assert len(created[name]) == size
+        return MagicMock(name=name)
+
+    with patch.object(
+        MALPredictionImport,
+        "_create_mal_import_from_bytes",
+        side_effect=create,
+    ):
+        sharded_import = MALPredictionImport.create_sharded_from_objects(
+            MagicMock(), "project-id", "import", PREDICTIONS, shard_count=3
+        )
+
+    assert len(sharded_import.imports) == len(created)
+    assert sorted(created) == [f"import-{i}" for i in range(len(created))]
+    lines = [
+        line for content in created.values() for line in content.split(b"\n")
+    ]
+    assert sorted(map(json_codec.loads, lines), key=lambda p: p["uuid"]) == (
+        sorted(PREDICTIONS, key=lambda p: p["uuid"])
+    )
+
+
+def test_create_sharded_from_objects_validates_all_objects():
+    invalid = PREDICTIONS + [{"uuid": "no-data-row"}]
+
+    with patch.object(
+        MALPredictionImport, "_create_mal_import_from_bytes"
+    ) as create:
+        with pytest.raises(ValueError, match="'dataRow' is missing"):
+            MALPredictionImport.create_sharded_from_objects(
+                MagicMock(), "project-id", "import", invalid
+            )
+    create.assert_not_called()
+
+
+def test_create_sharded_from_objects_keeps_created_imports_on_failure():
+    error = NetworkError(Exception("connection reset"))
+
+    def create(client, project_id, name, data, size):
+        if name == "import-1":
+            raise error
+        return MagicMock(name=name)
+
+    with patch.object(
+        MALPredictionImport,
+        "_create_mal_import_from_bytes",
+        side_effect=create,
+    ) as create_import:
+        sharded_import = MALPredictionImport.create_sharded_from_objects(
+            MagicMock(), "project-id", "import", PREDICTIONS, shard_count=3
+        )
+
+    assert create_import.call_count == 3
+    assert len(sharded_import.imports) == 2
+    assert sharded_import.failures == {"import-1": error}
+    assert sharded_import.state == AnnotationImportState.FAILED
+
+
+def test_create_sharded_from_objects_raises_if_no_import_is_created():
+    with patch.object(
+        MALPredictionImport,
+        "_create_mal_import_from_bytes",
+        side_effect=NetworkError(Exception("connection reset")),
+    ):
+        with pytest.raises(NetworkError):
+            MALPredictionImport.create_sharded_from_objects(
+                MagicMock(), "project-id", "import", PREDICTIONS, shard_count=3
+            )
+
+
+def test_shards_share_the_spool_size():
+    with patch(
+        "labelbox.schema.annotation_import.tempfile.SpooledTemporaryFile",
+        wraps=tempfile.SpooledTemporaryFile,
+    ) as spooled_file:
+        shards = AnnotationImport._get_ndjson_shards_from_objects(
+            iter(PREDICTIONS), "annotations", 4
+        )
+    for data, _ in shards:
+        data.close()
+
+    assert {c.kwargs["max_size"] for c in spooled_file.call_args_list} == {
+        NDJSON_SPOOL_MAX_SIZE // 4
+    }
+
+
+def _import(state, statuses, errors=()):
+    annotation_import = MagicMock()
+    annotation_import.state = state
+    annotation_import._is_done.return_value = True
+    annotation_import.statuses = statuses
+    annotation_import.errors = list(errors)
+    return annotation_import
+
+
+def test_sharded_import_merges_results():
+    error = {"uuid": "uuid-2", "status": "FAILURE"}
+    sharded_import = ShardedAnnotationImport(
+        [
+            _import(
+                AnnotationImportState.FINISHED,
+                [{"uuid": "uuid-1", "status": "SUCCESS"}],
+            ),
+            _import(AnnotationImportState.FINISHED, [error], [error]),
+        ]
+    )
+
+    assert sharded_import.wait_until_done()
+    assert sharded_import.state == AnnotationImportState.FINISHED
+    assert [s["uuid"] for s in sharded_import.statuses] == ["uuid-1", "uuid-2"]
+    assert sharded_import.errors == [error]
+
+
+def test_sharded_import_state():
+    finished = _import(AnnotationImportState.FINISHED, [])
+    running = _import(AnnotationImportState.RUNNING, [])
+    failed = _import(AnnotationImportState.FAILED, [])
+
+    assert (
+        ShardedAnnotationImport([finished, running]).state
+        == AnnotationImportState.RUNNING
+    )
+    assert (
+        ShardedAnnotationImport([running, failed]).state
+        == AnnotationImportState.FAILED
+    )
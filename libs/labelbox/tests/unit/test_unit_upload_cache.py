@@ -0,0 +1,124 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from labelbox import Client, UploadCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = UploadCache(str(tmp_path / "cache" / "uploads.db"))
+    yield cache
+    cache.close()
+
+
+def _file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_reuses_uploads_of_identical_content(tmp_path, cache):
+    upload = MagicMock(return_value="https://storage/a")
+    first = _file(tmp_path, "a.jpg", b"content")
+    copy = _file(tmp_path, "copy.jpg", b"content")
+
+    assert cache.get_or_upload("ns", first, upload) == "https://storage/a"
+    assert cache.get_or_upload("ns", first, upload) == "https://storage/a"
+    assert cache.get_or_upload("ns", copy, upload) == "https://storage/a"
+    upload.assert_called_once()
+
+
+def test_uploads_changed_files_again(tmp_path, cache):
+    path = _file(tmp_path, "a.jpg", b"content")
+    cache.get_or_upload("ns", path, lambda: "https://storage/1")
+
+    with open(path, "wb") as f:
+        f.write(b"changed content")
+
+    assert (
+        cache.get_or_upload("ns", path, lambda: "https://storage/2")
+        == "https://storage/2"
+    )
+
+
+def test_does_not_read_unchanged_files_again(tmp_path, cache):
+    path = _file(tmp_path, "a.jpg", b"content")
+    cache.get_or_upload("ns", path, lambda: "https://storage/a")
+
+    with patch("builtins.open") as open_file:
+        url = cache.get_or_upload("ns", path, lambda: "https://storage/b")
+
+    assert url == "https://storage/a"
+    open_file.assert_not_called()
+
+
+def test_namespaces_are_separate(tmp_path, cache):
+    path = _file(tmp_path, "a.jpg", b"content")
+    cache.get_or_upload("ns1", path, lambda: "https://storage/1")
+
+    assert (
+        cache.get_or_upload("ns2", path, lambda: "https://storage/2")
+        == "https://storage/2"
+    )
+
+
+def test_persists_between_instances(tmp_path):
+    db = str(tmp_path / "uploads.db")
+    path = _file(tmp_path, "a.jpg", b"content")
+    UploadCache(db).get_or_upload("ns", path, lambda: "https://storage/a")
+
+    upload = MagicMock()
+    assert UploadCache(db).get_or_upload("ns", path, upload) == (
+        "https://storage/a"
+    )
+    upload.assert_not_called()
+
+
+def test_expired_entries_are_not_reused(tmp_path):
+    cache = UploadCache(str(tmp_path / "uploads.db"), ttl_seconds=60)
+    path = _file(tmp_path, "a.jpg", b"content")
+    cache.get_or_upload("ns", path, lambda: "https://storage/1")
+
+    with patch(
+        "labelbox.upload_cache.time.time", return_value=time.time() + 61
+    ):
+        url = cache.get_or_upload("ns", path, lambda: "https://storage/2")
+
+    assert url == "https://storage/2"
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    db = str(tmp_path / "uploads.db")
+    cache = UploadCache(db, max_entries=2)
+    paths = [_file(tmp_path, f"{i}.jpg", bytes([i])) for i in range(3)]
+    for i, path in enumerate(paths):
+        cache.get_or_upload("ns", path, lambda: f"https://storage/{i}")
+        time.sleep(0.01)
+    cache.close()
+
+    # eviction runs when the cache is opened
+    cache = UploadCache(db, max_entries=2)
+    upload = MagicMock(return_value="https://storage/new")
+    assert cache.get_or_upload("ns", paths[2], upload) == "https://storage/2"
+    assert cache.get_or_upload("ns", paths[0], upload) == "https://storage/new"
+    upload.assert_called_once()
+
+
+def test_client_upload_file_uses_cache(tmp_path, cache):
+    client = Client(api_key="api_key", upload_cache=cache)
+    path = _file(tmp_path, "a.jpg", b"content")
+
+    with patch.object(
+        client, "upload_stream", return_value="https://storage/a"
+    ) as upload_stream:
+        assert client.upload_file(path) == "https://storage/a"
+        assert client.upload_file(path) == "https://storage/a"
+
+    upload_stream.assert_called_once()
+    other_account = Client(api_key="other_key", upload_cache=cache)
+    with patch.object(
+        other_account, "upload_stream", return_value="https://storage/b"
+    ):
+        assert other_account.upload_file(path) == "https://storage/b"
@@ -0,0 +1,189 @@
+# for the Labelbox Python SDK
+"""An asyncio request client built on `httpx`.
+
+`httpx` is an optional dependency, install it with
+`pip install "lbox-clients[async]"`.
+"""
+
+import logging
+from typing import Any, AsyncIterable, Callable, Dict, Optional, Union
+
+import requests
+from google.api_core import retry_async
+from urllib3.util import Retry
+
+from lbox import exceptions  # type: ignore
+from lbox.request_client import RequestClient, TransportSettings  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+def _retries(settings: TransportSettings) -> int:
+    max_retries = settings.max_retries
+    if isinstance(max_retries, Retry):
+        # httpx only retries failed connections, which a number describes
+        return max_retries.connect or max_retries.total or 0
+    return max_retries
+
+
+def _to_requests_response(response: "httpx.Response") -> requests.Response:
+    """Wraps an `httpx` response so that the response handling and error
+    handlers written for `requests` can be shared."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = requests.structures.CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted._content = response.content
+    return converted
+
+
+class AsyncRequestClient:
+    """Executes requests of a `RequestClient` on an asyncio event loop.
+
+    Authentication, endpoints, request encoding and error handling are the
+    ones of the wrapped `RequestClient`. A single pool of connections, sized
+    by its `TransportSettings`, is shared by all the requests in flight.
+    """
+
+    def __init__(self, request_client: RequestClient):
+        """Creates an AsyncRequestClient.
+
+        Args:
+            request_client (RequestClient): The client whose credentials and
+                settings are used.
+        Raises:
+            ImportError: If `httpx` is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                "The async client requires httpx, install it with "
+                '`pip install "lbox-clients[async]"`'
+            )
+        self.request_client = request_client
+        self._connection = self._init_connection()
+
+    def _init_connection(self) -> "httpx.AsyncClient":
+        settings = self.request_client.transport_settings
+        limits = httpx.Limits(
+            max_connections=settings.pool_maxsize,
+            max_keepalive_connections=settings.pool_maxsize
+            if settings.keep_alive
+            else 0,
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=_retries(settings))
+        # headers are sent per request, downloads of signed urls must not
+        # receive the API key
+        return httpx.AsyncClient(transport=transport)
+
+    @property
+    def connection(self) -> "httpx.AsyncClient":
+        return self._connection
+
+    async def aclose(self) -> None:
+        """Closes all the connections of the client."""
+        await self._connection.aclose()
+
+    async def __aenter__(self) -> "AsyncRequestClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> requests.Response:
+        """Sends a request and returns the response as a `requests.Response`.
+
+        Raises:
+            exceptions.TimeoutError: If response was not received
+                in `timeout` seconds.
+            exceptions.NetworkError: If an unknown error occurred
+                most likely due to connection issues.
+        """
+        try:
+            response = await self._connection.request(
+                method,
+                url,
+                headers=headers,
+                content=content,
+                data=data,
+                files=files,
+                timeout=timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise exceptions.TimeoutError(str(e))
+        except httpx.HTTPError as e:
+            logger.error("Unknown error: %s", str(e))
+            raise exceptions.NetworkError(e)
+        return _to_requests_response(response)
+
+    @retry_async.AsyncRetry(
+        predicate=retry_async.if_exception_type(
+            exceptions.InternalServerError,
+            exceptions.TimeoutError,
+        )
+    )
+    async def execute(
+        self,
+        query=None,
+        params=None,
+        data=None,
+        files=None,
+        timeout=60.0,
+        experimental=False,
+        error_log_key="message",
+        raise_return_resource_not_found=False,
+        error_handlers: Optional[
+            Dict[str, Callable[[requests.models.Response], None]]
+        ] = None,
+    ):
+        """Sends a request to the server for the execution of the
+        given query.
+
+        Arguments, return value and errors are the ones of
+        `RequestClient.execute`.
+        """
+        logger.debug("Query: %s, params: %r, data %r", query, params, data)
+
+        data = self.request_client._encode_query(query, params, data)
+        endpoint = self.request_client._get_endpoint(experimental)
+
+        try:
+            headers = self.request_client._get_request_headers(files)
+            response = await self.send(
+                "POST",
+                endpoint,
+                headers=dict(headers),
+                content=data if not files else None,
+                data=data if files else None,
+                files=files if files else None,
+                timeout=timeout,
+            )
+            logger.debug("Response: %s", response.text)
+        except (exceptions.TimeoutError, exceptions.NetworkError):
+            raise
+        except Exception as e:
+            raise exceptions.LabelboxError(
+                "Unknown error during Client.query(): " + str(e), e
+            )
+
+        return self.request_client._parse_response(
+            response,
+            error_log_key=error_log_key,
+            raise_return_resource_not_found=raise_return_resource_not_found,
+            error_handlers=error_handlers,
+        )
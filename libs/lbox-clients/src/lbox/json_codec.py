@@ -0,0 +1,158 @@
+# for the Labelbox Python SDK
+"""JSON encoding and decoding shared by the whole SDK.
+
+`orjson` is used when it is installed and the standard library `json` module
+otherwise. Both backends produce the same output: compact JSON (no whitespace
+between tokens) with non-ASCII characters written as UTF-8 rather than
+escaped. Enums are encoded as their value and UUIDs as strings, subclasses of
+builtin types as their base type, and dates and dataclasses are passed to
+`default` by both backends. Values that `orjson` cannot handle (e.g. integers
+wider than 64 bits or `NaN` literals in the input) are transparently handled
+by `json`. The remaining differences are that `orjson` encodes `NaN` and
+`Infinity` as `null` and accepts dictionary keys that `json` rejects, such
+as enums and UUIDs.
+
+The backend can be forced with the `LABELBOX_JSON_BACKEND` environment
+variable (`"orjson"` or `"json"`) or with `set_backend`.
+"""
+
+import json
+import os
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is an optional dependency
+    orjson = None  # type: ignore[assignment]
+
+_LABELBOX_JSON_BACKEND = "LABELBOX_JSON_BACKEND"
+
+ORJSON = "orjson"
+STDLIB = "json"
+
+_SEPARATORS = (",", ":")
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _default_backend() -> str:
+    requested = os.environ.get(_LABELBOX_JSON_BACKEND)
+    if requested is not None:
+        return _validate_backend(requested)
+    return ORJSON if orjson is not None else STDLIB
+
+
+def _validate_backend(name: str) -> str:
+    if name not in (ORJSON, STDLIB):
+        raise ValueError(
+            f"Unknown JSON backend '{name}', expected '{ORJSON}' or '{STDLIB}'"
+        )
+    if name == ORJSON and orjson is None:
+        raise ValueError("The orjson backend requires `pip install orjson`")
+    return name
+
+
+_backend = _default_backend()
+
+
+def backend() -> str:
+    """Returns the name of the backend currently in use."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Selects the backend used by the SDK, either "orjson" or "json"."""
+    global _backend
+    _backend = _validate_backend(name)
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serializes `obj` to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize.
+        default: Called for objects that cannot otherwise be serialized and
+            should return a serializable version of them.
+    """
+    default = _with_builtin_defaults(default)
+    if _backend == ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, default).encode("utf-8")
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serializes `obj` to a JSON string. See `dumps_bytes`."""
+    default = _with_builtin_defaults(default)
+    if _backend == ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode(
+                "utf-8"
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, default)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Deserializes a JSON document given as text or UTF-8 encoded bytes.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON.
+    """
+    if _backend == ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, default: Optional[Callable[[Any], Any]]) -> str:
+    return json.dumps(obj, default=default, separators=_SEPARATORS, ensure_ascii=False)
+
+
+def _with_builtin_defaults(
+    default: Optional[Callable[[Any], Any]],
+) -> Callable[[Any], Any]:
+    """Wraps `default` so that both backends encode the types below alike.
+
+    `orjson` encodes enums and UUIDs natively while `json` passes them to
+    `default`, and `json` encodes subclasses of builtin types natively while
+    `orjson` passes them to `default` (`OPT_PASSTHROUGH_SUBCLASS`).
+    """
+
+    def encode(obj: Any) -> Any:
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, str):
+            return str.__str__(obj)
+        if isinstance(obj, int):
+            return int.__int__(obj)
+        if isinstance(obj, float):
+            return float.__float__(obj)
+        if isinstance(obj, dict):
+            return dict(obj)
+        if isinstance(obj, (list, tuple)):
+            return list(obj)
+        if default is None:
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+        return default(obj)
+
+    return encode
@@ -1,18 +1,20 @@
 # for the Labelbox Python SDK
-import inspect
-import json
+import functools
 import logging
 import os
 import re
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from types import MappingProxyType
-from typing import Callable, Dict, Optional, TypedDict
+from typing import Callable, Dict, Optional, Tuple, TypedDict, Union
 
 import requests
 import requests.exceptions
 from google.api_core import retry
-from lbox import exceptions  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lbox import exceptions, json_codec  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,16 @@ class _RequestInfo(TypedDict):
     method_name: str
 
 
+@functools.lru_cache(maxsize=4096)
+def _code_location(filename: str) -> Tuple[bool, bool]:
+    """Returns whether `filename` is part of labelbox and whether it is a
+    test. Cached by file name so that code objects are not kept alive."""
+    return (
+        LABELBOX_CALL_PATTERN.search(filename) is not None,
+        TEST_FILE_PATTERN.search(filename) is not None,
+    )
+
+
 def call_info():
     method_name = "Unknown"
     prefix = ""
@@ -43,17 +55,21 @@ def call_info():
     skip_classes = ["PaginatedCollection", "_CursorPagination", "_OffsetPagination"]
 
     try:
-        call_info = None
-        for stack in reversed(inspect.stack()):
-            if LABELBOX_CALL_PATTERN.search(stack.filename):
-                call_info = stack
-                method_name = call_info.function
-                class_name = call_info.frame.f_locals.get(
-                    "self", None
-                ).__class__.__name__
+        # walk the raw frames instead of inspect.stack(), which reads the
+        # source context of every frame and is expensive on every request
+        frames = []
+        frame = sys._getframe(1)
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        for frame in reversed(frames):
+            is_labelbox, is_test = _code_location(frame.f_code.co_filename)
+            if is_labelbox:
+                method_name = frame.f_code.co_name
+                class_name = frame.f_locals.get("self", None).__class__.__name__
 
                 if method_name not in skip_methods and class_name not in skip_classes:
-                    if TEST_FILE_PATTERN.search(call_info.filename):
+                    if is_test:
                         prefix = "test:"
                     else:
                         if class_name == "NoneType":
@@ -70,6 +86,39 @@ def call_info_as_str():
     return f"{info['prefix']}{info['class_name']}:{info['method_name']}"
 
 
+@dataclass
+class TransportSettings:
+    """HTTP connection settings applied to every session created by a client.
+
+    Attributes:
+        pool_connections: The number of hosts to keep a connection pool for.
+        pool_maxsize: The maximum number of connections kept open per host.
+            It should be at least the number of threads sending requests
+            concurrently, otherwise extra connections are opened and discarded.
+        max_retries: Retries for failed connections, either a number of
+            attempts or a `urllib3.util.Retry` instance.
+        keep_alive: Whether connections are reused between requests.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 20
+    max_retries: Union[int, Retry] = 0
+    keep_alive: bool = True
+
+    def create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+
 class RequestClient:
     """A Labelbox request client.
 
@@ -85,6 +134,8 @@ class RequestClient:
         enable_experimental=False,
         app_url="https://app.labelbox.com",
         rest_endpoint="https://api.labelbox.com/api/v1",
+        enable_sdk_method_header=True,
+        transport_settings: Optional[TransportSettings] = None,
     ):
         """Creates and initializes a RequestClient.
         This class executes graphql and rest requests to the Labelbox server.
@@ -94,6 +145,11 @@ class RequestClient:
             endpoint (str): URL of the Labelbox server to connect to.
             enable_experimental (bool): Indicates whether or not to use experimental features
             app_url (str) : host url for all links to the web app
+            enable_sdk_method_header (bool): Indicates whether or not to attribute each request to the
+                calling SDK method in the X-SDK-Method header. Disable it to skip the per-request
+                stack inspection.
+            transport_settings (TransportSettings): Connection pooling, retry and keep-alive settings
+                of the HTTP sessions. Defaults to `TransportSettings()`.
         Raises:
             exceptions.AuthenticationError: If no `api_key`
                 is provided as an argument or via the environment
@@ -114,10 +170,14 @@ class RequestClient:
         self.endpoint = endpoint
         self.rest_endpoint = rest_endpoint
         self.sdk_version = sdk_version
+        self.enable_sdk_method_header = enable_sdk_method_header
+        self.transport_settings = transport_settings or TransportSettings()
         self._connection: requests.Session = self._init_connection()
+        # signed urls (e.g. export files) must not receive the API key
+        self._download_connection = self.transport_settings.create_session()
 
     def _init_connection(self) -> requests.Session:
-        connection = requests.Session()  # using default connection pool size of 10
+        connection = self.transport_settings.create_session()
         connection.headers.update(self._default_headers())
 
         return connection
@@ -126,6 +186,11 @@ class RequestClient:
     def headers(self) -> MappingProxyType:
         return self._connection.headers
 
+    @property
+    def download_connection(self) -> requests.Session:
+        """A session without Labelbox credentials for downloading files."""
+        return self._download_connection
+
     def _default_headers(self):
         return {
             "Authorization": "Bearer %s" % self.api_key,
@@ -154,6 +219,7 @@ class RequestClient:
         error_handlers: Optional[
             Dict[str, Callable[[requests.models.Response], None]]
         ] = None,
+        content_type: Optional[str] = None,
     ):
         """Sends a request to the server for the execution of the
         given query.
@@ -174,6 +240,8 @@ class RequestClient:
                 We recommend to use it only of api returns a clear and well-formed error when a resource not found for a given query.
             error_handlers (dict): A dictionary mapping graphql error code to handler functions.
                 Allows a caller to handle specific errors reporting in a custom way or produce more user-friendly readable messages.
+            content_type (str): Content type of `data`, when it is not a JSON
+                query, e.g. a multipart body streamed from an iterable.
 
         Example - custom error handler:
             >>>     def _raise_readable_errors(self, response):
@@ -209,32 +277,11 @@ class RequestClient:
         """
         logger.debug("Query: %s, params: %r, data %r", query, params, data)
 
-        # Convert datetimes to UTC strings.
-        def convert_value(value):
-            if isinstance(value, datetime):
-                value = value.astimezone(timezone.utc)
-                value = value.strftime("%Y-%m-%dT%H:%M:%SZ")
-            return value
-
-        if query is not None:
-            if params is not None:
-                params = {key: convert_value(value) for key, value in params.items()}
-            data = json.dumps({"query": query, "variables": params}).encode("utf-8")
-        elif data is None:
-            raise ValueError("query and data cannot both be none")
-
-        endpoint = (
-            self.endpoint
-            if not experimental
-            else self.endpoint.replace("/graphql", "/_gql")
-        )
+        data = self._encode_query(query, params, data)
+        endpoint = self._get_endpoint(experimental)
 
         try:
-            headers = self._connection.headers.copy()
-            if files:
-                del headers["Content-Type"]
-                del headers["Accept"]
-            headers["X-SDK-Method"] = call_info_as_str()
+            headers = self._get_request_headers(files, content_type)
 
             request = requests.Request(
                 "POST",
@@ -261,13 +308,71 @@ class RequestClient:
                 "Unknown error during Client.query(): " + str(e), e
             )
 
+        return self._parse_response(
+            response,
+            error_log_key=error_log_key,
+            raise_return_resource_not_found=raise_return_resource_not_found,
+            error_handlers=error_handlers,
+        )
+
+    @staticmethod
+    def _encode_query(query, params, data) -> bytes:
+        """Encodes a query and its parameters into the request body."""
+
+        # Convert datetimes to UTC strings.
+        def convert_value(value):
+            if isinstance(value, datetime):
+                value = value.astimezone(timezone.utc)
+                value = value.strftime("%Y-%m-%dT%H:%M:%SZ")
+            return value
+
+        if query is not None:
+            if params is not None:
+                params = {key: convert_value(value) for key, value in params.items()}
+            data = json_codec.dumps_bytes({"query": query, "variables": params})
+        elif data is None:
+            raise ValueError("query and data cannot both be none")
+        return data
+
+    def _get_endpoint(self, experimental: bool) -> str:
+        return (
+            self.endpoint
+            if not experimental
+            else self.endpoint.replace("/graphql", "/_gql")
+        )
+
+    def _get_request_headers(self, files, content_type=None) -> Dict[str, str]:
+        headers = self._connection.headers.copy()
+        if files:
+            del headers["Content-Type"]
+            del headers["Accept"]
+        elif content_type is not None:
+            headers["Content-Type"] = content_type
+            del headers["Accept"]
+        if self.enable_sdk_method_header:
+            headers["X-SDK-Method"] = call_info_as_str()
+        return headers
+
+    def _parse_response(
+        self,
+        response: requests.Response,
+        error_log_key="message",
+        raise_return_resource_not_found=False,
+        error_handlers: Optional[
+            Dict[str, Callable[[requests.models.Response], None]]
+        ] = None,
+    ):
+        """Checks a server response for errors and returns its data.
+
+        See `execute` for the errors raised.
+        """
         if (
             200 <= response.status_code < 300
             or response.status_code < 500
             or response.status_code >= 600
         ):
             try:
-                r_json = response.json()
+                r_json = json_codec.loads(response.content)
             except Exception:
                 raise exceptions.LabelboxError(
                     "Failed to parse response as JSON: %s" % response.text
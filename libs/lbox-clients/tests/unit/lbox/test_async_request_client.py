@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+import pytest
+
+from lbox import exceptions
+from lbox.async_request_client import AsyncRequestClient
+from lbox.request_client import RequestClient, TransportSettings
+
+# httpx is only installed with the "async" extra of lbox-clients
+httpx = pytest.importorskip("httpx")
+
+
+def _async_client(handler, **kwargs):
+    request_client = RequestClient(
+        sdk_version="foo",
+        api_key="api_key",
+        endpoint="http://localhost:8080/graphql",
+        **kwargs,
+    )
+    client = AsyncRequestClient(request_client)
+    client._connection = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_execute():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": {"user": {"id": "1"}}})
+
+    client = _async_client(handler)
+    result = asyncio.run(client.execute("query { user { id } }", {"a": 1}))
+
+    assert result == {"user": {"id": "1"}}
+    request = requests[0]
+    assert request.headers["Authorization"] == "Bearer api_key"
+    assert request.headers["X-SDK-Method"]
+    assert json.loads(request.content) == {
+        "query": "query { user { id } }",
+        "variables": {"a": 1},
+    }
+
+
+def test_execute_experimental_endpoint():
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json={"data": {}})
+
+    asyncio.run(_async_client(handler).execute("query {}", experimental=True))
+
+    assert urls == ["http://localhost:8080/_gql"]
+
+
+def test_execute_maps_errors():
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "errors": [
+                    {
+                        "message": "Invalid API key",
+                        "extensions": {"code": "AUTHENTICATION_ERROR"},
+                    }
+                ]
+            },
+        )
+
+    with pytest.raises(exceptions.AuthenticationError):
+        asyncio.run(_async_client(handler).execute("query {}"))
+
+
+def test_execute_custom_error_handling():
+    handled = []
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "errors": [
+                    {
+                        "message": "Internal server error",
+                        "extensions": {"code": "INTERNAL_SERVER_ERROR"},
+                    }
+                ]
+            },
+        )
+
+    result = asyncio.run(
+        _async_client(handler).execute(
+            "query {}",
+            error_handlers={"INTERNAL_SERVER_ERROR": handled.append},
+        )
+    )
+
+    assert result is None
+    assert handled[0].json()["errors"][0]["message"] == "Internal server error"
+
+
+def test_execute_timeout():
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = _async_client(handler)
+    with pytest.raises(exceptions.TimeoutError):
+        # bypass the retries of execute
+        asyncio.run(client.send("POST", client.request_client.endpoint, content=b"{}"))
+
+
+def test_concurrent_requests():
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"data": body["variables"]})
+
+    async def run():
+        client = _async_client(handler)
+        async with client:
+            return await asyncio.gather(
+                *[client.execute("query {}", {"n": n}) for n in range(50)]
+            )
+
+    assert asyncio.run(run()) == [{"n": n} for n in range(50)]
+
+
+def test_transport_settings():
+    request_client = RequestClient(
+        sdk_version="foo",
+        api_key="api_key",
+        transport_settings=TransportSettings(pool_maxsize=500, max_retries=2),
+    )
+    client = AsyncRequestClient(request_client)
+    pool = client.connection._transport._pool
+
+    assert pool._max_connections == 500
+    assert pool._retries == 2
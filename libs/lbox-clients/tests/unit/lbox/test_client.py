@@ -1,6 +1,7 @@
+import json
 from unittest.mock import MagicMock
 
-from lbox.request_client import RequestClient
+from lbox.request_client import RequestClient, TransportSettings, call_info
 
 
 # @patch.dict(os.environ, {'LABELBOX_API_KEY': 'bar'})
@@ -27,7 +28,7 @@ def test_custom_error_handling():
         ],
     }
     response = MagicMock()
-    response.json.return_value = response_dict
+    response.content = json.dumps(response_dict).encode("utf-8")
     response.status_code = 200
 
     client = RequestClient(
@@ -44,3 +45,61 @@ def test_custom_error_handling():
         error_handlers={"INTERNAL_SERVER_ERROR": mock_raise_error},
     )
     mock_raise_error.assert_called_once_with(response)
+
+
+def test_call_info_attributes_outermost_sdk_method():
+    namespace = {"call_info": call_info}
+    sdk_source = """
+class Project:
+    def __init__(self):
+        pass
+
+    def labels(self):
+        return self._fetch()
+
+    def _fetch(self):
+        return call_info()
+"""
+    exec(
+        compile(sdk_source, "/site-packages/labelbox/schema/project.py", "exec"),
+        namespace,
+    )
+
+    info = namespace["Project"]().labels()
+    assert info == {"prefix": "", "class_name": "Project", "method_name": "labels"}
+
+
+def test_sdk_method_header_can_be_disabled():
+    response = MagicMock()
+    response.content = json.dumps({"data": {}}).encode("utf-8")
+    response.status_code = 200
+
+    client = RequestClient(
+        sdk_version="foo",
+        api_key="api_key",
+        endpoint="http://localhost:8080/_gql",
+        enable_sdk_method_header=False,
+    )
+    connection_mock = MagicMock()
+    connection_mock.send.return_value = response
+    client._connection = connection_mock
+
+    client.execute("query_str")
+    prepped = connection_mock.send.call_args[0][0]
+    assert "X-SDK-Method" not in prepped.headers
+
+
+def test_transport_settings_apply_to_all_sessions():
+    client = RequestClient(
+        sdk_version="foo",
+        api_key="api_key",
+        transport_settings=TransportSettings(
+            pool_maxsize=32, max_retries=3, keep_alive=False
+        ),
+    )
+    for session in (client._connection, client.download_connection):
+        adapter = session.get_adapter("https://storage.googleapis.com")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert session.headers["Connection"] == "close"
+    assert "Authorization" not in client.download_connection.headers
@@ -0,0 +1,99 @@
+import datetime
+import enum
+import json
+import uuid
+from collections import namedtuple
+
+import pytest
+
+from lbox import json_codec
+
+
+@pytest.fixture(params=[json_codec.ORJSON, json_codec.STDLIB])
+def backend(request):
+    if request.param == json_codec.ORJSON and json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    previous = json_codec.backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+def test_dumps_is_compact_utf8(backend):
+    obj = {"name": "ちょまど", 1: [1.5, None, True], "nested": {"a": "b"}}
+    assert (
+        json_codec.dumps(obj)
+        == '{"name":"ちょまど","1":[1.5,null,true],"nested":{"a":"b"}}'
+    )
+    assert json_codec.dumps_bytes(obj) == json_codec.dumps(obj).encode("utf-8")
+
+
+def test_dumps_large_int(backend):
+    assert json_codec.dumps({"x": 2**70}) == '{"x":1180591620717411303424}'
+
+
+def test_dumps_uses_default(backend):
+    date = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    with pytest.raises(TypeError):
+        json_codec.dumps({"date": date})
+    assert json_codec.dumps({"date": date}, default=str) == json.dumps(
+        {"date": date}, default=str, separators=(",", ":")
+    )
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Size(str, enum.Enum):
+    SMALL = "small"
+
+
+class Priority(enum.IntEnum):
+    HIGH = 1
+
+
+class Name(str):
+    def __str__(self):
+        return "overridden"
+
+
+Point = namedtuple("Point", ["x", "y"])
+
+PARITY_PAYLOADS = [
+    {"name": "ちょまど", 1: [1.5, None, True], "nested": {"a": "b"}},
+    {"x": 2**70},
+    {"enums": [Color.RED, Size.SMALL, Priority.HIGH]},
+    {"id": uuid.UUID(int=5)},
+    {"name": Name("value"), "point": Point(1, 2)},
+    {Size.SMALL: 1, Priority.HIGH: 2},
+    {"date": datetime.datetime(2024, 1, 2, 3, 4, 5), "tuple": (1, 2)},
+]
+
+
+@pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize("obj", PARITY_PAYLOADS)
+def test_backends_produce_same_bytes(obj):
+    previous = json_codec.backend()
+    outputs = []
+    try:
+        for name in (json_codec.ORJSON, json_codec.STDLIB):
+            json_codec.set_backend(name)
+            outputs.append(json_codec.dumps_bytes(obj, default=repr))
+    finally:
+        json_codec.set_backend(previous)
+    assert outputs[0] == outputs[1]
+
+
+def test_loads(backend):
+    text = '{"a": [1, 2.5, "é", null], "b": {"c": true}}'
+    assert json_codec.loads(text) == json.loads(text)
+    assert json_codec.loads(text.encode("utf-8")) == json.loads(text)
+    assert json_codec.loads("[NaN]")[0] != json_codec.loads("[NaN]")[0]
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("{")
+
+
+def test_set_backend_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_backend("yaml")